@@ -1,15 +1,21 @@
-from fastapi import Request, status
+import math
+
+from fastapi import Request
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 
 from app.core.exceptions import (
     DocumentValidationError,
     InvalidFileTypeError,
+    JobNotFoundError,
     LLMClientError,
     LLMJSONParseError,
     LLMResponseError,
     LLMTimeoutError,
+    LLMUnavailableError,
     PDFExtractionError,
+    ServiceOverloadedError,
+    describe_error,
 )
 from app.core.logging import get_logger
 
@@ -21,13 +27,20 @@ async def llm_timeout_error_handler(request: Request, exc: LLMTimeoutError) -> J
         "LLM timeout in request",
         extra={"data": {"path": request.url.path, "error": str(exc)}},
     )
-    return JSONResponse(
-        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-        content={
-            "error": "Timeout do serviço de processamento",
-            "message": str(exc),
-        },
+    status_code, content = describe_error(exc)
+    return JSONResponse(status_code=status_code, content=content)
+
+
+async def llm_unavailable_error_handler(request: Request, exc: LLMUnavailableError) -> JSONResponse:
+    logger.error(
+        "LLM unavailable in request",
+        extra={"data": {"path": request.url.path, "retry_after_seconds": exc.retry_after_seconds}},
     )
+    status_code, content = describe_error(exc)
+    headers = None
+    if exc.retry_after_seconds is not None:
+        headers = {"Retry-After": str(max(1, math.ceil(exc.retry_after_seconds)))}
+    return JSONResponse(status_code=status_code, content=content, headers=headers)
 
 
 async def llm_client_error_handler(request: Request, exc: LLMClientError) -> JSONResponse:
@@ -35,13 +48,8 @@ async def llm_client_error_handler(request: Request, exc: LLMClientError) -> JSO
         "LLM client error in request",
         extra={"data": {"path": request.url.path, "error": str(exc)}},
     )
-    return JSONResponse(
-        status_code=status.HTTP_502_BAD_GATEWAY,
-        content={
-            "error": "Erro no serviço de processamento",
-            "message": str(exc),
-        },
-    )
+    status_code, content = describe_error(exc)
+    return JSONResponse(status_code=status_code, content=content)
 
 
 async def llm_json_parse_error_handler(request: Request, exc: LLMJSONParseError) -> JSONResponse:
@@ -49,13 +57,8 @@ async def llm_json_parse_error_handler(request: Request, exc: LLMJSONParseError)
         "LLM JSON parse error in request",
         extra={"data": {"path": request.url.path, "error": str(exc)}},
     )
-    return JSONResponse(
-        status_code=status.HTTP_502_BAD_GATEWAY,
-        content={
-            "error": "Erro ao processar resposta do serviço",
-            "message": str(exc),
-        },
-    )
+    status_code, content = describe_error(exc)
+    return JSONResponse(status_code=status_code, content=content)
 
 
 async def llm_response_error_handler(request: Request, exc: LLMResponseError) -> JSONResponse:
@@ -63,13 +66,8 @@ async def llm_response_error_handler(request: Request, exc: LLMResponseError) ->
         "LLM response structure error in request",
         extra={"data": {"path": request.url.path, "error": str(exc)}},
     )
-    return JSONResponse(
-        status_code=status.HTTP_502_BAD_GATEWAY,
-        content={
-            "error": "Erro na estrutura da resposta do serviço",
-            "message": str(exc),
-        },
-    )
+    status_code, content = describe_error(exc)
+    return JSONResponse(status_code=status_code, content=content)
 
 
 async def invalid_file_type_error_handler(
@@ -79,13 +77,8 @@ async def invalid_file_type_error_handler(
         "Invalid file type in request",
         extra={"data": {"path": request.url.path, "error": str(exc)}},
     )
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={
-            "error": "Tipo de arquivo inválido",
-            "message": str(exc),
-        },
-    )
+    status_code, content = describe_error(exc)
+    return JSONResponse(status_code=status_code, content=content)
 
 
 async def pdf_extraction_error_handler(request: Request, exc: PDFExtractionError) -> JSONResponse:
@@ -93,13 +86,8 @@ async def pdf_extraction_error_handler(request: Request, exc: PDFExtractionError
         "PDF extraction error in request",
         extra={"data": {"path": request.url.path, "error": str(exc)}},
     )
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={
-            "error": "Falha na extração do PDF",
-            "message": str(exc),
-        },
-    )
+    status_code, content = describe_error(exc)
+    return JSONResponse(status_code=status_code, content=content)
 
 
 async def validation_error_handler(request: Request, exc: ValidationError) -> JSONResponse:
@@ -112,13 +100,8 @@ async def validation_error_handler(request: Request, exc: ValidationError) -> JS
             },
         },
     )
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={
-            "error": "Erro de validação",
-            "message": "Dados inválidos recebidos. Por favor, verifique os documentos enviados e tente novamente.",
-        },
-    )
+    status_code, content = describe_error(exc)
+    return JSONResponse(status_code=status_code, content=content)
 
 
 async def document_validation_error_handler(
@@ -128,13 +111,8 @@ async def document_validation_error_handler(
         "Document validation error in request",
         extra={"data": {"path": request.url.path, "error": str(exc)}},
     )
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={
-            "error": "Erro na validação do documento",
-            "message": str(exc),
-        },
-    )
+    status_code, content = describe_error(exc)
+    return JSONResponse(status_code=status_code, content=content)
 
 
 async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
@@ -142,11 +120,27 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
         "Unexpected error in request",
         extra={"data": {"path": request.url.path, "error_type": type(exc).__name__, "error": str(exc)}},
     )
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": "Erro interno do servidor",
-            "message": "Ocorreu um erro inesperado. Tente novamente mais tarde.",
-        },
+    status_code, content = describe_error(exc)
+    return JSONResponse(status_code=status_code, content=content)
+
+
+async def job_not_found_error_handler(request: Request, exc: JobNotFoundError) -> JSONResponse:
+    logger.warning(
+        "Validation job not found",
+        extra={"data": {"path": request.url.path, "error": str(exc)}},
     )
+    status_code, content = describe_error(exc)
+    return JSONResponse(status_code=status_code, content=content)
 
+
+async def service_overloaded_error_handler(request: Request, exc: ServiceOverloadedError) -> JSONResponse:
+    logger.warning(
+        "Request rejected by admission control",
+        extra={"data": {"path": request.url.path, "retry_after_seconds": exc.retry_after_seconds}},
+    )
+    status_code, content = describe_error(exc)
+    return JSONResponse(
+        status_code=status_code,
+        content=content,
+        headers={"Retry-After": str(exc.retry_after_seconds)},
+    )
@@ -0,0 +1,29 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.tracing import normalize_request_id, span, start_trace
+
+REQUEST_ID_HEADER = 'X-Request-ID'
+
+
+class RequestTracingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        request_id = normalize_request_id(Headers(scope=scope).get(REQUEST_ID_HEADER))
+        with start_trace(request_id), span(
+            'http.request', method=scope['method'], path=scope['path']
+        ) as request_span:
+
+            async def send_with_request_id(message: Message) -> None:
+                if message['type'] == 'http.response.start':
+                    MutableHeaders(scope=message).append(REQUEST_ID_HEADER, request_id)
+                    request_span.set_attribute('status_code', message['status'])
+                await send(message)
+
+            await self.app(scope, receive, send_with_request_id)
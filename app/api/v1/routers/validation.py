@@ -1,10 +1,30 @@
-from fastapi import APIRouter, UploadFile, File
+import json
+from typing import Any, AsyncIterator, Dict, Optional
 
-from app.api.v1.schemas import ValidationResultResponse
-from app.services.validation_use_case import validate_supplier_documents_use_case
+from fastapi import APIRouter, UploadFile, File, Query
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+from app.api.v1.schemas import EvaluationPolicy, ValidationResultResponse
+from app.core.exceptions import describe_error
+from app.core.logging import get_logger
+from app.services.admission import validation_admission
+from app.services.validation_use_case import (
+    buffer_upload,
+    stream_supplier_documents_validation,
+    validate_supplier_documents_coalesced,
+)
+
+logger = get_logger(__name__)
 
 router = APIRouter(prefix='', tags=['validation'])
 
+POLICY_QUERY = Query(
+    None,
+    description="Política de avaliação: 'exhaustive' executa todas as verificações; "
+    "'fail-fast' pula as verificações com LLM assim que uma inconsistência crítica é encontrada",
+)
+
 @router.post(
     '/validate-docs',
     response_model=ValidationResultResponse,
@@ -14,9 +34,51 @@ async def validate_documents(
     articles_of_association: UploadFile = File(...),
     cnpj_card: UploadFile = File(...),
     tax_clearance_certificate: UploadFile = File(...),
+    policy: Optional[EvaluationPolicy] = POLICY_QUERY,
 ) -> ValidationResultResponse:
-    return await validate_supplier_documents_use_case(
-        articles_of_association_file=articles_of_association,
-        cnpj_card_file=cnpj_card,
-        tax_clearance_certificate_file=tax_clearance_certificate,
-    )
\ No newline at end of file
+    async with validation_admission.slot():
+        return await validate_supplier_documents_coalesced(
+            articles_of_association_file=articles_of_association,
+            cnpj_card_file=cnpj_card,
+            tax_clearance_certificate_file=tax_clearance_certificate,
+            policy=policy,
+        )
+
+
+async def _ndjson_events(arguments: Dict[str, Any]) -> AsyncIterator[str]:
+    try:
+        async for event in stream_supplier_documents_validation(**arguments):
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+    except Exception as exc:
+        status_code, content = describe_error(exc)
+        log = logger.exception if status_code >= 500 else logger.error
+        log(
+            "Streaming validation failed",
+            extra={"data": {"error_type": type(exc).__name__, "error": str(exc)}},
+        )
+        yield json.dumps({"event": "error", "status_code": status_code, **content}, ensure_ascii=False) + "\n"
+
+
+@router.post(
+    '/validate-docs/stream',
+    response_class=StreamingResponse,
+    summary='Valida os documentos emitindo o progresso de cada etapa em NDJSON',
+)
+async def validate_documents_stream(
+    articles_of_association: UploadFile = File(...),
+    cnpj_card: UploadFile = File(...),
+    tax_clearance_certificate: UploadFile = File(...),
+    policy: Optional[EvaluationPolicy] = POLICY_QUERY,
+) -> StreamingResponse:
+    arguments = {
+        'articles_of_association_file': await buffer_upload(articles_of_association),
+        'cnpj_card_file': await buffer_upload(cnpj_card),
+        'tax_clearance_certificate_file': await buffer_upload(tax_clearance_certificate),
+        'policy': policy,
+    }
+    admitted_at = await validation_admission.admit()
+    return StreamingResponse(
+        _ndjson_events(arguments),
+        media_type='application/x-ndjson',
+        background=BackgroundTask(validation_admission.leave, admitted_at),
+    )
@@ -0,0 +1,67 @@
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, File, Query, UploadFile, status
+
+from app.api.v1.schemas import ValidationJobResponse
+from app.core.config import settings
+from app.core.exceptions import JobNotFoundError
+from app.services.job_queue import JobRecord, job_queue
+from app.services.text_extractor import validate_pdf_file
+
+router = APIRouter(prefix='', tags=['validation-jobs'])
+
+
+def _to_response(job: JobRecord) -> ValidationJobResponse:
+    return ValidationJobResponse(
+        job_id=job.id,
+        status=job.status,
+        created_at=datetime.fromtimestamp(job.created_at, tz=timezone.utc),
+        updated_at=datetime.fromtimestamp(job.updated_at, tz=timezone.utc),
+        result=job.result,
+        error=job.error,
+    )
+
+
+@router.post(
+    '/validation-jobs',
+    response_model=ValidationJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary='Agenda a validação de contrato social, cartão CNPJ e certidão negativa',
+)
+async def create_validation_job(
+    articles_of_association: UploadFile = File(...),
+    cnpj_card: UploadFile = File(...),
+    tax_clearance_certificate: UploadFile = File(...),
+) -> ValidationJobResponse:
+    files = {
+        'articles': articles_of_association,
+        'cnpj_card': cnpj_card,
+        'certificate': tax_clearance_certificate,
+    }
+    for file in files.values():
+        validate_pdf_file(file)
+
+    job_id = await job_queue.enqueue(
+        {document: (file.filename, await file.read()) for document, file in files.items()}
+    )
+    return _to_response(await job_queue.get(job_id))
+
+
+@router.get(
+    '/validation-jobs/{job_id}',
+    response_model=ValidationJobResponse,
+    summary='Consulta o status e o resultado de uma validação agendada',
+)
+async def get_validation_job(
+    job_id: str,
+    wait: float = Query(
+        0,
+        ge=0,
+        description='Segundos para aguardar a conclusão do job antes de responder (long polling)',
+    ),
+) -> ValidationJobResponse:
+    timeout = min(wait, settings.job_max_wait_seconds)
+    job = await job_queue.wait_for_completion(job_id, timeout) if timeout else await job_queue.get(job_id)
+    if job is None:
+        raise JobNotFoundError(f"Job de validação '{job_id}' não encontrado.")
+    return _to_response(job)
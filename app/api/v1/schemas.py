@@ -1,9 +1,12 @@
-from typing import Literal, List, Dict, Optional
+from datetime import datetime
+from typing import Any, Literal, List, Dict, Optional
 from pydantic import BaseModel
 
 
-ValidationStatus = Literal['APROVADO', 'REPROVADO']
+ValidationStatus = Literal['APROVADO', 'REPROVADO', 'PENDENTE']
 Severity = Literal['CRITICA', 'AVISO']
+JobStatus = Literal['PENDENTE', 'PROCESSANDO', 'CONCLUIDO', 'ERRO']
+EvaluationPolicy = Literal['exhaustive', 'fail-fast']
 
 
 class Inconsistency(BaseModel):
@@ -15,4 +18,15 @@ class Inconsistency(BaseModel):
 
 class ValidationResultResponse(BaseModel):
     status: ValidationStatus
-    inconsistencies: List[Inconsistency]
\ No newline at end of file
+    inconsistencies: List[Inconsistency]
+    skipped_checks: List[str] = []
+    partial: bool = False
+
+
+class ValidationJobResponse(BaseModel):
+    job_id: str
+    status: JobStatus
+    created_at: datetime
+    updated_at: datetime
+    result: Optional[ValidationResultResponse] = None
+    error: Optional[Dict[str, Any]] = None
@@ -1,15 +1,95 @@
-from typing import Literal
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     log_level: Literal['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'] = 'INFO'
     log_dir: str = 'logs'
+    log_profile: Literal['development', 'production'] = 'development'
+    log_queue_enabled: bool = True
+    log_max_string_length: int = 1000
+    log_max_collection_items: int = 50
+    log_max_depth: int = 6
+    tracing_enabled: bool = True
+    trace_export_path: str = ''
+    trace_service_name: str = 'valida-documentos'
 
     openrouter_api_key: str
     openrouter_base_url: str = 'https://openrouter.ai/api/v1/chat/completions'
     openrouter_model: str = 'google/gemini-2.0-flash-001'
     openrouter_temperature: float = 0.0
     llm_timeout_seconds: int = 30
+    llm_max_connections: int = 20
+    llm_max_keepalive_connections: int = 10
+    llm_keepalive_expiry_seconds: float = 60.0
+    llm_pool_timeout_seconds: float = 10.0
+    llm_http2: bool = False
+    llm_max_concurrent_calls: int = 16
+    llm_extraction_max_concurrent_calls: int = 12
+    llm_business_purpose_max_concurrent_calls: int = 4
+    llm_latency_window: int = 200
+    llm_latency_min_samples: int = 20
+    llm_adaptive_timeout_enabled: bool = True
+    llm_adaptive_timeout_percentile: float = 0.99
+    llm_adaptive_timeout_multiplier: float = 2.0
+    llm_min_timeout_seconds: float = 10.0
+    llm_hedging_enabled: bool = True
+    llm_hedge_percentile: float = 0.95
+    llm_hedge_max_ratio: float = 0.1
+    llm_retry_max_attempts: int = 3
+    llm_retry_base_delay_seconds: float = 0.5
+    llm_retry_max_delay_seconds: float = 10.0
+    llm_rate_limit_per_second: float = 10.0
+    llm_rate_limit_burst: int = 20
+    llm_circuit_breaker_enabled: bool = True
+    llm_circuit_failure_threshold: int = 5
+    llm_circuit_reset_seconds: float = 30.0
+    llm_degraded_mode_enabled: bool = True
+
+    pdf_executor_kind: Literal['process', 'thread'] = 'process'
+    pdf_executor_max_workers: Optional[int] = None
+    pdf_executor_max_tasks_per_child: Optional[int] = None
+    pdf_parse_timeout_seconds: float = 30.0
+
+    validation_policy: Literal['exhaustive', 'fail-fast'] = 'exhaustive'
+    cnpj_triage_enabled: bool = True
+    cnpj_triage_on_mismatch: Literal['fail', 'reject'] = 'fail'
+    single_flight_enabled: bool = True
+    validation_max_concurrent: int = 8
+    validation_max_queue: int = 32
+    validation_default_service_seconds: float = 15.0
+
+    cnpj_card_fast_path_enabled: bool = True
+    tax_clearance_fast_path_enabled: bool = True
+    articles_section_index_enabled: bool = True
+    articles_chunking_threshold_chars: int = 60000
+    articles_chunk_max_chars: int = 30000
+    articles_chunk_overlap_pages: int = 1
+
+    extraction_cache_enabled: bool = True
+    extraction_cache_dir: str = 'cache/extractions'
+    extraction_cache_memory_max_entries: int = 256
+    extraction_cache_disk_max_entries: int = 10000
+    extraction_cache_ttl_seconds: int = 30 * 24 * 60 * 60
+
+    business_purpose_matcher_enabled: bool = True
+    business_purpose_matcher_accept_threshold: float = 0.85
+    business_purpose_matcher_index_cache_size: int = 256
+
+    business_purpose_cache_enabled: bool = True
+    business_purpose_cache_dir: str = 'cache/business_purpose'
+    business_purpose_cache_memory_max_entries: int = 4096
+    business_purpose_cache_disk_max_entries: int = 100000
+    business_purpose_cache_ttl_seconds: int = 90 * 24 * 60 * 60
+
+    job_queue_path: str = 'data/validation_jobs.sqlite3'
+    job_workers_enabled: bool = True
+    job_worker_concurrency: int = 2
+    job_poll_interval_seconds: float = 0.5
+    job_lease_seconds: float = 300.0
+    job_max_attempts: int = 3
+    job_max_wait_seconds: float = 30.0
+    job_retention_seconds: int = 7 * 24 * 60 * 60
+    job_purge_interval_seconds: float = 3600.0
 
     model_config = SettingsConfigDict(
         env_file='.env',
@@ -1,3 +1,9 @@
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import status
+from pydantic import ValidationError
+
+
 class PDFExtractionError(Exception):
     """Raised when PDF text extraction fails."""
     pass
@@ -5,7 +11,16 @@ class PDFExtractionError(Exception):
 
 class LLMClientError(Exception):
     """Raised when an error occurs while interacting with the LLM client."""
-    pass
+
+    def __init__(
+        self,
+        message: str = "",
+        status_code: Optional[int] = None,
+        retry_after_seconds: Optional[float] = None,
+    ) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after_seconds = retry_after_seconds
 
 
 class LLMTimeoutError(LLMClientError):
@@ -23,6 +38,11 @@ class LLMResponseError(LLMClientError):
     pass
 
 
+class LLMUnavailableError(LLMClientError):
+    """Raised when LLM calls are short-circuited because the provider is failing."""
+    pass
+
+
 class DocumentValidationError(Exception):
     """Raised when document validation fails."""
     pass
@@ -30,4 +50,48 @@ class DocumentValidationError(Exception):
 
 class InvalidFileTypeError(Exception):
     """Raised when an invalid file type is uploaded."""
-    pass
\ No newline at end of file
+    pass
+
+
+class JobNotFoundError(Exception):
+    """Raised when a validation job does not exist."""
+    pass
+
+
+class ServiceOverloadedError(Exception):
+    """Raised when the service cannot admit more work at the moment."""
+
+    def __init__(self, message: str, retry_after_seconds: int) -> None:
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
+_ERROR_RESPONSES = (
+    (LLMTimeoutError, status.HTTP_504_GATEWAY_TIMEOUT, "Timeout do serviço de processamento"),
+    (LLMUnavailableError, status.HTTP_503_SERVICE_UNAVAILABLE, "Serviço de processamento indisponível"),
+    (LLMJSONParseError, status.HTTP_502_BAD_GATEWAY, "Erro ao processar resposta do serviço"),
+    (LLMResponseError, status.HTTP_502_BAD_GATEWAY, "Erro na estrutura da resposta do serviço"),
+    (LLMClientError, status.HTTP_502_BAD_GATEWAY, "Erro no serviço de processamento"),
+    (InvalidFileTypeError, status.HTTP_422_UNPROCESSABLE_ENTITY, "Tipo de arquivo inválido"),
+    (PDFExtractionError, status.HTTP_422_UNPROCESSABLE_ENTITY, "Falha na extração do PDF"),
+    (DocumentValidationError, status.HTTP_422_UNPROCESSABLE_ENTITY, "Erro na validação do documento"),
+    (JobNotFoundError, status.HTTP_404_NOT_FOUND, "Job não encontrado"),
+    (ServiceOverloadedError, status.HTTP_503_SERVICE_UNAVAILABLE, "Serviço sobrecarregado"),
+)
+
+
+def describe_error(exc: Exception) -> Tuple[int, Dict[str, Any]]:
+    if isinstance(exc, ValidationError):
+        return status.HTTP_422_UNPROCESSABLE_ENTITY, {
+            "error": "Erro de validação",
+            "message": "Dados inválidos recebidos. Por favor, verifique os documentos enviados e tente novamente.",
+        }
+
+    for error_type, status_code, title in _ERROR_RESPONSES:
+        if isinstance(exc, error_type):
+            return status_code, {"error": title, "message": str(exc)}
+
+    return status.HTTP_500_INTERNAL_SERVER_ERROR, {
+        "error": "Erro interno do servidor",
+        "message": "Ocorreu um erro inesperado. Tente novamente mais tarde.",
+    }
@@ -1,54 +1,144 @@
+import atexit
 import json
 import logging
 import os
+import queue
 from logging.config import dictConfig
-from typing import Any, Mapping
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional
 
 from app.core.config import settings
 
+TRACE_EXPORT_LOGGER = "app.traces"
+
+_CONTEXT_FIELDS = ("request_id", "trace_id", "span_id")
+
+_listeners: List[QueueListener] = []
+_exception_formatter = logging.Formatter()
+
+
+def truncate_log_value(value: Any, depth: int = 0) -> Any:
+    if isinstance(value, str):
+        if len(value) > settings.log_max_string_length:
+            return f"{value[:settings.log_max_string_length]}... ({len(value)} chars)"
+        return value
+    if isinstance(value, (int, float, bool)) or value is None:
+        return value
+    if depth >= settings.log_max_depth:
+        return f"<{type(value).__name__} truncated>"
+
+    max_items = settings.log_max_collection_items
+    if isinstance(value, dict):
+        truncated = {str(key): truncate_log_value(item, depth + 1) for key, item in list(value.items())[:max_items]}
+        if len(value) > max_items:
+            truncated["..."] = f"{len(value) - max_items} more keys"
+        return truncated
+    if isinstance(value, (list, tuple, set)):
+        items = list(value)
+        truncated_items = [truncate_log_value(item, depth + 1) for item in items[:max_items]]
+        if len(items) > max_items:
+            truncated_items.append(f"... {len(items) - max_items} more items")
+        return truncated_items
+    return truncate_log_value(str(value), depth)
+
+
+def _record_data(record: logging.LogRecord) -> Any:
+    if "_truncated_data" not in record.__dict__:
+        data = getattr(record, "data", None)
+        record._truncated_data = truncate_log_value(data) if data is not None else None
+    return record._truncated_data
+
 
 class JsonFormatter(logging.Formatter):
-    def format(self, record: logging.LogRecord) -> str:
-        log: dict[str, Any] = {
+    indent: Optional[int] = None
+
+    def _payload(self, record: logging.LogRecord) -> Dict[str, Any]:
+        log: Dict[str, Any] = {
             "timestamp": self.formatTime(record, self.datefmt),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
-        data = getattr(record, "data", None)
+        for key in _CONTEXT_FIELDS:
+            value = getattr(record, key, None)
+            if value is not None:
+                log[key] = value
+
+        data = _record_data(record)
         if data is not None:
             log["data"] = data
 
-        return json.dumps(log, ensure_ascii=False, default=str)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            log["exception"] = record.exc_text
 
+        return log
 
-class ConsoleFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
-        timestamp = self.formatTime(record, self.datefmt)
-        level = record.levelname
-        logger_name = record.name
-        message = record.getMessage()
-        
-        log_dict: dict[str, Any] = {
-            "timestamp": timestamp,
-            "level": level,
-            "logger": logger_name,
-            "message": message,
-        }
-        
-        data = getattr(record, "data", None)
-        if data is not None:
-            log_dict["data"] = data
-        
-        return json.dumps(log_dict, ensure_ascii=False, indent=2, default=str)
+        cached = record.__dict__.get("_formatted")
+        if cached is not None and cached[0] is self:
+            return cached[1]
+
+        line = json.dumps(self._payload(record), ensure_ascii=False, indent=self.indent, default=str)
+        record._formatted = (self, line)
+        return line
+
+
+class ConsoleFormatter(JsonFormatter):
+    indent = 2
+
+
+class _ContextQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        _record_data(record)
+        if record.exc_info:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _start_queue_listener(target: logging.Logger, with_context: bool) -> None:
+    handlers = list(target.handlers)
+    if not handlers:
+        return
+
+    record_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = _ContextQueueHandler(record_queue)
+    if with_context:
+        from app.core.tracing import TraceContextFilter
+
+        queue_handler.addFilter(TraceContextFilter())
+    for handler in handlers:
+        target.removeHandler(handler)
+    target.addHandler(queue_handler)
+
+    listener = QueueListener(record_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners.append(listener)
+
+
+def stop_logging() -> None:
+    while _listeners:
+        _listeners.pop().stop()
 
 
 def setup_logging() -> None:
+    stop_logging()
     os.makedirs(settings.log_dir, exist_ok=True)
-    dict_config: Mapping[str, Any] = {
+    handler_filters = [] if settings.log_queue_enabled else ["trace_context"]
+    dict_config: Dict[str, Any] = {
         "version": 1,
         "disable_existing_loggers": False,
+        "filters": {
+            "trace_context": {
+                "()": "app.core.tracing.TraceContextFilter",
+            },
+        },
         "formatters": {
             "json": {
                 "()": JsonFormatter,
@@ -63,6 +153,7 @@ def setup_logging() -> None:
             "file": {
                 "class": "logging.handlers.RotatingFileHandler",
                 "formatter": "json",
+                "filters": handler_filters,
                 "filename": os.path.join(settings.log_dir, "app.log"),
                 "maxBytes": 5 * 1024 * 1024,
                 "backupCount": 5,
@@ -70,17 +161,40 @@ def setup_logging() -> None:
             },
             "console": {
                 "class": "logging.StreamHandler",
-                "formatter": "console",
+                "formatter": "json" if settings.log_profile == "production" else "console",
+                "filters": handler_filters,
             },
         },
         "root": {
             "level": settings.log_level,
             "handlers": ["file", "console"],
         },
+        "loggers": {
+            TRACE_EXPORT_LOGGER: {"level": "INFO", "handlers": [], "propagate": False},
+        },
     }
+    if settings.trace_export_path:
+        trace_export_dir = os.path.dirname(settings.trace_export_path)
+        if trace_export_dir:
+            os.makedirs(trace_export_dir, exist_ok=True)
+        dict_config["handlers"]["trace_export"] = {
+            "class": "logging.FileHandler",
+            "formatter": "raw",
+            "filename": settings.trace_export_path,
+            "encoding": "utf-8",
+        }
+        dict_config["formatters"]["raw"] = {"format": "%(message)s"}
+        dict_config["loggers"][TRACE_EXPORT_LOGGER]["handlers"] = ["trace_export"]
 
     dictConfig(dict_config)
 
+    if settings.log_queue_enabled:
+        _start_queue_listener(logging.getLogger(), with_context=True)
+        _start_queue_listener(logging.getLogger(TRACE_EXPORT_LOGGER), with_context=False)
+
+
+atexit.register(stop_logging)
+
 
 def get_logger(name: str | None = None) -> logging.Logger:
     return logging.getLogger(name if name else __name__)
@@ -0,0 +1,13 @@
+from typing import Any, Callable, Dict
+
+StatsProvider = Callable[[], Dict[str, Any]]
+
+_providers: Dict[str, StatsProvider] = {}
+
+
+def register_stats_provider(name: str, provider: StatsProvider) -> None:
+    _providers[name] = provider
+
+
+def collect_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: provider() for name, provider in _providers.items()}
@@ -0,0 +1,214 @@
+import asyncio
+import json
+import logging
+import re
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from app.core.config import settings
+from app.core.logging import TRACE_EXPORT_LOGGER, get_logger
+
+logger = get_logger(__name__)
+trace_export_logger = get_logger(TRACE_EXPORT_LOGGER)
+
+_REQUEST_ID_RE = re.compile(r"^[A-Za-z0-9._:-]{1,64}$")
+_OTLP_STATUS_CODES = {"ok": 1, "error": 2}
+
+
+class Span:
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: Dict[str, Any]) -> None:
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.status = "ok"
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+
+    @property
+    def duration_ms(self) -> float:
+        return round((self.end_ns - self.start_ns) / 1_000_000, 3)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def as_log(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_id,
+            "name": self.name,
+            "start_unix_ns": self.start_ns,
+            "duration_ms": self.duration_ms,
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class _DisabledSpan(Span):
+    def __init__(self) -> None:
+        super().__init__("disabled", "", None, {})
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, **attributes: Any) -> None:
+        pass
+
+
+_DISABLED_SPAN = _DisabledSpan()
+
+_request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+_trace_id: ContextVar[Optional[str]] = ContextVar("trace_id", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def get_request_id() -> Optional[str]:
+    return _request_id.get()
+
+
+def get_trace_id() -> Optional[str]:
+    active = _current_span.get()
+    return active.trace_id if active else _trace_id.get()
+
+
+def current_span() -> Span:
+    return _current_span.get() or _DISABLED_SPAN
+
+
+def normalize_request_id(value: Optional[str]) -> str:
+    if value and _REQUEST_ID_RE.match(value):
+        return value
+    return uuid.uuid4().hex
+
+
+@contextmanager
+def start_trace(request_id: str) -> Iterator[str]:
+    request_token = _request_id.set(request_id)
+    trace_token = _trace_id.set(uuid.uuid4().hex)
+    span_token = _current_span.set(None)
+    try:
+        yield request_id
+    finally:
+        _current_span.reset(span_token)
+        _trace_id.reset(trace_token)
+        _request_id.reset(request_token)
+
+
+class _OTLPFileExporter:
+    def __init__(self) -> None:
+        self._pending: Dict[str, List[Span]] = {}
+
+    def open_trace(self, trace_id: str) -> None:
+        self._pending.setdefault(trace_id, [])
+
+    def export(self, span: Span) -> None:
+        if span.parent_id is not None and span.trace_id in self._pending:
+            self._pending[span.trace_id].append(span)
+            return
+        spans = self._pending.pop(span.trace_id, [])
+        spans.append(span)
+        self._write(spans)
+
+    def _write(self, spans: List[Span]) -> None:
+        trace_export_logger.info(json.dumps(_otlp_request(spans), ensure_ascii=False, default=str))
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items() if value is not None]
+
+
+def _otlp_span(span: Span) -> Dict[str, Any]:
+    otlp_span: Dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 2 if span.parent_id is None else 1,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": _otlp_attributes(span.attributes),
+        "status": {"code": _OTLP_STATUS_CODES.get(span.status, 0)},
+    }
+    if span.parent_id is not None:
+        otlp_span["parentSpanId"] = span.parent_id
+    return otlp_span
+
+
+def _otlp_request(spans: List[Span]) -> Dict[str, Any]:
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": _otlp_attributes({"service.name": settings.trace_service_name})},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "app.core.tracing"},
+                        "spans": [_otlp_span(span) for span in spans],
+                    },
+                ],
+            },
+        ],
+    }
+
+
+_exporter = _OTLPFileExporter()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    if not settings.tracing_enabled:
+        yield _DISABLED_SPAN
+        return
+
+    parent = _current_span.get()
+    trace_id = parent.trace_id if parent else (_trace_id.get() or uuid.uuid4().hex)
+    current = Span(name, trace_id, parent.span_id if parent else None, attributes)
+    if parent is None:
+        request_id = _request_id.get()
+        if request_id is not None:
+            current.attributes.setdefault("request_id", request_id)
+        if settings.trace_export_path:
+            _exporter.open_trace(trace_id)
+
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as exc:
+        current.status = "cancelled" if isinstance(exc, asyncio.CancelledError) else "error"
+        current.set_attribute("error.type", type(exc).__name__)
+        raise
+    finally:
+        current.end_ns = time.time_ns()
+        _finish(current)
+        _current_span.reset(token)
+
+
+def _finish(finished: Span) -> None:
+    logger.info("Span finished", extra={"data": finished.as_log()})
+    if settings.trace_export_path:
+        _exporter.export(finished)
+
+
+class TraceContextFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = _request_id.get()
+        active = _current_span.get()
+        record.trace_id = get_trace_id()
+        record.span_id = active.span_id if active else None
+        return True
@@ -1,3 +1,4 @@
+import re
 import unicodedata
 from typing import Optional
 
@@ -24,3 +25,24 @@ def normalize_text(value: Optional[str]) -> str:
     value = _normalize_whitespace(value)
     return value.strip().lower()
 
+
+_COMPANY_NAME_ABBREVIATIONS = {
+    "ltda": "limitada",
+    "eireli": "empresa individual de responsabilidade limitada",
+    "me": "microempresa",
+    "epp": "empresa de pequeno porte",
+    "sa": "sociedade anonima",
+}
+
+_SA_ABBREVIATION_RE = re.compile(r"(?<!\w)s\s*[./]\s*a(?!\w)\.?")
+_COMPANY_NAME_PUNCTUATION_RE = re.compile(r"[.,;:\-–]+")
+
+
+def normalize_company_name(value: Optional[str]) -> str:
+    value = normalize_text(value)
+    if not value:
+        return ""
+    value = _SA_ABBREVIATION_RE.sub(" sa ", value)
+    value = _COMPANY_NAME_PUNCTUATION_RE.sub(" ", value)
+    tokens = [_COMPANY_NAME_ABBREVIATIONS.get(token, token) for token in value.split()]
+    return " ".join(tokens)
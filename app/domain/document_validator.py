@@ -1,6 +1,10 @@
-from typing import List
+import asyncio
+import time
+from typing import Callable, Iterable, List, Tuple
 
-from app.api.v1.schemas import ValidationResultResponse, ValidationStatus, Inconsistency
+from app.api.v1.schemas import EvaluationPolicy, ValidationResultResponse, ValidationStatus, Inconsistency
+from app.core.metrics import stage_duration
+from app.core.tracing import span
 from app.domain.models import (
     ArticlesOfAssociationData,
     CNPJCardData,
@@ -15,46 +19,80 @@ from app.domain.validators.tax_status import validate_tax_status
 from app.domain.validators.partners import validate_partners_consistency
 from app.domain.validators.business_purpose import validate_business_purpose_consistency
 
+DocumentValidator = Callable[..., List[Inconsistency]]
+
+DETERMINISTIC_VALIDATORS: Tuple[Tuple[str, DocumentValidator, Tuple[str, ...]], ...] = (
+    ("cnpj", validate_cnpj_consistency, ("cnpj_card", "certificate")),
+    ("company_name", validate_company_name_consistency, ("articles", "cnpj_card", "certificate")),
+    ("legal_nature", validate_legal_nature_consistency, ("articles", "cnpj_card", "certificate")),
+    ("certificate_expiration", validate_certificate_expiration, ("certificate",)),
+    ("address", validate_address_consistency, ("articles", "cnpj_card")),
+    ("tax_status", validate_tax_status, ("cnpj_card",)),
+    ("partners", validate_partners_consistency, ("articles", "cnpj_card")),
+)
+
+BUSINESS_PURPOSE_DOCUMENTS: Tuple[str, ...] = ("articles", "cnpj_card")
+
+LLM_VALIDATORS: Tuple[str, ...] = ("business_purpose",)
+
+
+def is_outcome_decided(inconsistencies: Iterable[Inconsistency]) -> bool:
+    return any(inconsistency.severity == "CRITICA" for inconsistency in inconsistencies)
+
+
+def build_validation_result(
+    inconsistencies: Iterable[Inconsistency],
+    skipped_checks: Iterable[str] = (),
+    partial: bool = False,
+) -> ValidationResultResponse:
+    inconsistencies = list(inconsistencies)
+    status: ValidationStatus = "APROVADO"
+    if is_outcome_decided(inconsistencies):
+        status = "REPROVADO"
+    elif partial:
+        status = "PENDENTE"
+
+    return ValidationResultResponse(
+        status=status,
+        inconsistencies=inconsistencies,
+        skipped_checks=list(skipped_checks),
+        partial=partial,
+    )
+
 
 async def validate_documents_domain(
     articles: ArticlesOfAssociationData,
     cnpj_card: CNPJCardData,
     certificate: TaxClearanceCertificateData,
+    policy: EvaluationPolicy = "exhaustive",
 ) -> ValidationResultResponse:
-    inconsistencies: List[Inconsistency] = []
+    documents = {"articles": articles, "cnpj_card": cnpj_card, "certificate": certificate}
 
-    inconsistencies.extend(
-        validate_cnpj_consistency(cnpj_card, certificate)
-    )
-    inconsistencies.extend(
-        validate_company_name_consistency(articles, cnpj_card, certificate)
-    )
-    inconsistencies.extend(
-        validate_legal_nature_consistency(articles, cnpj_card, certificate)
-    )
-    inconsistencies.extend(
-        validate_certificate_expiration(certificate)
-    )
-    inconsistencies.extend(
-        validate_address_consistency(articles, cnpj_card)
-    )
-    inconsistencies.extend(
-        validate_tax_status(cnpj_card)
-    )
-    inconsistencies.extend(
-        validate_partners_consistency(articles, cnpj_card)
-    )
-    inconsistencies.extend(
-        await validate_business_purpose_consistency(articles, cnpj_card)
+    business_purpose_task = asyncio.create_task(
+        validate_business_purpose_consistency(articles, cnpj_card)
     )
 
-    has_critical_inconsistencies = any(
-        inconsistency.severity == "CRITICA" for inconsistency in inconsistencies
-    )
-    status: ValidationStatus = "REPROVADO" if has_critical_inconsistencies else "APROVADO"
+    inconsistencies: List[Inconsistency] = []
+    try:
+        for name, validator, document_names in DETERMINISTIC_VALIDATORS:
+            started_at = time.perf_counter()
+            with span("validator", validator=name):
+                inconsistencies.extend(
+                    validator(*(documents[document_name] for document_name in document_names))
+                )
+            stage_duration.observe(
+                time.perf_counter() - started_at,
+                pipeline="validate_documents_domain",
+                stage=f"validate_{name}",
+            )
+    except BaseException:
+        business_purpose_task.cancel()
+        raise
 
-    return ValidationResultResponse(
-        status=status,
-        inconsistencies=inconsistencies,
-    )
+    if policy == "fail-fast" and is_outcome_decided(inconsistencies):
+        business_purpose_task.cancel()
+        return build_validation_result(inconsistencies, skipped_checks=LLM_VALIDATORS)
+
+    inconsistencies.extend(await business_purpose_task)
 
+    return build_validation_result(inconsistencies)
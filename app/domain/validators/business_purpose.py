@@ -1,9 +1,32 @@
-from typing import List
+from typing import Any, Dict, List, Optional, Set
 
 from app.api.v1.schemas import Inconsistency
-from app.domain.models import ArticlesOfAssociationData, CNPJCardData
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.stats import register_stats_provider
+from app.core.utils.normalization import normalize_text, only_digits
+from app.domain.models import Activity, ArticlesOfAssociationData, CNPJCardData
+from app.domain.validators.cnae_matcher import CNAEMatcher
+from app.services.cache import TieredCache, build_cache_key, sha256_hex
 from app.services.llm_client import call_llm_and_parse
-from app.services.prompts import build_prompt
+from app.services.prompts import PROMPTS, build_prompt
+
+logger = get_logger(__name__)
+
+matcher = CNAEMatcher(
+    accept_threshold=settings.business_purpose_matcher_accept_threshold,
+    index_cache_size=settings.business_purpose_matcher_index_cache_size,
+)
+register_stats_provider("business_purpose_matcher", matcher.stats)
+
+verdict_cache = TieredCache(
+    name="business_purpose",
+    directory=settings.business_purpose_cache_dir,
+    memory_max_entries=settings.business_purpose_cache_memory_max_entries,
+    disk_max_entries=settings.business_purpose_cache_disk_max_entries,
+    ttl_seconds=settings.business_purpose_cache_ttl_seconds,
+)
+register_stats_provider("business_purpose_cache", verdict_cache.stats)
 
 
 def _format_business_purpose(business_purpose: List[str]) -> str:
@@ -12,44 +35,147 @@ def _format_business_purpose(business_purpose: List[str]) -> str:
     return "\n".join(f"- {item}" for item in business_purpose)
 
 
-def _format_activities(cnpj_card: CNPJCardData) -> str:
+def _format_activities(cnpj_card: CNPJCardData, pending_codes: Optional[Set[str]] = None) -> str:
     activities_text = []
-    
+
+    def is_pending(activity: Activity) -> bool:
+        return pending_codes is None or only_digits(activity.code) in pending_codes
+
     main = cnpj_card.activities.main_activity
-    activities_text.append(f"Atividade Principal:")
-    activities_text.append(f"  Código CNAE: {main.code}")
-    activities_text.append(f"  Descrição: {main.description}")
-    
-    if cnpj_card.activities.secondary_activities:
-        activities_text.append(f"\nAtividades Secundárias:")
-        for sec in cnpj_card.activities.secondary_activities:
+    if is_pending(main):
+        activities_text.append(f"Atividade Principal:")
+        activities_text.append(f"  Código CNAE: {main.code}")
+        activities_text.append(f"  Descrição: {main.description}")
+
+    secondary = [sec for sec in cnpj_card.activities.secondary_activities if is_pending(sec)]
+    if secondary:
+        activities_text.append(f"\nAtividades Secundárias:" if activities_text else "Atividades Secundárias:")
+        for sec in secondary:
             activities_text.append(f"  Código CNAE: {sec.code}")
             activities_text.append(f"  Descrição: {sec.description}")
-    
+
     return "\n".join(activities_text)
 
 
+def _list_activities(cnpj_card: CNPJCardData) -> List[Activity]:
+    activities: Dict[str, Activity] = {}
+    for activity in [cnpj_card.activities.main_activity, *cnpj_card.activities.secondary_activities]:
+        activities.setdefault(only_digits(activity.code), activity)
+    return list(activities.values())
+
+
+def _business_purpose_fingerprint(business_purpose: List[str]) -> str:
+    items = sorted({normalize_text(item) for item in business_purpose if normalize_text(item)})
+    return sha256_hex("\n".join(items))
+
+
+def _verdict_cache_key(business_purpose_fingerprint: str, activity_code: str) -> str:
+    return build_cache_key(
+        "business_purpose_validation",
+        sha256_hex(PROMPTS["business_purpose_validation"]),
+        settings.openrouter_model,
+        settings.openrouter_temperature,
+        business_purpose_fingerprint,
+        activity_code,
+    )
+
+
+def _parse_activity_verdicts(result: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    verdicts: Dict[str, Dict[str, Any]] = {}
+    items = result.get("atividades")
+    if not isinstance(items, list):
+        return verdicts
+
+    for item in items:
+        if not isinstance(item, dict) or not isinstance(item.get("contemplada"), bool):
+            continue
+        code = only_digits(str(item.get("codigo", "")))
+        if code:
+            verdicts[code] = {
+                "contemplada": item["contemplada"],
+                "justificativa": item.get("justificativa") or "",
+            }
+    return verdicts
+
+
 async def validate_business_purpose_consistency(
     articles: ArticlesOfAssociationData,
     cnpj_card: CNPJCardData,
 ) -> List[Inconsistency]:
     inconsistencies: List[Inconsistency] = []
-    
-    objeto_social_text = _format_business_purpose(articles.business_purpose)
-    atividades_text = _format_activities(cnpj_card)
-    
-    prompt = build_prompt(
-        "business_purpose_validation",
-        {
-            "objeto_social": objeto_social_text,
-            "atividades": atividades_text,
+
+    fingerprint = _business_purpose_fingerprint(articles.business_purpose)
+    verdicts: Dict[str, Dict[str, Any]] = {}
+    pending_codes: Set[str] = set()
+    matched_codes: List[str] = []
+
+    index = matcher.index(articles.business_purpose) if settings.business_purpose_matcher_enabled else None
+
+    for activity in _list_activities(cnpj_card):
+        code = only_digits(activity.code)
+        if index is not None:
+            covered, match = matcher.is_covered(index, activity.description)
+            if covered:
+                verdicts[code] = {"contemplada": True, "justificativa": ""}
+                matched_codes.append(activity.code)
+                continue
+            logger.debug(
+                "Activity escalated by business purpose matcher",
+                extra={"data": {"code": activity.code, "score": match.score, "missing_tokens": match.missing_tokens}},
+            )
+
+        cached = None
+        if settings.business_purpose_cache_enabled:
+            cached = await verdict_cache.get(_verdict_cache_key(fingerprint, code))
+        if cached is not None:
+            verdicts[code] = cached
+        else:
+            pending_codes.add(code)
+
+    logger.info(
+        "Business purpose activities screened",
+        extra={
+            "data": {
+                "matched": matched_codes,
+                "cached": len(verdicts) - len(matched_codes),
+                "pending": len(pending_codes),
+            },
         },
     )
-    
-    result = await call_llm_and_parse(prompt)
-    
-    if not result.get("match", True):
-        reason = result.get("reason", "Objeto social não contempla as atividades do cartão CNPJ.")
+
+    unresolved_reason: Optional[str] = None
+    if pending_codes:
+        objeto_social_text = _format_business_purpose(articles.business_purpose)
+        atividades_text = _format_activities(cnpj_card, pending_codes)
+
+        prompt = build_prompt(
+            "business_purpose_validation",
+            {
+                "objeto_social": objeto_social_text,
+                "atividades": atividades_text,
+            },
+        )
+
+        result = await call_llm_and_parse(prompt, prompt_name="business_purpose_validation")
+
+        fresh_verdicts = _parse_activity_verdicts(result)
+        for code in pending_codes:
+            verdict = fresh_verdicts.get(code)
+            if verdict is None:
+                continue
+            verdicts[code] = verdict
+            if settings.business_purpose_cache_enabled:
+                await verdict_cache.set(_verdict_cache_key(fingerprint, code), verdict)
+
+        if pending_codes - verdicts.keys() and not result.get("match", True):
+            unresolved_reason = result.get("reason", "Objeto social não contempla as atividades do cartão CNPJ.")
+
+    rejected = [verdict for verdict in verdicts.values() if not verdict["contemplada"]]
+    if rejected or unresolved_reason:
+        reasons = [verdict["justificativa"] for verdict in rejected if verdict["justificativa"]]
+        if unresolved_reason:
+            reasons.append(unresolved_reason)
+        reason = " ".join(reasons) or "Objeto social não contempla as atividades do cartão CNPJ."
         inconsistencies.append(
             Inconsistency(
                 field="objeto_social",
@@ -57,6 +183,5 @@ async def validate_business_purpose_consistency(
                 severity="CRITICA",
             )
         )
-    
-    return inconsistencies
 
+    return inconsistencies
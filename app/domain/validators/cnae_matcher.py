@@ -0,0 +1,151 @@
+import math
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Sequence, Tuple
+
+from app.core.utils.normalization import normalize_text
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+_NEGATION_RE = re.compile(r"\b(?:exceto|sem|salvo|nao|vedad[a-z]*|excluindo|excluid[a-z]*)\b")
+
+_STOPWORDS = frozenset(
+    {
+        "a", "ao", "aos", "as", "com", "da", "das", "de", "do", "dos", "e", "em",
+        "geral", "na", "nas", "no", "nos", "o", "os", "ou", "outra", "outras", "outro", "outros",
+        "para", "pela", "pelas", "pelo", "pelos", "por", "sem", "sob", "tipo", "tipos", "um", "uma",
+    }
+)
+
+_ABBREVIATIONS = {
+    "ti": "tecnologia informacao",
+}
+
+_PLURAL_SUFFIXES = (
+    ("oes", "ao"),
+    ("aes", "ao"),
+    ("ais", "al"),
+    ("eis", "el"),
+    ("ns", "m"),
+    ("res", "r"),
+    ("s", ""),
+)
+
+_MIN_STEM_LENGTH = 4
+
+
+def _stem(token: str) -> str:
+    if len(token) <= _MIN_STEM_LENGTH:
+        return token
+    for suffix, replacement in _PLURAL_SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= _MIN_STEM_LENGTH - 1:
+            token = token[: -len(suffix)] + replacement
+            break
+    if len(token) > _MIN_STEM_LENGTH and token[-1] in "aoe":
+        token = token[:-1]
+    return token
+
+
+def tokenize(value: str) -> List[str]:
+    tokens: List[str] = []
+    for token in _TOKEN_RE.findall(normalize_text(value)):
+        for expanded in _ABBREVIATIONS.get(token, token).split():
+            if expanded not in _STOPWORDS and not expanded.isdigit():
+                tokens.append(_stem(expanded))
+    return tokens
+
+
+def _affirmative_part(value: str) -> str:
+    normalized = normalize_text(value)
+    negation = _NEGATION_RE.search(normalized)
+    return normalized[: negation.start()] if negation else normalized
+
+
+@dataclass(frozen=True)
+class BusinessPurposeIndex:
+    postings: Dict[str, FrozenSet[int]]
+    idf: Dict[str, float]
+    unseen_idf: float
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    score: float
+    best_item: int
+    missing_tokens: Tuple[str, ...]
+
+
+class CNAEMatcher:
+    def __init__(self, accept_threshold: float, index_cache_size: int = 256) -> None:
+        self.accept_threshold = accept_threshold
+        self.accepted = 0
+        self.escalated = 0
+        self._build_index = lru_cache(maxsize=index_cache_size)(self._index)
+
+    def _index(self, business_purpose: Tuple[str, ...]) -> BusinessPurposeIndex:
+        postings: Dict[str, set] = {}
+        for position, item in enumerate(business_purpose):
+            for token in tokenize(_affirmative_part(item)):
+                postings.setdefault(token, set()).add(position)
+
+        total = len(business_purpose)
+        idf = {
+            token: math.log((total + 1) / (len(items) + 1)) + 1.0
+            for token, items in postings.items()
+        }
+        return BusinessPurposeIndex(
+            postings={token: frozenset(items) for token, items in postings.items()},
+            idf=idf,
+            unseen_idf=math.log(total + 1) + 1.0,
+        )
+
+    def index(self, business_purpose: Sequence[str]) -> BusinessPurposeIndex:
+        return self._build_index(tuple(business_purpose))
+
+    def score(self, index: BusinessPurposeIndex, description: str) -> MatchResult:
+        tokens = set(tokenize(description))
+        if not tokens:
+            return MatchResult(score=0.0, best_item=-1, missing_tokens=())
+
+        weights = {token: index.idf.get(token, index.unseen_idf) for token in tokens}
+        total_weight = sum(weights.values())
+
+        covered: Dict[int, float] = {}
+        for token in tokens:
+            for item in index.postings.get(token, ()):
+                covered[item] = covered.get(item, 0.0) + weights[token]
+
+        if not covered:
+            return MatchResult(score=0.0, best_item=-1, missing_tokens=tuple(sorted(tokens)))
+
+        best_item = max(covered, key=lambda item: (covered[item], -item))
+        missing = tuple(sorted(token for token in tokens if best_item not in index.postings.get(token, ())))
+        return MatchResult(
+            score=round(covered[best_item] / total_weight, 4),
+            best_item=best_item,
+            missing_tokens=missing,
+        )
+
+    def is_covered(self, index: BusinessPurposeIndex, description: str) -> Tuple[bool, MatchResult]:
+        result = self.score(index, description)
+        accepted = result.score >= self.accept_threshold
+        if accepted:
+            self.accepted += 1
+        else:
+            self.escalated += 1
+        return accepted, result
+
+    def stats(self) -> Dict[str, Any]:
+        evaluated = self.accepted + self.escalated
+        index_info = self._build_index.cache_info()
+        return {
+            "accept_threshold": self.accept_threshold,
+            "evaluated": evaluated,
+            "accepted": self.accepted,
+            "escalated": self.escalated,
+            "accept_rate": round(self.accepted / evaluated, 4) if evaluated else 0.0,
+            "index_hits": index_info.hits,
+            "index_misses": index_info.misses,
+            "index_entries": index_info.currsize,
+        }
@@ -1,13 +1,77 @@
-from typing import List
+import re
+from typing import Any, Dict, List, Optional
 
 from app.api.v1.schemas import Inconsistency
 from app.domain.models import (
     CNPJCardData,
     TaxClearanceCertificateData,
 )
+from app.core.stats import register_stats_provider
 from app.core.utils.normalization import only_digits
 from app.domain.validators.helpers import compare_documents
 
+_CNPJ_CANDIDATE_RE = re.compile(r"(?<![\d./-])\d{2}\.?\d{3}\.?\d{3}/\d{4}-?\d{2}(?![\d/-])")
+_CHECK_DIGIT_WEIGHTS = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+
+class _TriageStats:
+    def __init__(self) -> None:
+        self.runs = 0
+        self.undecided = 0
+        self.mismatches = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {"runs": self.runs, "undecided": self.undecided, "mismatches": self.mismatches}
+
+
+triage_stats = _TriageStats()
+register_stats_provider("cnpj_triage", triage_stats.stats)
+
+
+def _check_digit(digits: str) -> str:
+    weights = _CHECK_DIGIT_WEIGHTS[-len(digits):]
+    remainder = sum(int(digit) * weight for digit, weight in zip(digits, weights)) % 11
+    return "0" if remainder < 2 else str(11 - remainder)
+
+
+def is_valid_cnpj(value: Optional[str]) -> bool:
+    digits = only_digits(value)
+    if len(digits) != 14 or len(set(digits)) == 1:
+        return False
+    first = _check_digit(digits[:12])
+    return digits[12:] == first + _check_digit(digits[:12] + first)
+
+
+def find_cnpj_candidates(text: str) -> List[str]:
+    candidates: List[str] = []
+    for match in _CNPJ_CANDIDATE_RE.finditer(text):
+        digits = only_digits(match.group())
+        if is_valid_cnpj(digits) and digits not in candidates:
+            candidates.append(digits)
+    return candidates
+
+
+def triage_cnpj_consistency(cnpj_card_text: str, certificate_text: str) -> List[Inconsistency]:
+    triage_stats.runs += 1
+    card_candidates = find_cnpj_candidates(cnpj_card_text)
+    cert_candidates = find_cnpj_candidates(certificate_text)
+    if not card_candidates or not cert_candidates:
+        triage_stats.undecided += 1
+        return []
+
+    inconsistencies = compare_documents(
+        field_name="cnpj",
+        document_values={
+            "cartao_cnpj": card_candidates[0],
+            "certidao_negativa": cert_candidates[0],
+        },
+        message="CNPJ divergente entre documentos.",
+        severity="CRITICA",
+    )
+    if inconsistencies:
+        triage_stats.mismatches += 1
+    return inconsistencies
+
 
 def validate_cnpj_consistency(
     cnpj_card: CNPJCardData,
@@ -25,5 +89,3 @@ def validate_cnpj_consistency(
         message="CNPJ divergente entre documentos.",
         severity="CRITICA",
     )
-
-
@@ -6,7 +6,7 @@ from app.domain.models import (
     CNPJCardData,
     TaxClearanceCertificateData,
 )
-from app.core.utils.normalization import normalize_text
+from app.core.utils.normalization import normalize_company_name
 from app.domain.validators.helpers import compare_documents
 
 
@@ -15,9 +15,9 @@ def validate_company_name_consistency(
     cnpj_card: CNPJCardData,
     certificate: TaxClearanceCertificateData,
 ) -> List[Inconsistency]:
-    articles_company_name = normalize_text(articles.entity_info.company_name)
-    card_company_name = normalize_text(cnpj_card.registration_info.company_name)
-    cert_company_name = normalize_text(certificate.company_name)
+    articles_company_name = normalize_company_name(articles.entity_info.company_name)
+    card_company_name = normalize_company_name(cnpj_card.registration_info.company_name)
+    cert_company_name = normalize_company_name(certificate.company_name)
 
     return compare_documents(
         field_name="razao_social",
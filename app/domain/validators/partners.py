@@ -2,7 +2,7 @@ from typing import List, Dict
 
 from app.api.v1.schemas import Inconsistency
 from app.domain.models import ArticlesOfAssociationData, CNPJCardData
-from app.core.utils.normalization import normalize_text, only_digits
+from app.core.utils.normalization import normalize_company_name, normalize_text, only_digits
 
 
 def _organize_partners_by_id(partners: List) -> Dict[str, Dict]:
@@ -11,10 +11,12 @@ def _organize_partners_by_id(partners: List) -> Dict[str, Dict]:
     for partner in partners:
         normalized_id = only_digits(partner.cpf_or_cnpj)
         if normalized_id:
+            id_type = "cpf" if len(normalized_id) == 11 else "cnpj"
+            normalize_name = normalize_text if id_type == "cpf" else normalize_company_name
             partners_by_id[normalized_id] = {
-                "name": normalize_text(partner.name_or_company_name),
+                "name": normalize_name(partner.name_or_company_name),
                 "qualification": normalize_text(partner.qualification),
-                "id_type": "cpf" if len(normalized_id) == 11 else "cnpj",
+                "id_type": id_type,
             }
     
     return partners_by_id
@@ -1,44 +1,95 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from pydantic import ValidationError
 
 from app.api.error_handlers import (
     document_validation_error_handler,
     generic_exception_handler,
     invalid_file_type_error_handler,
+    job_not_found_error_handler,
     llm_client_error_handler,
     llm_json_parse_error_handler,
     llm_response_error_handler,
     llm_timeout_error_handler,
+    llm_unavailable_error_handler,
     pdf_extraction_error_handler,
+    service_overloaded_error_handler,
     validation_error_handler,
 )
+from app.api.middleware import RequestTracingMiddleware
 from app.api.v1.routers.validation import router as validation_router
+from app.api.v1.routers.validation_jobs import router as validation_jobs_router
+from app.core.config import settings
 from app.core.exceptions import (
     DocumentValidationError,
     InvalidFileTypeError,
+    JobNotFoundError,
     LLMClientError,
     LLMJSONParseError,
     LLMResponseError,
     LLMTimeoutError,
+    LLMUnavailableError,
     PDFExtractionError,
+    ServiceOverloadedError,
 )
 from app.core.logging import setup_logging
+from app.core.metrics import render_metrics
+from app.core.stats import collect_stats
+from app.services.job_queue import job_queue
+from app.services.job_worker import start_job_workers, stop_job_workers
+from app.services.llm_client import close_llm_client, start_llm_client
+from app.services.text_extractor import shutdown_pdf_executor, start_pdf_executor
 
 setup_logging()
-app = FastAPI(title='Validador de Contratos', version='1.0.0')
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    start_pdf_executor()
+    await start_llm_client()
+    job_queue.initialize()
+    if settings.job_workers_enabled:
+        start_job_workers()
+    try:
+        yield
+    finally:
+        await stop_job_workers()
+        await close_llm_client()
+        shutdown_pdf_executor()
+
+
+app = FastAPI(title='Validador de Contratos', version='1.0.0', lifespan=lifespan)
+app.add_middleware(RequestTracingMiddleware)
 
 app.add_exception_handler(LLMTimeoutError, llm_timeout_error_handler)
+app.add_exception_handler(LLMUnavailableError, llm_unavailable_error_handler)
 app.add_exception_handler(LLMJSONParseError, llm_json_parse_error_handler)
 app.add_exception_handler(LLMResponseError, llm_response_error_handler)
 app.add_exception_handler(LLMClientError, llm_client_error_handler)
 app.add_exception_handler(InvalidFileTypeError, invalid_file_type_error_handler)
 app.add_exception_handler(PDFExtractionError, pdf_extraction_error_handler)
 app.add_exception_handler(DocumentValidationError, document_validation_error_handler)
+app.add_exception_handler(JobNotFoundError, job_not_found_error_handler)
+app.add_exception_handler(ServiceOverloadedError, service_overloaded_error_handler)
 app.add_exception_handler(ValidationError, validation_error_handler)
 app.add_exception_handler(Exception, generic_exception_handler)
 
 app.include_router(validation_router, prefix='/api/v1')
+app.include_router(validation_jobs_router, prefix='/api/v1')
 
 @app.get('/health', tags=['health'])
 def health() -> dict[str, str]:
-    return {'status': 'ok'}
\ No newline at end of file
+    return {'status': 'ok'}
+
+
+@app.get('/stats', tags=['health'])
+def stats() -> dict[str, dict]:
+    return collect_stats()
+
+
+@app.get('/metrics', tags=['health'], response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    return PlainTextResponse(render_metrics(), media_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,196 @@
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+
+from app.core.config import settings
+from app.core.exceptions import ServiceOverloadedError
+from app.core.logging import get_logger
+from app.core.metrics import register_callback_metric
+from app.core.stats import register_stats_provider
+
+logger = get_logger(__name__)
+
+_SERVICE_TIME_SMOOTHING = 0.2
+
+
+class ConcurrencyLimiter:
+    def __init__(self, name: str, limit: int) -> None:
+        self.name = name
+        self.limit = limit
+        self._semaphore = asyncio.Semaphore(limit)
+
+        self.active = 0
+        self.waiting = 0
+        self.acquired = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    async def acquire(self) -> None:
+        started_at = time.perf_counter()
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        wait_seconds = time.perf_counter() - started_at
+        self.active += 1
+        self.acquired += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def release(self) -> None:
+        self.active -= 1
+        self._semaphore.release()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "waiting": self.waiting,
+            "acquired": self.acquired,
+            "avg_wait_ms": round(self.total_wait_seconds / self.acquired * 1000, 3) if self.acquired else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+        }
+
+
+class TokenBucket:
+    def __init__(self, name: str, rate: float, capacity: int) -> None:
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait_seconds = 0.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> float:
+        if self.rate <= 0:
+            return 0.0
+
+        started_at = time.perf_counter()
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                self.throttled += 1
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+        wait_seconds = time.perf_counter() - started_at
+        self.acquired += 1
+        self.total_wait_seconds += wait_seconds
+        return wait_seconds
+
+    def stats(self) -> Dict[str, Any]:
+        if self.rate > 0:
+            self._refill()
+        return {
+            "rate_per_second": self.rate,
+            "capacity": self.capacity,
+            "tokens": round(self._tokens, 2),
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "total_wait_ms": round(self.total_wait_seconds * 1000, 1),
+        }
+
+
+class AdmissionController(ConcurrencyLimiter):
+    def __init__(self, name: str, limit: int, max_queue: int, default_service_seconds: float) -> None:
+        super().__init__(name, limit)
+        self.max_queue = max_queue
+        self.avg_service_seconds = default_service_seconds
+        self.rejected = 0
+
+    def retry_after_seconds(self) -> int:
+        return max(1, math.ceil(self.avg_service_seconds * (self.waiting + 1) / self.limit))
+
+    async def admit(self) -> float:
+        if self._semaphore.locked() and self.waiting >= self.max_queue:
+            self.rejected += 1
+            retry_after = self.retry_after_seconds()
+            logger.warning(
+                "Admission queue full, rejecting request",
+                extra={
+                    "data": {
+                        "admission": self.name,
+                        "active": self.active,
+                        "queued": self.waiting,
+                        "retry_after_seconds": retry_after,
+                    },
+                },
+            )
+            raise ServiceOverloadedError(
+                "O serviço está sobrecarregado no momento. Tente novamente em alguns instantes.",
+                retry_after_seconds=retry_after,
+            )
+
+        await self.acquire()
+        return time.perf_counter()
+
+    def leave(self, admitted_at: float) -> None:
+        service_seconds = time.perf_counter() - admitted_at
+        self.avg_service_seconds += _SERVICE_TIME_SMOOTHING * (service_seconds - self.avg_service_seconds)
+        self.release()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        admitted_at = await self.admit()
+        try:
+            yield
+        finally:
+            self.leave(admitted_at)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **super().stats(),
+            "max_queue": self.max_queue,
+            "rejected": self.rejected,
+            "avg_service_ms": round(self.avg_service_seconds * 1000, 1),
+            "retry_after_seconds": self.retry_after_seconds(),
+        }
+
+
+validation_admission = AdmissionController(
+    "validation",
+    limit=settings.validation_max_concurrent,
+    max_queue=settings.validation_max_queue,
+    default_service_seconds=settings.validation_default_service_seconds,
+)
+register_stats_provider("validation_admission", validation_admission.stats)
+register_callback_metric(
+    "valida_admission_active",
+    "Validations currently being processed.",
+    "gauge",
+    lambda: [({}, validation_admission.active)],
+)
+register_callback_metric(
+    "valida_admission_queue_depth",
+    "Validations waiting for an admission slot.",
+    "gauge",
+    lambda: [({}, validation_admission.waiting)],
+)
+register_callback_metric(
+    "valida_admission_rejected_total",
+    "Validations rejected because the admission queue was full.",
+    "counter",
+    lambda: [({}, validation_admission.rejected)],
+)
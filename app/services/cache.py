@@ -0,0 +1,214 @@
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from app.core.logging import get_logger
+from app.core.metrics import Sample, register_callback_metric
+
+logger = get_logger(__name__)
+
+_caches: List["TieredCache"] = []
+
+_DISK_PRUNE_TARGET_RATIO = 0.9
+
+
+def sha256_hex(value: str | bytes) -> str:
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    return hashlib.sha256(value).hexdigest()
+
+
+def build_cache_key(*parts: Any) -> str:
+    return sha256_hex(json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str))
+
+
+class TieredCache:
+    def __init__(
+        self,
+        name: str,
+        directory: Optional[str],
+        memory_max_entries: int,
+        disk_max_entries: int,
+        ttl_seconds: Optional[int],
+    ) -> None:
+        self.name = name
+        self._directory = directory or None
+        self._memory_max_entries = memory_max_entries
+        self._disk_max_entries = disk_max_entries
+        self._ttl_seconds = ttl_seconds
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._disk_entries: Optional[int] = None
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.errors = 0
+
+        _caches.append(self)
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self._ttl_seconds is not None and time.time() - created_at > self._ttl_seconds
+
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self._directory, key[:2], f"{key}.json")
+
+    def _remember(self, key: str, created_at: float, value: Any) -> None:
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _read_disk(self, key: str) -> Optional[Tuple[float, Any]]:
+        path = self._path_for(key)
+        try:
+            with open(path, encoding="utf-8") as file:
+                entry = json.load(file)
+        except FileNotFoundError:
+            return None
+
+        created_at = entry["created_at"]
+        if self._is_expired(created_at):
+            self._remove_disk(path)
+            return None
+        return created_at, entry["value"]
+
+    def _remove_disk(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return
+        if self._disk_entries is not None:
+            self._disk_entries -= 1
+
+    def _list_disk_entries(self) -> list[Tuple[float, str]]:
+        entries: list[Tuple[float, str]] = []
+        for root, _dirs, files in os.walk(self._directory):
+            for filename in files:
+                if filename.endswith(".json"):
+                    path = os.path.join(root, filename)
+                    try:
+                        entries.append((os.path.getmtime(path), path))
+                    except FileNotFoundError:
+                        continue
+        return entries
+
+    def _write_disk(self, key: str, created_at: float, value: Any) -> None:
+        path = self._path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        is_new = not os.path.exists(path)
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump({"created_at": created_at, "value": value}, file, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        if self._disk_entries is None:
+            self._disk_entries = len(self._list_disk_entries())
+        elif is_new:
+            self._disk_entries += 1
+
+        if self._disk_entries > self._disk_max_entries:
+            self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        entries = sorted(self._list_disk_entries())
+        target = min(self._disk_max_entries, max(int(self._disk_max_entries * _DISK_PRUNE_TARGET_RATIO), 1))
+        excess = len(entries) - target
+        for _mtime, path in entries[:max(excess, 0)]:
+            try:
+                os.remove(path)
+                self.evictions += 1
+            except FileNotFoundError:
+                continue
+        self._disk_entries = min(len(entries), target)
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._memory.get(key)
+        if entry is not None:
+            created_at, value = entry
+            if not self._is_expired(created_at):
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return value
+            del self._memory[key]
+
+        if self._directory:
+            try:
+                disk_entry = await asyncio.to_thread(self._read_disk, key)
+            except (OSError, ValueError, KeyError) as exc:
+                self.errors += 1
+                logger.warning(
+                    "Cache read error",
+                    extra={"data": {"cache": self.name, "error": str(exc)}},
+                )
+                disk_entry = None
+
+            if disk_entry is not None:
+                created_at, value = disk_entry
+                self._remember(key, created_at, value)
+                self.disk_hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: Any) -> None:
+        created_at = time.time()
+        self._remember(key, created_at, value)
+        self.writes += 1
+
+        if self._directory:
+            try:
+                await asyncio.to_thread(self._write_disk, key, created_at, value)
+            except (OSError, TypeError, ValueError) as exc:
+                self.errors += 1
+                logger.warning(
+                    "Cache write error",
+                    extra={"data": {"cache": self.name, "error": str(exc)}},
+                )
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "memory_entries": len(self._memory),
+            "disk_entries": self._disk_entries,
+        }
+
+
+def _cache_requests() -> Iterator[Sample]:
+    for cache in _caches:
+        yield {"cache": cache.name, "result": "memory_hit"}, cache.memory_hits
+        yield {"cache": cache.name, "result": "disk_hit"}, cache.disk_hits
+        yield {"cache": cache.name, "result": "miss"}, cache.misses
+
+
+def _cache_hit_ratios() -> Iterator[Sample]:
+    for cache in _caches:
+        yield {"cache": cache.name}, cache.stats()["hit_ratio"]
+
+
+register_callback_metric(
+    "valida_cache_requests_total", "Cache lookups by cache and result.", "counter", _cache_requests
+)
+register_callback_metric("valida_cache_hit_ratio", "Cache hit ratio since startup.", "gauge", _cache_hit_ratios)
@@ -0,0 +1,102 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.core.utils.normalization import normalize_text, only_digits
+
+PAGE_SEPARATOR = "\n\f\n"
+
+_ADMINISTRATOR_QUALIFICATION = "socio administrador"
+
+
+def split_pages(text: str) -> List[str]:
+    return [page for page in text.split(PAGE_SEPARATOR) if page.strip()]
+
+
+def _joined_size(pages: Sequence[str]) -> int:
+    return sum(len(page) for page in pages) + len(PAGE_SEPARATOR) * max(len(pages) - 1, 0)
+
+
+def chunk_pages(pages: Sequence[str], max_chars: int, overlap_pages: int) -> List[str]:
+    chunks: List[str] = []
+    start = 0
+    while start < len(pages):
+        end = start + 1
+        while end < len(pages) and _joined_size(pages[start:end + 1]) <= max_chars:
+            end += 1
+
+        chunks.append(PAGE_SEPARATOR.join(pages[start:end]))
+        if end >= len(pages):
+            break
+
+        start = max(end - overlap_pages, start + 1)
+        if _joined_size(pages[start:end + 1]) > max_chars:
+            start = end
+    return chunks
+
+
+def _first_not_none(values: Sequence[Any]) -> Any:
+    return next((value for value in values if value not in (None, "")), None)
+
+
+def _filled_fields(value: Any) -> int:
+    if not isinstance(value, dict):
+        return -1
+    return sum(1 for field_value in value.values() if field_value not in (None, ""))
+
+
+def _most_complete(values: Sequence[Any]) -> Optional[Dict[str, Any]]:
+    best: Optional[Dict[str, Any]] = None
+    for value in values:
+        if _filled_fields(value) > _filled_fields(best):
+            best = value
+    return best
+
+
+def _merge_business_purpose(partials: Sequence[Dict[str, Any]]) -> List[str]:
+    items: List[str] = []
+    seen = set()
+    for partial in partials:
+        for item in partial.get("objeto_social") or []:
+            key = normalize_text(item) if isinstance(item, str) else ""
+            if key and key not in seen:
+                seen.add(key)
+                items.append(item)
+    return items
+
+
+def _merge_shareholders(partials: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    shareholders: Dict[str, Dict[str, Any]] = {}
+    for partial in partials:
+        for shareholder in partial.get("participacoes_societarias") or []:
+            if not isinstance(shareholder, dict):
+                continue
+            key = only_digits(shareholder.get("cpf_ou_cnpj")) or normalize_text(
+                shareholder.get("nome_ou_razao_social")
+            )
+            if not key:
+                continue
+            current = shareholders.get(key)
+            if current is None or (
+                shareholder.get("qualificacao") == _ADMINISTRATOR_QUALIFICATION
+                and current.get("qualificacao") != _ADMINISTRATOR_QUALIFICATION
+            ):
+                shareholders[key] = shareholder
+    return list(shareholders.values())
+
+
+def merge_articles_of_association(partials: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    entity_infos = [partial.get("informacoes_entidade") or {} for partial in partials]
+    entity_fields: List[str] = []
+    for entity_info in entity_infos:
+        entity_fields.extend(field for field in entity_info if field not in entity_fields)
+
+    return {
+        "tipo_documento": "Contrato Social",
+        "informacoes_entidade": {
+            field: _first_not_none([entity_info.get(field) for entity_info in entity_infos])
+            for field in entity_fields
+        },
+        "sede": _most_complete([partial.get("sede") for partial in partials]),
+        "objeto_social": _merge_business_purpose(partials),
+        "capital_social": _most_complete([partial.get("capital_social") for partial in partials]),
+        "participacoes_societarias": _merge_shareholders(partials),
+    }
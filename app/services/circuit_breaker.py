@@ -0,0 +1,92 @@
+import time
+from typing import Any, Dict, Optional
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int, reset_timeout_seconds: float) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at = 0.0
+        self._probe_in_flight = False
+
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout_seconds:
+            return HALF_OPEN
+        return self._state
+
+    def retry_after_seconds(self) -> Optional[float]:
+        state = self.state
+        if state == OPEN:
+            return max(self.reset_timeout_seconds - (time.monotonic() - self._opened_at), 0.0)
+        if state == HALF_OPEN:
+            if not self._probe_in_flight:
+                return 0.0
+            return max(self.reset_timeout_seconds - (time.monotonic() - self._probe_started_at), 0.0)
+        return None
+
+    def _transition(self, state: str) -> None:
+        if state == self._state:
+            return
+        logger.warning(
+            "Circuit breaker state changed",
+            extra={
+                "data": {
+                    "circuit": self.name,
+                    "from": self._state,
+                    "to": state,
+                    "consecutive_failures": self._consecutive_failures,
+                },
+            },
+        )
+        self._state = state
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and not self._probe_in_flight:
+            self._transition(HALF_OPEN)
+            self._probe_in_flight = True
+            self._probe_started_at = time.monotonic()
+            return True
+        self.rejected += 1
+        return False
+
+    def release_probe(self) -> None:
+        self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        self._consecutive_failures = 0
+        self._transition(CLOSED)
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self._state == HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+            if self._state != OPEN:
+                self.opened += 1
+            self._opened_at = time.monotonic()
+            self._transition(OPEN)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,300 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.stats import register_stats_provider
+
+logger = get_logger(__name__)
+
+JOB_PENDING = "PENDENTE"
+JOB_PROCESSING = "PROCESSANDO"
+JOB_DONE = "CONCLUIDO"
+JOB_FAILED = "ERRO"
+
+FINISHED_STATUSES = (JOB_DONE, JOB_FAILED)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS validation_jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker_id TEXT,
+    lease_expires_at REAL,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_validation_jobs_status_created
+    ON validation_jobs (status, created_at);
+CREATE TABLE IF NOT EXISTS validation_job_files (
+    job_id TEXT NOT NULL,
+    document TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    content BLOB NOT NULL,
+    PRIMARY KEY (job_id, document)
+);
+"""
+
+
+@dataclass(frozen=True)
+class JobRecord:
+    id: str
+    status: str
+    created_at: float
+    updated_at: float
+    attempts: int
+    result: Optional[Dict[str, Any]]
+    error: Optional[Dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class ClaimedJob:
+    id: str
+    attempts: int
+    files: Dict[str, Tuple[str, bytes]]
+
+
+class JobQueue:
+    def __init__(self, path: str, lease_seconds: float, max_attempts: int) -> None:
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            connection.execute("PRAGMA busy_timeout = 30000")
+            connection.execute("PRAGMA journal_mode = WAL")
+            self._ensure_schema(connection)
+            yield connection
+        finally:
+            connection.close()
+
+    def _ensure_schema(self, connection: sqlite3.Connection) -> None:
+        if self._schema_ready:
+            return
+        with self._schema_lock:
+            if not self._schema_ready:
+                connection.executescript(_SCHEMA)
+                self._schema_ready = True
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def initialize(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect():
+            pass
+
+    def _enqueue(self, files: Dict[str, Tuple[str, bytes]]) -> str:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT INTO validation_jobs (id, status, created_at, updated_at) VALUES (?, ?, ?, ?)",
+                (job_id, JOB_PENDING, now, now),
+            )
+            connection.executemany(
+                "INSERT INTO validation_job_files (job_id, document, filename, content) VALUES (?, ?, ?, ?)",
+                [(job_id, document, filename, content) for document, (filename, content) in files.items()],
+            )
+        return job_id
+
+    def _claim(self, worker_id: str) -> Optional[ClaimedJob]:
+        now = time.time()
+        with self._transaction() as connection:
+            row = connection.execute(
+                """
+                SELECT id, attempts FROM validation_jobs
+                WHERE status = ? OR (status = ? AND lease_expires_at < ?)
+                ORDER BY created_at
+                LIMIT 1
+                """,
+                (JOB_PENDING, JOB_PROCESSING, now),
+            ).fetchone()
+            if row is None:
+                return None
+
+            job_id, attempts = row
+            if attempts >= self.max_attempts:
+                connection.execute(
+                    "UPDATE validation_jobs SET status = ?, updated_at = ?, error = ?, lease_expires_at = NULL "
+                    "WHERE id = ?",
+                    (
+                        JOB_FAILED,
+                        now,
+                        json.dumps(
+                            {
+                                "error": "Processamento interrompido",
+                                "message": "O processamento foi interrompido repetidas vezes. Envie os documentos novamente.",
+                            },
+                            ensure_ascii=False,
+                        ),
+                        job_id,
+                    ),
+                )
+                connection.execute("DELETE FROM validation_job_files WHERE job_id = ?", (job_id,))
+                logger.warning(
+                    "Validation job abandoned after max attempts",
+                    extra={"data": {"job_id": job_id, "attempts": attempts}},
+                )
+                return None
+
+            connection.execute(
+                "UPDATE validation_jobs SET status = ?, updated_at = ?, attempts = attempts + 1, "
+                "worker_id = ?, lease_expires_at = ? WHERE id = ?",
+                (JOB_PROCESSING, now, worker_id, now + self.lease_seconds, job_id),
+            )
+            files = {
+                document: (filename, content)
+                for document, filename, content in connection.execute(
+                    "SELECT document, filename, content FROM validation_job_files WHERE job_id = ?",
+                    (job_id,),
+                )
+            }
+        return ClaimedJob(id=job_id, attempts=attempts + 1, files=files)
+
+    def _renew_lease(self, job_id: str, worker_id: str) -> bool:
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "UPDATE validation_jobs SET lease_expires_at = ? WHERE id = ? AND worker_id = ? AND status = ?",
+                (time.time() + self.lease_seconds, job_id, worker_id, JOB_PROCESSING),
+            )
+            return cursor.rowcount == 1
+
+    def _finish(self, job_id: str, worker_id: str, status: str, column: str, payload: Dict[str, Any]) -> bool:
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                f"UPDATE validation_jobs SET status = ?, updated_at = ?, {column} = ?, lease_expires_at = NULL "
+                "WHERE id = ? AND worker_id = ? AND status = ?",
+                (
+                    status,
+                    time.time(),
+                    json.dumps(payload, ensure_ascii=False, default=str),
+                    job_id,
+                    worker_id,
+                    JOB_PROCESSING,
+                ),
+            )
+            if cursor.rowcount != 1:
+                logger.warning(
+                    "Validation job result discarded after its lease was lost",
+                    extra={"data": {"job_id": job_id, "worker_id": worker_id, "status": status}},
+                )
+                return False
+            connection.execute("DELETE FROM validation_job_files WHERE job_id = ?", (job_id,))
+        return True
+
+    def _release(self, job_id: str, worker_id: str) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE validation_jobs SET status = ?, updated_at = ?, worker_id = NULL, lease_expires_at = NULL, "
+                "attempts = MAX(attempts - 1, 0) WHERE id = ? AND worker_id = ? AND status = ?",
+                (JOB_PENDING, time.time(), job_id, worker_id, JOB_PROCESSING),
+            )
+
+    def _get(self, job_id: str) -> Optional[JobRecord]:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT id, status, created_at, updated_at, attempts, result, error FROM validation_jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return JobRecord(
+            id=row[0],
+            status=row[1],
+            created_at=row[2],
+            updated_at=row[3],
+            attempts=row[4],
+            result=json.loads(row[5]) if row[5] else None,
+            error=json.loads(row[6]) if row[6] else None,
+        )
+
+    def _purge_finished(self, older_than_seconds: float) -> int:
+        placeholders = ", ".join("?" for _ in FINISHED_STATUSES)
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                f"DELETE FROM validation_jobs WHERE status IN ({placeholders}) AND updated_at < ?",
+                (*FINISHED_STATUSES, time.time() - older_than_seconds),
+            )
+        return cursor.rowcount
+
+    def count_by_status(self) -> Dict[str, int]:
+        with self._connect() as connection:
+            rows: List[Tuple[str, int]] = connection.execute(
+                "SELECT status, COUNT(*) FROM validation_jobs GROUP BY status"
+            ).fetchall()
+        return dict(rows)
+
+    async def enqueue(self, files: Dict[str, Tuple[str, bytes]]) -> str:
+        return await asyncio.to_thread(self._enqueue, files)
+
+    async def claim(self, worker_id: str) -> Optional[ClaimedJob]:
+        return await asyncio.to_thread(self._claim, worker_id)
+
+    async def renew_lease(self, job_id: str, worker_id: str) -> bool:
+        return await asyncio.to_thread(self._renew_lease, job_id, worker_id)
+
+    async def complete(self, job_id: str, worker_id: str, result: Dict[str, Any]) -> bool:
+        return await asyncio.to_thread(self._finish, job_id, worker_id, JOB_DONE, "result", result)
+
+    async def fail(self, job_id: str, worker_id: str, error: Dict[str, Any]) -> bool:
+        return await asyncio.to_thread(self._finish, job_id, worker_id, JOB_FAILED, "error", error)
+
+    async def release(self, job_id: str, worker_id: str) -> None:
+        await asyncio.to_thread(self._release, job_id, worker_id)
+
+    async def get(self, job_id: str) -> Optional[JobRecord]:
+        return await asyncio.to_thread(self._get, job_id)
+
+    async def purge_finished(self, older_than_seconds: float) -> int:
+        return await asyncio.to_thread(self._purge_finished, older_than_seconds)
+
+    async def wait_for_completion(self, job_id: str, timeout: float) -> Optional[JobRecord]:
+        deadline = time.monotonic() + timeout
+        while True:
+            job = await self.get(job_id)
+            if job is None or job.status in FINISHED_STATUSES or time.monotonic() >= deadline:
+                return job
+            await asyncio.sleep(min(settings.job_poll_interval_seconds, max(deadline - time.monotonic(), 0)))
+
+
+job_queue = JobQueue(
+    path=settings.job_queue_path,
+    lease_seconds=settings.job_lease_seconds,
+    max_attempts=settings.job_max_attempts,
+)
+
+
+def _queue_stats() -> Dict[str, Any]:
+    try:
+        return {"jobs_by_status": job_queue.count_by_status()}
+    except sqlite3.Error as exc:
+        return {"error": str(exc)}
+
+
+register_stats_provider("validation_jobs", _queue_stats)
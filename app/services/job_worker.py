@@ -0,0 +1,168 @@
+import asyncio
+import io
+import os
+import socket
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from fastapi import UploadFile
+
+from app.core.config import settings
+from app.core.exceptions import describe_error
+from app.core.logging import get_logger
+from app.core.stats import register_stats_provider
+from app.core.tracing import span, start_trace
+from app.services.job_queue import ClaimedJob, JobQueue, job_queue
+from app.services.validation_use_case import validate_supplier_documents_use_case
+
+logger = get_logger(__name__)
+
+
+def _upload(filename: str, content: bytes) -> UploadFile:
+    return UploadFile(file=io.BytesIO(content), filename=filename)
+
+
+class JobWorkerPool:
+    def __init__(self, queue: JobQueue, concurrency: int) -> None:
+        self.queue = queue
+        self.concurrency = concurrency
+        self.worker_prefix = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._tasks: List["asyncio.Task[None]"] = []
+        self._last_purge = 0.0
+
+        self.active = 0
+        self.completed = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._run(f"{self.worker_prefix}:{index}"), name=f"validation-job-worker-{index}")
+            for index in range(self.concurrency)
+        ]
+        logger.info(
+            "Validation job workers started",
+            extra={"data": {"worker_prefix": self.worker_prefix, "concurrency": self.concurrency}},
+        )
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logger.info("Validation job workers stopped", extra={"data": {"worker_prefix": self.worker_prefix}})
+
+    async def wait(self) -> None:
+        await asyncio.gather(*self._tasks)
+
+    async def _run(self, worker_id: str) -> None:
+        while True:
+            try:
+                job = await self.queue.claim(worker_id)
+            except Exception:
+                logger.exception("Failed to claim validation job", extra={"data": {"worker_id": worker_id}})
+                job = None
+
+            if job is None:
+                await self._purge_if_due()
+                await asyncio.sleep(settings.job_poll_interval_seconds)
+                continue
+
+            with start_trace(job.id), span("validation_job", job_id=job.id, attempt=job.attempts):
+                await self._process(job, worker_id)
+
+    async def _purge_if_due(self) -> None:
+        now = time.monotonic()
+        if now - self._last_purge < settings.job_purge_interval_seconds:
+            return
+        self._last_purge = now
+        try:
+            purged = await self.queue.purge_finished(settings.job_retention_seconds)
+        except Exception:
+            logger.exception("Failed to purge finished validation jobs")
+            return
+        if purged:
+            logger.info("Finished validation jobs purged", extra={"data": {"purged": purged}})
+
+    async def _keep_lease(self, job_id: str, worker_id: str) -> None:
+        while True:
+            await asyncio.sleep(self.queue.lease_seconds / 3)
+            if not await self.queue.renew_lease(job_id, worker_id):
+                logger.warning(
+                    "Validation job lease lost",
+                    extra={"data": {"job_id": job_id, "worker_id": worker_id}},
+                )
+                return
+
+    async def _process(self, job: ClaimedJob, worker_id: str) -> None:
+        self.active += 1
+        started_at = time.perf_counter()
+        heartbeat = asyncio.create_task(self._keep_lease(job.id, worker_id))
+        logger.info(
+            "Validation job started",
+            extra={"data": {"job_id": job.id, "worker_id": worker_id, "attempt": job.attempts}},
+        )
+        try:
+            result = await validate_supplier_documents_use_case(
+                articles_of_association_file=_upload(*job.files["articles"]),
+                cnpj_card_file=_upload(*job.files["cnpj_card"]),
+                tax_clearance_certificate_file=_upload(*job.files["certificate"]),
+            )
+        except asyncio.CancelledError:
+            await asyncio.shield(self.queue.release(job.id, worker_id))
+            raise
+        except Exception as exc:
+            status_code, error = describe_error(exc)
+            log = logger.exception if status_code >= 500 else logger.error
+            log(
+                "Validation job failed",
+                extra={"data": {"job_id": job.id, "error_type": type(exc).__name__, "error": str(exc)}},
+            )
+            await self.queue.fail(job.id, worker_id, {**error, "status_code": status_code})
+            self.failed += 1
+        else:
+            await self.queue.complete(job.id, worker_id, result.model_dump(mode="json"))
+            self.completed += 1
+            logger.info(
+                "Validation job completed",
+                extra={
+                    "data": {
+                        "job_id": job.id,
+                        "status": result.status,
+                        "duration_ms": round((time.perf_counter() - started_at) * 1000, 1),
+                    },
+                },
+            )
+        finally:
+            heartbeat.cancel()
+            self.active -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "worker_prefix": self.worker_prefix,
+            "concurrency": self.concurrency,
+            "running": bool(self._tasks),
+            "active": self.active,
+            "completed": self.completed,
+            "failed": self.failed,
+        }
+
+
+_pool: Optional[JobWorkerPool] = None
+
+
+def start_job_workers(concurrency: Optional[int] = None) -> JobWorkerPool:
+    global _pool
+    job_queue.initialize()
+    if _pool is None:
+        _pool = JobWorkerPool(job_queue, concurrency or settings.job_worker_concurrency)
+        register_stats_provider("validation_job_workers", _pool.stats)
+    _pool.start()
+    return _pool
+
+
+async def stop_job_workers() -> None:
+    if _pool is not None:
+        await _pool.stop()
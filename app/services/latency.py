@@ -0,0 +1,39 @@
+import math
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+
+def _percentile(ordered: List[float], quantile: float) -> float:
+    index = min(len(ordered) - 1, max(math.ceil(quantile * len(ordered)) - 1, 0))
+    return ordered[index]
+
+
+class RollingLatency:
+    def __init__(self, window: int, min_samples: int) -> None:
+        self.min_samples = min_samples
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.count = 0
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self.count += 1
+
+    @property
+    def ready(self) -> bool:
+        return len(self._samples) >= self.min_samples
+
+    def percentile(self, quantile: float) -> Optional[float]:
+        if not self.ready:
+            return None
+        return _percentile(sorted(self._samples), quantile)
+
+    def stats(self) -> Dict[str, Any]:
+        ordered = sorted(self._samples)
+        return {
+            "count": self.count,
+            "window_samples": len(ordered),
+            **{
+                f"p{int(quantile * 100)}_ms": round(_percentile(ordered, quantile) * 1000, 1) if ordered else None
+                for quantile in (0.5, 0.95, 0.99)
+            },
+        }
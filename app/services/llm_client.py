@@ -1,5 +1,15 @@
+import asyncio
+import importlib.util
 import json
-from typing import Any, Dict, List
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
 
 import httpx
 
@@ -9,18 +19,362 @@ from app.core.exceptions import (
     LLMJSONParseError,
     LLMResponseError,
     LLMTimeoutError,
+    LLMUnavailableError,
 )
 from app.core.logging import get_logger
+from app.core.metrics import counter, histogram
+from app.core.stats import register_stats_provider
+from app.core.tracing import current_span, span
+from app.services.admission import ConcurrencyLimiter, TokenBucket
+from app.services.cache import build_cache_key, sha256_hex
+from app.services.circuit_breaker import HALF_OPEN, CircuitBreaker
+from app.services.latency import RollingLatency
+from app.services.single_flight import SingleFlight
 
 logger = get_logger(__name__)
 
+_client: Optional[httpx.AsyncClient] = None
 
-async def call_llm(messages: List[Dict[str, str]]) -> Dict[str, Any]:
-    headers: Dict[str, str] = {
-        'Authorization': f'Bearer {settings.openrouter_api_key}',
-        'Content-Type': 'application/json',
+_REQUEST_SENT_EVENTS = frozenset(
+    {
+        "connection.connect_tcp.started",
+        "http11.send_request_headers.started",
+        "http2.send_request_headers.started",
     }
+)
+
+
+class _PoolWaitStats:
+    def __init__(self) -> None:
+        self.requests = 0
+        self.in_flight = 0
+        self.queued = 0
+        self.new_connections = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record_wait(self, wait_seconds: float) -> None:
+        self.requests += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+
+_pool_wait_stats = _PoolWaitStats()
+
+
+class _CallStats:
+    def __init__(self) -> None:
+        self.completed = 0
+        self.total_seconds = 0.0
+        self.cancelled = 0
+        self.cancelled_elapsed_seconds = 0.0
+        self.estimated_saved_seconds = 0.0
+
+    @property
+    def avg_seconds(self) -> float:
+        return self.total_seconds / self.completed if self.completed else 0.0
+
+    def record_completed(self, elapsed_seconds: float) -> None:
+        self.completed += 1
+        self.total_seconds += elapsed_seconds
+
+    def record_cancelled(self, elapsed_seconds: float) -> None:
+        self.cancelled += 1
+        self.cancelled_elapsed_seconds += elapsed_seconds
+        self.estimated_saved_seconds += max(self.avg_seconds - elapsed_seconds, 0.0)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "completed": self.completed,
+            "avg_latency_ms": round(self.avg_seconds * 1000, 1),
+            "cancelled": self.cancelled,
+            "cancelled_elapsed_ms": round(self.cancelled_elapsed_seconds * 1000, 1),
+            "estimated_saved_ms": round(self.estimated_saved_seconds * 1000, 1),
+        }
+
+
+_call_stats = _CallStats()
+
+llm_flight = SingleFlight("llm")
+
+llm_limiter = ConcurrencyLimiter("llm", settings.llm_max_concurrent_calls)
+_class_limiters = {
+    "extraction": ConcurrencyLimiter("extraction", settings.llm_extraction_max_concurrent_calls),
+    "business_purpose": ConcurrencyLimiter("business_purpose", settings.llm_business_purpose_max_concurrent_calls),
+}
+_PROMPT_CLASSES = {"business_purpose_validation": "business_purpose"}
+
+llm_rate_limiter = TokenBucket(
+    "llm",
+    rate=settings.llm_rate_limit_per_second,
+    capacity=settings.llm_rate_limit_burst,
+)
+
+llm_circuit = CircuitBreaker(
+    "llm",
+    failure_threshold=settings.llm_circuit_failure_threshold,
+    reset_timeout_seconds=settings.llm_circuit_reset_seconds,
+)
+
+_HEDGE_LOST = "hedge_lost"
+
+_RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+@dataclass
+class LLMUsage:
+    attempts: int = 0
+    retries: int = 0
+    backoff_seconds: float = 0.0
+    throttled_seconds: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    def as_log(self) -> Dict[str, Any]:
+        return {
+            "attempts": self.attempts,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "retries": self.retries,
+            "backoff_ms": round(self.backoff_seconds * 1000, 1),
+            "throttled_ms": round(self.throttled_seconds * 1000, 1),
+        }
+
+
+_llm_usage: ContextVar[Optional[LLMUsage]] = ContextVar("llm_usage", default=None)
+
+
+@contextmanager
+def track_llm_usage(usage: Optional[LLMUsage] = None) -> Iterator[LLMUsage]:
+    if usage is None:
+        usage = LLMUsage()
+    token = _llm_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _llm_usage.reset(token)
+
+
+class _RetryStats:
+    def __init__(self) -> None:
+        self.retries = 0
+        self.exhausted = 0
+        self.backoff_seconds = 0.0
+        self.by_reason: Dict[str, int] = {}
+
+    def record_retry(self, reason: str, delay_seconds: float) -> None:
+        self.retries += 1
+        self.backoff_seconds += delay_seconds
+        self.by_reason[reason] = self.by_reason.get(reason, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "retries": self.retries,
+            "exhausted": self.exhausted,
+            "backoff_ms": round(self.backoff_seconds * 1000, 1),
+            "by_reason": dict(self.by_reason),
+        }
+
+
+_retry_stats = _RetryStats()
+
+llm_request_duration = histogram(
+    "valida_llm_request_duration_seconds",
+    "Duration of each HTTP request to the LLM provider, by prompt and outcome.",
+    ("prompt", "outcome"),
+)
+llm_tokens = counter(
+    "valida_llm_tokens_total",
+    "Tokens reported by the LLM provider, by prompt and kind (prompt or completion).",
+    ("prompt", "kind"),
+)
+
+
+def _observe_request(prompt_name: Optional[str], outcome: str, started_at: float) -> None:
+    llm_request_duration.observe(time.perf_counter() - started_at, prompt=prompt_name or "unknown", outcome=outcome)
+
+
+def _record_token_usage(prompt_name: Optional[str], body: Any) -> None:
+    usage = body.get("usage") if isinstance(body, dict) else None
+    if not isinstance(usage, dict):
+        return
+    prompt_tokens = int(usage.get("prompt_tokens") or 0)
+    completion_tokens = int(usage.get("completion_tokens") or 0)
+    llm_tokens.inc(prompt_tokens, prompt=prompt_name or "unknown", kind="prompt")
+    llm_tokens.inc(completion_tokens, prompt=prompt_name or "unknown", kind="completion")
+    current_span().set_attributes(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+    request_usage = _llm_usage.get()
+    if request_usage is not None:
+        request_usage.prompt_tokens += prompt_tokens
+        request_usage.completion_tokens += completion_tokens
+
+
+_latencies: Dict[str, RollingLatency] = {}
+
+
+def _latency_for(prompt_name: Optional[str]) -> RollingLatency:
+    key = prompt_name or "default"
+    latency = _latencies.get(key)
+    if latency is None:
+        latency = _latencies[key] = RollingLatency(
+            window=settings.llm_latency_window,
+            min_samples=settings.llm_latency_min_samples,
+        )
+    return latency
+
+
+class _HedgeStats:
+    def __init__(self) -> None:
+        self.eligible = 0
+        self.sent = 0
+        self.won = 0
+        self.extra_seconds = 0.0
+
+    def allow(self) -> bool:
+        return self.sent < settings.llm_hedge_max_ratio * self.eligible
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "eligible_calls": self.eligible,
+            "hedges_sent": self.sent,
+            "hedges_won": self.won,
+            "extra_request_ratio": round(self.sent / self.eligible, 4) if self.eligible else 0.0,
+            "extra_request_ms": round(self.extra_seconds * 1000, 1),
+        }
+
+
+_hedge_stats = _HedgeStats()
+
+
+@dataclass
+class _HedgeGate:
+    sending: asyncio.Event = field(default_factory=asyncio.Event)
+    retrying: bool = False
+
+
+def _http2_enabled() -> bool:
+    if not settings.llm_http2:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning(
+            "HTTP/2 requested for LLM client but the 'h2' package is not installed, using HTTP/1.1",
+        )
+        return False
+    return True
+
+
+def _build_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(
+            settings.llm_timeout_seconds,
+            pool=settings.llm_pool_timeout_seconds,
+        ),
+        limits=httpx.Limits(
+            max_connections=settings.llm_max_connections,
+            max_keepalive_connections=settings.llm_max_keepalive_connections,
+            keepalive_expiry=settings.llm_keepalive_expiry_seconds,
+        ),
+        http2=_http2_enabled(),
+        headers={
+            'Authorization': f'Bearer {settings.openrouter_api_key}',
+            'Content-Type': 'application/json',
+        },
+    )
+
+
+async def start_llm_client() -> None:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+        logger.info(
+            "LLM HTTP client started",
+            extra={
+                "data": {
+                    "max_connections": settings.llm_max_connections,
+                    "max_keepalive_connections": settings.llm_max_keepalive_connections,
+                    "keepalive_expiry_seconds": settings.llm_keepalive_expiry_seconds,
+                    "http2": _http2_enabled(),
+                },
+            },
+        )
+
+
+async def close_llm_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("LLM HTTP client closed")
+
+
+def get_llm_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    stats = _pool_wait_stats
+    return {
+        "started": _client is not None and not _client.is_closed,
+        "max_connections": settings.llm_max_connections,
+        "in_flight_requests": stats.in_flight,
+        "queued_requests": stats.queued,
+        "requests": stats.requests,
+        "new_connections": stats.new_connections,
+        "avg_pool_wait_ms": round(stats.total_wait_seconds / stats.requests * 1000, 3) if stats.requests else 0.0,
+        "max_pool_wait_ms": round(stats.max_wait_seconds * 1000, 3),
+    }
+
+
+register_stats_provider("llm_http_pool", get_pool_stats)
+register_stats_provider("llm_calls", _call_stats.stats)
+register_stats_provider("single_flight_llm", llm_flight.stats)
+
+
+def get_concurrency_stats() -> Dict[str, Any]:
+    return {
+        "global": llm_limiter.stats(),
+        **{name: limiter.stats() for name, limiter in _class_limiters.items()},
+    }
+
+
+register_stats_provider("llm_concurrency", get_concurrency_stats)
+register_stats_provider("llm_latency", lambda: {name: latency.stats() for name, latency in _latencies.items()})
+register_stats_provider("llm_hedging", _hedge_stats.stats)
+register_stats_provider("llm_retries", _retry_stats.stats)
+register_stats_provider("llm_rate_limit", llm_rate_limiter.stats)
+register_stats_provider("llm_circuit", llm_circuit.stats)
+
 
+@contextmanager
+def _pool_wait_tracer() -> Iterator[Any]:
+    started_at = time.perf_counter()
+    sent = False
+    _pool_wait_stats.in_flight += 1
+    _pool_wait_stats.queued += 1
+
+    async def trace(event_name: str, info: Dict[str, Any]) -> None:
+        nonlocal sent
+        if event_name == "connection.connect_tcp.started":
+            _pool_wait_stats.new_connections += 1
+        if not sent and event_name in _REQUEST_SENT_EVENTS:
+            sent = True
+            _pool_wait_stats.queued -= 1
+            _pool_wait_stats.record_wait(time.perf_counter() - started_at)
+
+    try:
+        yield trace
+    finally:
+        _pool_wait_stats.in_flight -= 1
+        if not sent:
+            _pool_wait_stats.queued -= 1
+
+
+async def _post_llm_request(
+    messages: List[Dict[str, str]], timeout: Optional[float], prompt_name: Optional[str]
+) -> Dict[str, Any]:
     payload: Dict[str, Any] = {
         'model': settings.openrouter_model,
         'messages': messages,
@@ -28,67 +382,299 @@ async def call_llm(messages: List[Dict[str, str]]) -> Dict[str, Any]:
         'response_format': {'type': 'json_object'},
     }
 
-    async with httpx.AsyncClient(timeout=settings.llm_timeout_seconds) as client:
-        try:
+    timeout_seconds = timeout if timeout is not None else settings.llm_timeout_seconds
+    client = get_llm_client()
+    started_at = time.perf_counter()
+    try:
+        with _pool_wait_tracer() as trace:
             response = await client.post(
                 settings.openrouter_base_url,
                 json=payload,
-                headers=headers,
+                timeout=(
+                    httpx.Timeout(timeout, pool=settings.llm_pool_timeout_seconds)
+                    if timeout is not None
+                    else httpx.USE_CLIENT_DEFAULT
+                ),
+                extensions={"trace": trace},
             )
-        except httpx.TimeoutException as exc:
-            logger.error(
-                "LLM timeout error",
-                extra={
-                    "data": {
-                        "error": str(exc),
-                        "model": settings.openrouter_model,
-                        "timeout_seconds": settings.llm_timeout_seconds,
-                    },
+    except asyncio.CancelledError as exc:
+        if exc.args and exc.args[0] == _HEDGE_LOST:
+            raise
+        _observe_request(prompt_name, "cancelled", started_at)
+        elapsed_seconds = time.perf_counter() - started_at
+        _call_stats.record_cancelled(elapsed_seconds)
+        logger.info(
+            "LLM call cancelled",
+            extra={
+                "data": {
+                    "model": settings.openrouter_model,
+                    "elapsed_ms": round(elapsed_seconds * 1000, 1),
                 },
-            )
-            raise LLMTimeoutError(
-                "O serviço de processamento de documentos demorou muito para responder. Tente novamente."
-            ) from exc
-        except httpx.HTTPError as exc:
-            logger.error(
-                "LLM HTTP error",
-                extra={"data": {"error": str(exc), "model": settings.openrouter_model}},
-            )
-            raise LLMClientError(
-                "Erro ao comunicar com o serviço de processamento. Tente novamente mais tarde."
-            ) from exc
-
-        if response.status_code >= 400:
-            error_detail = response.text[:500] if response.text else "No error details"
-            logger.error(
-                "LLM API error",
-                extra={
-                    "data": {
-                        "status_code": response.status_code,
-                        "model": settings.openrouter_model,
-                        "error_preview": error_detail,
-                    },
+            },
+        )
+        raise
+    except httpx.TimeoutException as exc:
+        _observe_request(prompt_name, "timeout", started_at)
+        logger.error(
+            "LLM timeout error",
+            extra={
+                "data": {
+                    "error": str(exc),
+                    "model": settings.openrouter_model,
+                    "timeout_seconds": timeout_seconds,
                 },
-            )
-            raise LLMClientError(
-                "Erro no serviço de processamento de documentos. Tente novamente mais tarde."
-            )
-        
+            },
+        )
+        raise LLMTimeoutError(
+            "O serviço de processamento de documentos demorou muito para responder. Tente novamente."
+        ) from exc
+    except httpx.HTTPError as exc:
+        _observe_request(prompt_name, "transport_error", started_at)
+        logger.error(
+            "LLM HTTP error",
+            extra={"data": {"error": str(exc), "model": settings.openrouter_model}},
+        )
+        raise LLMClientError(
+            "Erro ao comunicar com o serviço de processamento. Tente novamente mais tarde."
+        ) from exc
+
+    elapsed_seconds = time.perf_counter() - started_at
+    _call_stats.record_completed(elapsed_seconds)
+    current_span().set_attribute("status_code", response.status_code)
+    _observe_request(prompt_name, "success" if response.status_code < 400 else str(response.status_code), started_at)
+    if response.status_code >= 400:
+        error_detail = response.text[:500] if response.text else "No error details"
+        logger.error(
+            "LLM API error",
+            extra={
+                "data": {
+                    "status_code": response.status_code,
+                    "model": settings.openrouter_model,
+                    "error_preview": error_detail,
+                },
+            },
+        )
+        raise LLMClientError(
+            "Erro no serviço de processamento de documentos. Tente novamente mais tarde.",
+            status_code=response.status_code,
+            retry_after_seconds=_parse_retry_after(response.headers.get("retry-after")),
+        )
+
+    _latency_for(prompt_name).record(elapsed_seconds)
+    try:
+        body = response.json()
+    except json.JSONDecodeError as exc:
+        logger.error(
+            "LLM response JSON decode error",
+            extra={
+                "data": {
+                    "model": settings.openrouter_model,
+                    "response_preview": response.text[:200] if response.text else None,
+                },
+            },
+        )
+        raise LLMClientError(
+            "Resposta inválida do serviço de processamento. Tente novamente.",
+            status_code=response.status_code,
+        ) from exc
+
+    _record_token_usage(prompt_name, body)
+    return body
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _retry_reason(exc: LLMClientError) -> Optional[str]:
+    if isinstance(exc, LLMTimeoutError):
+        return "timeout"
+    if isinstance(exc, (LLMJSONParseError, LLMResponseError)):
+        return None
+    if exc.status_code is None:
+        return "transport"
+    if exc.status_code in _RETRYABLE_STATUS_CODES:
+        return str(exc.status_code)
+    return None
+
+
+def _retry_delay(exc: LLMClientError, attempt: int) -> Optional[float]:
+    backoff = min(
+        settings.llm_retry_max_delay_seconds,
+        settings.llm_retry_base_delay_seconds * 2 ** attempt,
+    )
+    delay = random.uniform(0, backoff)
+    if exc.retry_after_seconds is not None:
+        if exc.retry_after_seconds > settings.llm_retry_max_delay_seconds:
+            return None
+        delay = max(delay, exc.retry_after_seconds)
+    return delay
+
+
+def _adaptive_timeout(latency: RollingLatency) -> float:
+    high = latency.percentile(settings.llm_adaptive_timeout_percentile)
+    if high is None:
+        return settings.llm_timeout_seconds
+    return min(
+        max(high * settings.llm_adaptive_timeout_multiplier, settings.llm_min_timeout_seconds),
+        settings.llm_timeout_seconds,
+    )
+
+
+async def _limited_post(
+    llm_class: str,
+    messages: List[Dict[str, str]],
+    timeout: float,
+    prompt_name: Optional[str],
+    gate: Optional[_HedgeGate] = None,
+) -> Dict[str, Any]:
+    usage = _llm_usage.get()
+    attempt = 0
+    while True:
         try:
-            return response.json()
-        except json.JSONDecodeError as exc:
-            logger.error(
-                "LLM response JSON decode error",
+            with span("llm.attempt", prompt=prompt_name, attempt=attempt + 1) as attempt_span:
+                async with _class_limiters[llm_class].slot(), llm_limiter.slot():
+                    throttled_seconds = await llm_rate_limiter.acquire()
+                    attempt_span.set_attribute("throttled_ms", round(throttled_seconds * 1000, 1))
+                    if usage is not None:
+                        usage.attempts += 1
+                        usage.throttled_seconds += throttled_seconds
+                    if gate is not None:
+                        gate.sending.set()
+                    return await _post_llm_request(messages, timeout, prompt_name)
+        except LLMClientError as exc:
+            reason = _retry_reason(exc)
+            if reason is None:
+                raise
+            if gate is not None:
+                gate.retrying = True
+            delay = _retry_delay(exc, attempt) if attempt + 1 < settings.llm_retry_max_attempts else None
+            if delay is None:
+                _retry_stats.exhausted += 1
+                raise
+
+            attempt += 1
+            _retry_stats.record_retry(reason, delay)
+            if usage is not None:
+                usage.retries += 1
+                usage.backoff_seconds += delay
+            logger.warning(
+                "Retrying LLM call",
                 extra={
                     "data": {
-                        "model": settings.openrouter_model,
-                        "response_preview": response.text[:200] if response.text else None,
+                        "prompt_name": prompt_name,
+                        "reason": reason,
+                        "attempt": attempt,
+                        "delay_ms": round(delay * 1000, 1),
+                        "retry_after_seconds": exc.retry_after_seconds,
                     },
                 },
             )
-            raise LLMClientError(
-                "Resposta inválida do serviço de processamento. Tente novamente."
-            ) from exc
+            await asyncio.sleep(delay)
+
+
+async def _hedged(
+    request: Callable[..., Awaitable[Dict[str, Any]]], hedge_delay: float, prompt_name: Optional[str]
+) -> Dict[str, Any]:
+    _hedge_stats.eligible += 1
+    gate = _HedgeGate()
+    primary = asyncio.create_task(request(gate))
+    tasks = [primary]
+    hedge_started_at: Optional[float] = None
+    try:
+        sending = asyncio.create_task(gate.sending.wait())
+        try:
+            await asyncio.wait([primary, sending], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            sending.cancel()
+
+        done, _pending = await asyncio.wait(tasks, timeout=hedge_delay)
+        if not done and not gate.retrying and _hedge_stats.allow():
+            _hedge_stats.sent += 1
+            hedge_started_at = time.perf_counter()
+            current_span().set_attribute("hedged", True)
+            logger.info(
+                "LLM hedged request sent",
+                extra={"data": {"prompt_name": prompt_name, "hedge_delay_ms": round(hedge_delay * 1000, 1)}},
+            )
+            tasks.append(asyncio.create_task(request()))
+
+        pending = set(tasks)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                error = task.exception()
+                if error is None:
+                    if task is not primary:
+                        _hedge_stats.won += 1
+                    for loser in pending:
+                        loser.cancel(_HEDGE_LOST)
+                    return task.result()
+        raise error
+    finally:
+        for task in tasks:
+            if not task.cancelling():
+                task.cancel()
+        if hedge_started_at is not None:
+            _hedge_stats.extra_seconds += time.perf_counter() - hedge_started_at
+
+
+async def call_llm(
+    messages: List[Dict[str, str]],
+    timeout: Optional[float] = None,
+    prompt_name: Optional[str] = None,
+) -> Dict[str, Any]:
+    with span("llm.call", prompt=prompt_name, model=settings.openrouter_model):
+        return await _call_llm(messages, timeout, prompt_name)
+
+
+async def _call_llm(
+    messages: List[Dict[str, str]], timeout: Optional[float], prompt_name: Optional[str]
+) -> Dict[str, Any]:
+    llm_class = _PROMPT_CLASSES.get(prompt_name or "", "extraction")
+    latency = _latency_for(prompt_name)
+    if timeout is None:
+        timeout = _adaptive_timeout(latency) if settings.llm_adaptive_timeout_enabled else settings.llm_timeout_seconds
+    request = partial(_limited_post, llm_class, messages, timeout, prompt_name)
+    current_span().set_attributes(llm_class=llm_class, timeout_seconds=timeout)
+
+    hedge_delay = None
+    if settings.llm_hedging_enabled and llm_class == "extraction":
+        hedge_delay = latency.percentile(settings.llm_hedge_percentile)
+    if not settings.llm_circuit_breaker_enabled:
+        return await (request() if hedge_delay is None else _hedged(request, hedge_delay, prompt_name))
+
+    probing = llm_circuit.state == HALF_OPEN
+    if not llm_circuit.allow():
+        raise LLMUnavailableError(
+            "O serviço de processamento de documentos está indisponível no momento. Tente novamente mais tarde.",
+            retry_after_seconds=llm_circuit.retry_after_seconds(),
+        )
+    try:
+        response = await (request() if hedge_delay is None else _hedged(request, hedge_delay, prompt_name))
+    except LLMClientError as exc:
+        if _retry_reason(exc) is not None:
+            llm_circuit.record_failure()
+        raise
+    finally:
+        if probing:
+            llm_circuit.release_probe()
+
+    llm_circuit.record_success()
+    return response
 
 
 def parse_llm_json_response(response: Dict[str, Any]) -> Dict[str, Any]:
@@ -138,7 +724,20 @@ def parse_llm_json_response(response: Dict[str, Any]) -> Dict[str, Any]:
         ) from exc
 
 
-async def call_llm_and_parse(content: str) -> Dict[str, Any]:
+async def _call_llm_and_parse(
+    content: str, timeout: Optional[float], prompt_name: Optional[str]
+) -> Dict[str, Any]:
     messages = [{"role": "user", "content": content}]
-    response = await call_llm(messages)
-    return parse_llm_json_response(response)
\ No newline at end of file
+    response = await call_llm(messages, timeout=timeout, prompt_name=prompt_name)
+    return parse_llm_json_response(response)
+
+
+async def call_llm_and_parse(
+    content: str, timeout: Optional[float] = None, prompt_name: Optional[str] = None
+) -> Dict[str, Any]:
+    key = build_cache_key(
+        settings.openrouter_model,
+        settings.openrouter_temperature,
+        sha256_hex(content),
+    )
+    return await llm_flight.run(key, partial(_call_llm_and_parse, content, timeout, prompt_name))
\ No newline at end of file
@@ -0,0 +1,120 @@
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Pattern
+
+from app.core.stats import register_stats_provider
+from app.core.utils.normalization import normalize_text
+from app.services.parsers.common import FastPathStats
+
+section_index_stats = FastPathStats()
+register_stats_provider("articles_section_index", section_index_stats.stats)
+
+PREAMBLE = "preambulo"
+CLOSING = "encerramento"
+
+RELEVANT_SECTIONS = frozenset(
+    {"socios", "denominacao", "sede", "objeto", "capital", "administracao", "prazo", "consolidacao"}
+)
+
+_SECTION_KEYWORDS = (
+    ("socios", ("SOCIO", "QUALIFICACAO", "CESSAO", "TRANSFERENCIA", "ADMISSAO", "RETIRADA")),
+    ("denominacao", ("DENOMINACAO", "NOMEEMPRESARIAL", "RAZAOSOCIAL")),
+    ("sede", ("SEDE", "ENDERECO")),
+    ("objeto", ("OBJETO",)),
+    ("capital", ("CAPITAL", "QUOTAS", "ACOES")),
+    ("administracao", ("ADMINISTRACAO", "GERENCIA", "DIRETORIA")),
+    ("prazo", ("PRAZO", "INICIO", "DURACAO")),
+    ("consolidacao", ("CONSOLIDACAO",)),
+)
+
+_TITLE_MAX_CHARS = 40
+_CONNECTOR = r"(?:DOS|DAS|DO|DA|DE)?"
+_TITLE_RE = re.compile(
+    rf"^\d*{_CONNECTOR}(?:(?:ALTERACAO|MODIFICACAO){_CONNECTOR})?(?:"
+    + "|".join(f"(?P<{kind}>{'|'.join(keywords)})" for kind, keywords in _SECTION_KEYWORDS)
+    + ")"
+)
+_NON_ALNUM_RE = re.compile(r"[^A-Z0-9]")
+
+
+def _spaced(text: str) -> str:
+    return r"\s*".join(re.escape(char) for char in text if not char.isspace())
+
+
+def _heading_pattern() -> Pattern[str]:
+    clause = rf"(?i:{_spaced('CLÁUSULA')})[^\n]{{1,60}}?\s*[-–:.]"
+    standalone = "|".join(
+        _spaced(title)
+        for title in (
+            "DOS SÓCIOS",
+            "DA DENOMINAÇÃO",
+            "DA SEDE",
+            "DO OBJETO",
+            "DO CAPITAL",
+            "DA ADMINISTRAÇÃO",
+            "DO PRAZO",
+            "CONSOLIDAÇÃO DO CONTRATO",
+        )
+    )
+    return re.compile(rf"^[ \t]*(?:(?P<clause>{clause})|(?={standalone}))(?P<title>[^\n]*)", re.M)
+
+
+_HEADING_RE = _heading_pattern()
+
+
+def _closing_pattern() -> Pattern[str]:
+    stamps = "|".join(
+        rf"(?i:{_spaced(marker)})"
+        for marker in ("JUNTA COMERCIAL", "NIRE", "Data de Registro", "CERTIFICO O REGISTRO", "Assinado digitalmente")
+    )
+    signature = r"_{5,}"
+    place_and_date = r"[^\n,]{2,60},\s*\d{1,2}\s+de\s+\w+\s+de\s+\d{4}\.?[ \t]*$"
+    return re.compile(rf"^[ \t]*(?:{stamps}|{signature}|{place_and_date})", re.M)
+
+
+_CLOSING_RE = _closing_pattern()
+
+
+@dataclass(frozen=True)
+class Section:
+    kind: Optional[str]
+    start: int
+    end: int
+
+
+def _classify(title: str) -> Optional[str]:
+    compact = _NON_ALNUM_RE.sub("", normalize_text(title).upper())[:_TITLE_MAX_CHARS]
+    match = _TITLE_RE.match(compact)
+    return match.lastgroup if match else None
+
+
+def locate_sections(text: str) -> List[Section]:
+    headings = [(match.start(), _classify(match.group("title"))) for match in _HEADING_RE.finditer(text)]
+    if not headings:
+        return []
+
+    closing = _CLOSING_RE.search(text, headings[-1][0])
+    closing_start = closing.start() if closing else len(text)
+
+    sections = [Section(kind=PREAMBLE, start=0, end=headings[0][0])]
+    for position, (start, kind) in enumerate(headings):
+        end = headings[position + 1][0] if position + 1 < len(headings) else closing_start
+        sections.append(Section(kind=kind, start=start, end=end))
+    if closing_start < len(text):
+        sections.append(Section(kind=CLOSING, start=closing_start, end=len(text)))
+    return sections
+
+
+def select_relevant_text(text: str) -> Optional[str]:
+    sections = locate_sections(text)
+    found = {section.kind for section in sections}
+    if "objeto" not in found:
+        section_index_stats.record(False)
+        return None
+
+    section_index_stats.record(True)
+    return "\n".join(
+        text[section.start:section.end].strip()
+        for section in sections
+        if section.kind in (PREAMBLE, CLOSING) or section.kind in RELEVANT_SECTIONS
+    )
@@ -0,0 +1,278 @@
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from app.core.logging import get_logger
+from app.core.stats import register_stats_provider
+from app.core.utils.normalization import normalize_company_name, only_digits
+from app.domain.models import CNPJCardData
+from app.services.parsers.common import (
+    FIELD_FOUND,
+    FIELD_MISSING,
+    FIELD_UNRECOGNIZED,
+    FastPathStats,
+    Label,
+    ParseResult,
+    join_lines,
+    parse_br_date,
+    parse_br_datetime,
+    split_by_labels,
+)
+
+logger = get_logger(__name__)
+
+fast_path_stats = FastPathStats()
+register_stats_provider("cnpj_card_fast_path", fast_path_stats.stats)
+
+_LABELS = (
+    Label("numero_inscricao", "NÚMERO DE INSCRIÇÃO"),
+    Label("data_abertura", "DATA DE ABERTURA"),
+    Label("nome_empresarial", "NOME EMPRESARIAL"),
+    Label("nome_fantasia", "TÍTULO DO ESTABELECIMENTO (NOME FANTASIA)"),
+    Label("porte", "PORTE"),
+    Label("atividade_principal", "CÓDIGO E DESCRIÇÃO DA ATIVIDADE ECONÔMICA PRINCIPAL"),
+    Label("atividades_secundarias", "CÓDIGO E DESCRIÇÃO DAS ATIVIDADES ECONÔMICAS SECUNDÁRIAS"),
+    Label("natureza_juridica", "CÓDIGO E DESCRIÇÃO DA NATUREZA JURÍDICA"),
+    Label("logradouro", "LOGRADOURO"),
+    Label("numero", "NÚMERO"),
+    Label("complemento", "COMPLEMENTO"),
+    Label("cep", "CEP"),
+    Label("bairro", "BAIRRO/DISTRITO"),
+    Label("municipio", "MUNICÍPIO"),
+    Label("uf", "UF"),
+    Label("endereco_eletronico", "ENDEREÇO ELETRÔNICO", required=False),
+    Label("telefone", "TELEFONE", required=False),
+    Label("efr", "ENTE FEDERATIVO RESPONSÁVEL (EFR)", required=False),
+    Label("situacao", "SITUAÇÃO CADASTRAL"),
+    Label("data_situacao", "DATA DA SITUAÇÃO CADASTRAL"),
+    Label("motivo_situacao", "MOTIVO DE SITUAÇÃO CADASTRAL", required=False),
+    Label("situacao_especial", "SITUAÇÃO ESPECIAL", required=False),
+    Label("data_situacao_especial", "DATA DA SITUAÇÃO ESPECIAL", required=False),
+    Label("qsa", "QUADRO DE SÓCIOS E ADMINISTRADORES (QSA)", required=False),
+    Label("emissao", "Emitido"),
+)
+
+_LEGAL_NATURE_BY_CODE = {
+    "204-6": "sociedade anonima",
+    "205-4": "sociedade anonima",
+    "206-2": "limitada",
+    "223-2": "limitada",
+    "230-5": "empresa individual de responsabilidade limitada",
+    "231-3": "empresa individual de responsabilidade limitada",
+}
+
+_QUALIFICATION_BY_CODE = {
+    "05": "diretor",
+    "10": "diretor",
+    "16": "diretor",
+    "22": "socio",
+    "28": "socio administrador",
+    "37": "socio",
+    "38": "socio",
+    "49": "socio administrador",
+}
+
+_OPTIONAL_LABELS = {label.key for label in _LABELS if not label.required}
+
+_SOURCE_LABEL = {
+    "cnpj": "numero_inscricao",
+    "is_matriz": "numero_inscricao",
+    "razao_social": "nome_empresarial",
+    "cidade": "municipio",
+    "estado": "uf",
+    "socios_qsa": "qsa",
+    "emitido_em": "emissao",
+    "codigo_controle": "emissao",
+}
+
+_NULLABLE_FIELDS = {"nome_fantasia", "complemento"}
+
+_EMPTY_VALUES = {"", "********", "*****", "NAO INFORMADA", "NÃO INFORMADA"}
+
+_CNPJ = r"\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}"
+_CPF = r"\d{3}\.\d{3}\.\d{3}-\d{2}"
+
+_REGISTRATION_RE = re.compile(rf"^({_CNPJ})\s*(MATRIZ|FILIAL)$")
+_ACTIVITY_RE = re.compile(r"(\d{2}\.\d{2}-\d-\d{2})\s+-\s+(.+?)(?=\s*\d{2}\.\d{2}-\d-\d{2}\s+-\s+|\s*$)", re.S)
+_LEGAL_NATURE_RE = re.compile(r"^(\d{3}-\d)\s+-\s+(.+)$", re.S)
+_POSTAL_CODE_RE = re.compile(r"^\d{2}\.?\d{3}-\d{3}$")
+_STATE_RE = re.compile(r"^[A-Z]{2}$")
+_UPPERCASE_WORDS_RE = re.compile(r"^[A-ZÀ-Ý]+(?: [A-ZÀ-Ý]+)*$")
+_QSA_HEADER_RE = re.compile(r"^NOME/NOME EMPRESARIAL\s+CPF/CNPJ\s+QUALIFICAÇÃO\s*")
+_PARTNER_RE = re.compile(rf"([^\n]+?)\s+({_CPF}|{_CNPJ})\s+(\d{{2}})-([^\n]+)")
+_EMISSION_RE = re.compile(
+    r"^(?:em:|no dia)\s*(\d{2}/\d{2}/\d{4})\s+às\s+(\d{2}:\d{2}:\d{2})"
+    r".*?Código de Controle:\s*(\S+)",
+    re.S | re.I,
+)
+
+
+def _optional_value(value: str) -> Optional[str]:
+    value = join_lines(value)
+    return None if value.upper() in _EMPTY_VALUES else value
+
+
+def _parse_activities(segment: str) -> Optional[List[Dict[str, str]]]:
+    if _optional_value(segment) is None:
+        return []
+
+    activities: List[Dict[str, str]] = []
+    position = 0
+    for match in _ACTIVITY_RE.finditer(segment):
+        if segment[position:match.start()].strip():
+            return None
+        activities.append({"codigo": match.group(1), "descricao": join_lines(match.group(2))})
+        position = match.end()
+
+    if not activities or segment[position:].strip():
+        return None
+    return activities
+
+
+def _parse_partners(segment: str) -> Optional[List[Dict[str, str]]]:
+    header = _QSA_HEADER_RE.match(segment)
+    if not header:
+        return None
+
+    partners: List[Dict[str, str]] = []
+    position = header.end()
+    while position < len(segment):
+        match = _PARTNER_RE.match(segment, position)
+        if not match:
+            return None if segment[position:].strip() else partners
+
+        name, document, code, _description = match.groups()
+        qualification = _QUALIFICATION_BY_CODE.get(code)
+        if qualification is None:
+            return None
+
+        document_digits = only_digits(document)
+        partners.append(
+            {
+                "nome_ou_razao_social": (
+                    normalize_company_name(name) if len(document_digits) == 14 else join_lines(name)
+                ),
+                "cpf_ou_cnpj": document_digits,
+                "qualificacao": qualification,
+            }
+        )
+        position = match.end()
+        while position < len(segment) and segment[position].isspace():
+            position += 1
+
+    return partners
+
+
+def _field_confidence(segments: Dict[str, str], label: str, value: Any, nullable: bool) -> float:
+    if label not in segments:
+        return FIELD_FOUND if label in _OPTIONAL_LABELS else FIELD_MISSING
+    if value is None and not nullable:
+        return FIELD_UNRECOGNIZED
+    return FIELD_FOUND
+
+
+def _extract_fields(segments: Dict[str, str]) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    values: Dict[str, Any] = {}
+
+    registration = _REGISTRATION_RE.match(join_lines(segments.get("numero_inscricao", "")))
+    values["cnpj"] = only_digits(registration.group(1)) if registration else None
+    values["is_matriz"] = registration.group(2) == "MATRIZ" if registration else None
+
+    values["data_abertura"] = parse_br_date(segments.get("data_abertura"))
+    company_name = join_lines(segments.get("nome_empresarial", ""))
+    values["razao_social"] = normalize_company_name(company_name) or None
+    values["nome_fantasia"] = _optional_value(segments.get("nome_fantasia", ""))
+    porte = join_lines(segments.get("porte", ""))
+    values["porte"] = porte if _UPPERCASE_WORDS_RE.match(porte) else None
+
+    main_activities = _parse_activities(segments.get("atividade_principal", ""))
+    values["atividade_principal"] = (
+        main_activities[0] if main_activities and len(main_activities) == 1 else None
+    )
+    values["atividades_secundarias"] = _parse_activities(segments.get("atividades_secundarias", ""))
+
+    legal_nature = _LEGAL_NATURE_RE.match(join_lines(segments.get("natureza_juridica", "")))
+    values["natureza_juridica"] = _LEGAL_NATURE_BY_CODE.get(legal_nature.group(1)) if legal_nature else None
+
+    values["logradouro"] = join_lines(segments.get("logradouro", "")) or None
+    values["numero"] = join_lines(segments.get("numero", "")) or None
+    values["complemento"] = _optional_value(segments.get("complemento", ""))
+    postal_code = join_lines(segments.get("cep", ""))
+    values["cep"] = only_digits(postal_code) if _POSTAL_CODE_RE.match(postal_code) else None
+    values["bairro"] = join_lines(segments.get("bairro", "")) or None
+    values["cidade"] = join_lines(segments.get("municipio", "")) or None
+    state = join_lines(segments.get("uf", ""))
+    values["estado"] = state if _STATE_RE.match(state) else None
+
+    status = join_lines(segments.get("situacao", ""))
+    values["situacao"] = status if _UPPERCASE_WORDS_RE.match(status) else None
+    values["data_situacao"] = parse_br_date(join_lines(segments.get("data_situacao", "")))
+
+    values["socios_qsa"] = _parse_partners(segments["qsa"]) if "qsa" in segments else []
+
+    emission = _EMISSION_RE.match(segments.get("emissao", ""))
+    values["emitido_em"] = parse_br_datetime(emission.group(1), emission.group(2)) if emission else None
+    values["codigo_controle"] = emission.group(3) if emission else None
+
+    confidence = {
+        name: _field_confidence(segments, _SOURCE_LABEL.get(name, name), value, name in _NULLABLE_FIELDS)
+        for name, value in values.items()
+    }
+    return values, confidence
+
+
+def _build_payload(values: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "tipo_documento": "Cartão CNPJ",
+        "informacoes_registro": {
+            "cnpj": values["cnpj"],
+            "is_matriz": values["is_matriz"],
+            "data_abertura": values["data_abertura"],
+            "razao_social": values["razao_social"],
+            "nome_fantasia": values["nome_fantasia"],
+            "porte": values["porte"],
+            "natureza_juridica": values["natureza_juridica"],
+        },
+        "atividades": {
+            "atividade_principal": values["atividade_principal"],
+            "atividades_secundarias": values["atividades_secundarias"],
+        },
+        "endereco": {
+            "logradouro": values["logradouro"],
+            "numero": values["numero"],
+            "complemento": values["complemento"],
+            "bairro": values["bairro"],
+            "cep": values["cep"],
+            "cidade": values["cidade"],
+            "estado": values["estado"],
+        },
+        "situacao_cadastral": {
+            "situacao": values["situacao"],
+            "data_situacao": values["data_situacao"],
+        },
+        "socios_qsa": values["socios_qsa"],
+        "informacoes_emissao": {
+            "emitido_em": values["emitido_em"],
+            "codigo_controle": values["codigo_controle"],
+        },
+    }
+
+
+def parse_cnpj_card(text: str) -> ParseResult[CNPJCardData]:
+    segments = split_by_labels(text, _LABELS)
+    values, confidence = _extract_fields(segments)
+
+    data: Optional[CNPJCardData] = None
+    if all(score >= FIELD_FOUND for score in confidence.values()):
+        try:
+            data = CNPJCardData.model_validate(_build_payload(values))
+        except ValidationError as exc:
+            logger.warning(
+                "CNPJ card fast path produced invalid data",
+                extra={"data": {"errors": exc.errors()}},
+            )
+
+    result = ParseResult(data=data, field_confidence=confidence)
+    fast_path_stats.record(result.is_confident)
+    return result
@@ -0,0 +1,114 @@
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Dict, Generic, List, Optional, Pattern, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+FIELD_FOUND = 1.0
+FIELD_UNRECOGNIZED = 0.5
+FIELD_MISSING = 0.0
+
+_BR_DATE_RE = re.compile(r"^(\d{2})/(\d{2})/(\d{4})$")
+
+
+@dataclass(frozen=True)
+class Label:
+    key: str
+    text: str
+    required: bool = True
+
+
+@dataclass
+class ParseResult(Generic[T]):
+    data: Optional[T]
+    field_confidence: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def is_confident(self) -> bool:
+        return self.data is not None and all(
+            confidence >= FIELD_FOUND for confidence in self.field_confidence.values()
+        )
+
+    @property
+    def uncertain_fields(self) -> List[str]:
+        return [name for name, confidence in self.field_confidence.items() if confidence < FIELD_FOUND]
+
+
+class FastPathStats:
+    def __init__(self) -> None:
+        self.attempts = 0
+        self.hits = 0
+
+    def record(self, hit: bool) -> None:
+        self.attempts += 1
+        if hit:
+            self.hits += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "attempts": self.attempts,
+            "hits": self.hits,
+            "fallbacks": self.attempts - self.hits,
+            "hit_rate": round(self.hits / self.attempts, 4) if self.attempts else 0.0,
+        }
+
+
+def label_pattern(text: str) -> Pattern[str]:
+    escaped = r"\s+".join(re.escape(part) for part in text.split())
+    return re.compile(rf"(?<!\w){escaped}(?!\w)")
+
+
+def split_by_labels(text: str, labels: Sequence[Label]) -> Dict[str, str]:
+    patterns = [label_pattern(label.text) for label in labels]
+    found: List[Tuple[str, int, int]] = []
+    cursor = 0
+
+    for index, label in enumerate(labels):
+        limit = len(text)
+        if not label.required:
+            for next_index in range(index + 1, len(labels)):
+                if labels[next_index].required:
+                    next_match = patterns[next_index].search(text, cursor)
+                    if next_match:
+                        limit = next_match.start()
+                    break
+
+        match = patterns[index].search(text, cursor, limit)
+        if match:
+            found.append((label.key, match.start(), match.end()))
+            cursor = match.end()
+
+    segments: Dict[str, str] = {}
+    for position, (key, _start, end) in enumerate(found):
+        next_start = found[position + 1][1] if position + 1 < len(found) else len(text)
+        segments[key] = text[end:next_start].strip()
+    return segments
+
+
+def join_lines(value: str) -> str:
+    return " ".join(value.split())
+
+
+def parse_br_date(value: Optional[str]) -> Optional[date]:
+    if not value:
+        return None
+    match = _BR_DATE_RE.match(value.strip())
+    if not match:
+        return None
+    day, month, year = (int(part) for part in match.groups())
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def parse_br_datetime(date_value: str, time_value: str) -> Optional[datetime]:
+    parsed_date = parse_br_date(date_value)
+    if parsed_date is None:
+        return None
+    try:
+        parsed_time = datetime.strptime(time_value, "%H:%M:%S").time()
+    except ValueError:
+        return None
+    return datetime.combine(parsed_date, parsed_time)
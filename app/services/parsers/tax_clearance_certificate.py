@@ -0,0 +1,125 @@
+import re
+from typing import Any, Dict, Optional
+
+from pydantic import ValidationError
+
+from app.core.logging import get_logger
+from app.core.stats import register_stats_provider
+from app.core.utils.normalization import normalize_company_name, only_digits
+from app.domain.models import TaxClearanceCertificateData
+from app.services.parsers.common import (
+    FIELD_FOUND,
+    FIELD_MISSING,
+    FIELD_UNRECOGNIZED,
+    FastPathStats,
+    ParseResult,
+    join_lines,
+    parse_br_date,
+)
+
+logger = get_logger(__name__)
+
+fast_path_stats = FastPathStats()
+register_stats_provider("tax_clearance_certificate_fast_path", fast_path_stats.stats)
+
+_DATE = r"(\d{2}/\d{2}/\d{4})"
+
+_POSITIVE_WITH_NEGATIVE_EFFECTS_RE = re.compile(
+    r"CERTIDÃO\s+POSITIVA\s+COM\s+EFEITOS\s+DE\s+NEGATIVA\s+DE\s+DÉBITOS", re.I
+)
+_NEGATIVE_RE = re.compile(r"CERTIDÃO\s+NEGATIVA\s+DE\s+DÉBITOS", re.I)
+_NO_PENDING_DEBTS_RE = re.compile(r"não\s+constam\s+pendências", re.I)
+_HOLDER_RE = re.compile(
+    r"Nome:\s*(?P<name>.+?)\s*CNPJ:\s*(?P<cnpj>\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2})(?!\d)", re.S
+)
+_ISSUE_DATE_RE = re.compile(
+    rf"Data\s+de\s+emissão:\s*{_DATE}|Emitida\s+às\s+\d{{2}}:\d{{2}}:\d{{2}}\s+do\s+dia\s+{_DATE}",
+    re.I,
+)
+_EXPIRATION_DATE_RE = re.compile(rf"Válida\s+até:?\s*{_DATE}", re.I)
+_CONTROL_CODE_RE = re.compile(
+    r"Código\s+de\s+controle\s+da\s+certidão:\s*([0-9A-Z]{4}(?:\.[0-9A-Z]{4}){3})", re.I
+)
+
+_DOCUMENT_TYPE_BY_STATUS = {
+    "NEGATIVA": "Certidão Negativa de Débitos",
+    "POSITIVA COM EFEITOS DE NEGATIVA": "Certidão Positiva com Efeitos de Negativa de Débitos",
+}
+
+_LEGAL_NATURE_SUFFIXES = (
+    "empresa individual de responsabilidade limitada",
+    "sociedade anonima",
+    "limitada",
+)
+
+
+def _detect_status(text: str) -> Optional[str]:
+    if _POSITIVE_WITH_NEGATIVE_EFFECTS_RE.search(text):
+        return "POSITIVA COM EFEITOS DE NEGATIVA"
+    if _NEGATIVE_RE.search(text) and _NO_PENDING_DEBTS_RE.search(text):
+        return "NEGATIVA"
+    return None
+
+
+def _infer_legal_nature(company_name: str) -> Optional[str]:
+    for suffix in _LEGAL_NATURE_SUFFIXES:
+        if company_name.endswith(suffix):
+            return suffix
+    return None
+
+
+def _field_confidence(found: bool, value: Any) -> float:
+    if not found:
+        return FIELD_MISSING
+    return FIELD_FOUND if value is not None else FIELD_UNRECOGNIZED
+
+
+def parse_tax_clearance_certificate(text: str) -> ParseResult[TaxClearanceCertificateData]:
+    holder = _HOLDER_RE.search(text)
+    issue_date = _ISSUE_DATE_RE.search(text)
+    expiration_date = _EXPIRATION_DATE_RE.search(text)
+    control_code = _CONTROL_CODE_RE.search(text)
+
+    company_name = normalize_company_name(join_lines(holder.group("name"))) if holder else ""
+    values: Dict[str, Any] = {
+        "razao_social": company_name or None,
+        "natureza_juridica": _infer_legal_nature(company_name),
+        "cnpj": only_digits(holder.group("cnpj")) if holder else None,
+        "data_emissao": parse_br_date(issue_date.group(1) or issue_date.group(2)) if issue_date else None,
+        "data_validade": parse_br_date(expiration_date.group(1)) if expiration_date else None,
+        "status": _detect_status(text),
+        "codigo_controle": control_code.group(1).upper() if control_code else None,
+    }
+
+    if (
+        values["data_emissao"] is not None
+        and values["data_validade"] is not None
+        and values["data_validade"] < values["data_emissao"]
+    ):
+        values["data_validade"] = None
+
+    confidence = {
+        "razao_social": _field_confidence(holder is not None, values["razao_social"]),
+        "natureza_juridica": _field_confidence(holder is not None, values["natureza_juridica"]),
+        "cnpj": _field_confidence(holder is not None, values["cnpj"]),
+        "data_emissao": _field_confidence(issue_date is not None, values["data_emissao"]),
+        "data_validade": _field_confidence(expiration_date is not None, values["data_validade"]),
+        "status": _field_confidence(True, values["status"]),
+        "codigo_controle": _field_confidence(control_code is not None, values["codigo_controle"]),
+    }
+
+    data: Optional[TaxClearanceCertificateData] = None
+    if all(score >= FIELD_FOUND for score in confidence.values()):
+        try:
+            data = TaxClearanceCertificateData.model_validate(
+                {"tipo_documento": _DOCUMENT_TYPE_BY_STATUS[values["status"]], **values}
+            )
+        except ValidationError as exc:
+            logger.warning(
+                "Tax clearance certificate fast path produced invalid data",
+                extra={"data": {"errors": exc.errors()}},
+            )
+
+    result = ParseResult(data=data, field_confidence=confidence)
+    fast_path_stats.record(result.is_confident)
+    return result
@@ -0,0 +1,16 @@
+import io
+from typing import List, Tuple
+
+from pypdf import PdfReader
+
+
+def extract_pages_text(data: bytes) -> Tuple[List[str], int]:
+    reader = PdfReader(io.BytesIO(data))
+
+    texts: List[str] = []
+    for page in reader.pages:
+        page_text = page.extract_text() or ""
+        if page_text.strip():
+            texts.append(page_text)
+
+    return texts, len(reader.pages)
@@ -0,0 +1,234 @@
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from app.core.logging import get_logger
+from app.core.metrics import stage_duration
+from app.core.stats import register_stats_provider
+from app.core.tracing import span
+
+logger = get_logger(__name__)
+
+NodeFunction = Callable[..., Union[Any, Awaitable[Any]]]
+NodeCallback = Callable[[str, Any], None]
+SkipCallback = Callable[[str], None]
+
+
+@dataclass(frozen=True)
+class PipelineNode:
+    name: str
+    func: NodeFunction
+    deps: Tuple[str, ...] = ()
+
+
+@dataclass
+class NodeTiming:
+    started_at: float = 0.0
+    finished_at: float = 0.0
+
+
+class _PipelineStats:
+    def __init__(self) -> None:
+        self.runs = 0
+        self.failed_runs = 0
+        self.cancelled_nodes = 0
+        self.cancelled_running_seconds = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "failed_runs": self.failed_runs,
+            "cancelled_nodes": self.cancelled_nodes,
+            "cancelled_running_ms": round(self.cancelled_running_seconds * 1000, 1),
+        }
+
+
+pipeline_stats = _PipelineStats()
+register_stats_provider("pipeline", pipeline_stats.stats)
+
+
+class Pipeline:
+    def __init__(
+        self,
+        name: str,
+        nodes: Sequence[PipelineNode],
+        on_node_completed: Optional[NodeCallback] = None,
+        on_node_skipped: Optional[SkipCallback] = None,
+    ) -> None:
+        self.name = name
+        self._nodes = {node.name: node for node in nodes}
+        self._on_node_completed = on_node_completed
+        self._on_node_skipped = on_node_skipped
+        self._order = self._topological_order()
+        self._timings: Dict[str, NodeTiming] = {}
+        self._tasks: Dict[str, "asyncio.Task[Any]"] = {}
+        self._skipped: Dict[str, Any] = {}
+        self._entered: Set[str] = set()
+        self._cancelled: Dict[str, float] = {}
+        self._started_at = 0.0
+
+    def _topological_order(self) -> List[str]:
+        order: List[str] = []
+        state: Dict[str, str] = {}
+
+        def visit(name: str) -> None:
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Cycle detected in pipeline at node: {name}")
+            if name not in self._nodes:
+                raise ValueError(f"Unknown pipeline node: {name}")
+            state[name] = "visiting"
+            for dep in self._nodes[name].deps:
+                visit(dep)
+            state[name] = "done"
+            order.append(name)
+
+        for name in self._nodes:
+            visit(name)
+        return order
+
+    def _elapsed(self) -> float:
+        return time.perf_counter() - self._started_at
+
+    @property
+    def skipped(self) -> List[str]:
+        return [name for name in self._order if name in self._skipped]
+
+    def skip(self, name: str, value: Any = None) -> bool:
+        if name not in self._nodes:
+            raise ValueError(f"Unknown pipeline node: {name}")
+        task = self._tasks.get(name)
+        if name in self._skipped or (task is not None and task.done()):
+            return False
+
+        self._skipped[name] = value
+        if task is not None and name in self._entered:
+            task.cancel()
+        logger.info(
+            "Pipeline node skipped",
+            extra={
+                "data": {
+                    "pipeline": self.name,
+                    "node": name,
+                    "started": bool(self._timings[name].started_at),
+                    "elapsed_ms": round(self._elapsed() * 1000, 1),
+                },
+            },
+        )
+        if self._on_node_skipped is not None:
+            self._on_node_skipped(name)
+        return True
+
+    async def _run_node(self, node: PipelineNode) -> Any:
+        self._entered.add(node.name)
+        if node.name in self._skipped:
+            return self._skipped[node.name]
+        try:
+            dep_results = await asyncio.gather(*(asyncio.shield(self._tasks[dep]) for dep in node.deps))
+            if node.name in self._skipped:
+                return self._skipped[node.name]
+
+            timing = self._timings[node.name]
+            timing.started_at = self._elapsed()
+            with span("pipeline.node", pipeline=self.name, node=node.name):
+                result = node.func(*dep_results)
+                if inspect.isawaitable(result):
+                    result = await result
+            timing.finished_at = self._elapsed()
+        except asyncio.CancelledError:
+            if node.name not in self._skipped:
+                self._record_cancelled(node.name)
+                raise
+            asyncio.current_task().uncancel()
+            return self._skipped[node.name]
+
+        stage_duration.observe(timing.finished_at - timing.started_at, pipeline=self.name, stage=node.name)
+        logger.info(
+            "Pipeline node completed",
+            extra={
+                "data": {
+                    "pipeline": self.name,
+                    "node": node.name,
+                    "started_ms": round(timing.started_at * 1000, 1),
+                    "duration_ms": round((timing.finished_at - timing.started_at) * 1000, 1),
+                },
+            },
+        )
+        if self._on_node_completed is not None:
+            self._on_node_completed(node.name, result)
+        return result
+
+    def _record_cancelled(self, name: str) -> None:
+        timing = self._timings[name]
+        running_seconds = self._elapsed() - timing.started_at if timing.started_at else 0.0
+        self._cancelled[name] = running_seconds
+        pipeline_stats.cancelled_nodes += 1
+        pipeline_stats.cancelled_running_seconds += running_seconds
+
+    def _critical_path(self) -> List[str]:
+        finished = {name: timing for name, timing in self._timings.items() if timing.finished_at}
+        if not finished:
+            return []
+
+        path = [max(finished, key=lambda name: finished[name].finished_at)]
+        while True:
+            deps = [dep for dep in self._nodes[path[-1]].deps if dep in finished]
+            if not deps:
+                break
+            path.append(max(deps, key=lambda name: finished[name].finished_at))
+        return list(reversed(path))
+
+    def _log_summary(self, failed: bool) -> None:
+        logger.info(
+            "Pipeline failed" if failed else "Pipeline completed",
+            extra={
+                "data": {
+                    "pipeline": self.name,
+                    "total_ms": round(self._elapsed() * 1000, 1),
+                    "critical_path": self._critical_path(),
+                    "nodes": {
+                        name: {
+                            "started_ms": round(timing.started_at * 1000, 1),
+                            "duration_ms": round((timing.finished_at - timing.started_at) * 1000, 1),
+                        }
+                        for name, timing in self._timings.items()
+                        if timing.finished_at
+                    },
+                    "skipped": self.skipped,
+                    "cancelled": {
+                        name: {"running_ms": round(running_seconds * 1000, 1)}
+                        for name, running_seconds in self._cancelled.items()
+                    },
+                },
+            },
+        )
+
+    async def run(self) -> Dict[str, Any]:
+        self._started_at = time.perf_counter()
+        self._timings = {name: NodeTiming() for name in self._order}
+        self._skipped = {}
+        self._entered = set()
+        self._cancelled = {}
+        self._tasks = {}
+        pipeline_stats.runs += 1
+
+        failed = True
+        try:
+            async with asyncio.TaskGroup() as group:
+                for name in self._order:
+                    self._tasks[name] = group.create_task(
+                        self._run_node(self._nodes[name]),
+                        name=f"{self.name}:{name}",
+                    )
+            failed = False
+        except BaseExceptionGroup as group_error:
+            raise group_error.exceptions[0] from None
+        finally:
+            if failed:
+                pipeline_stats.failed_runs += 1
+            self._log_summary(failed)
+
+        return {name: task.result() for name, task in self._tasks.items()}
@@ -115,6 +115,14 @@ __DOCUMENT_TEXT__
 """.strip()
 
 
+ARTICLES_OF_ASSOCIATION_CHUNK_PROMPT: Final[str] = ARTICLES_OF_ASSOCIATION_PROMPT.replace(
+    "- Leia o texto do contrato social abaixo.",
+    "- O texto abaixo é apenas um TRECHO (algumas páginas consecutivas) de um contrato social extenso.\n"
+    "- Extraia somente as informações presentes neste trecho; não deduza dados de outras partes do contrato.\n"
+    "- Use null para campos e objetos que não aparecem no trecho e listas vazias quando não houver itens.",
+)
+
+
 TAX_CLEARANCE_CERTIFICATE_PROMPT: Final[str] = """
 Você é um assistente jurídico especializado em certidões negativas de débitos federais.
 
@@ -153,11 +161,19 @@ Critérios de Análise:
 - Use análise semântica para identificar sinônimos (ex: "Desenvolvimento de software" é compatível com "Consultoria em Tecnologia").
 - "Match: True" se o CNPJ estiver 100% coberto pelo Contrato.
 - "Match: False" apenas se houver atividade no CNPJ que não tenha nenhuma relação com o texto do Contrato.
+- Avalie cada atividade CNAE individualmente e informe o resultado de cada uma em "atividades", usando o código exatamente como informado.
 
 Estrutura JSON:
 {
   "match": boolean,
-  "reason": "Justificativa clara em português (ex: 'A atividade de transporte de cargas no CNPJ não consta no objeto social')."
+  "reason": "Justificativa clara em português (ex: 'A atividade de transporte de cargas no CNPJ não consta no objeto social').",
+  "atividades": [
+    {
+      "codigo": "string (código CNAE exatamente como informado)",
+      "contemplada": boolean,
+      "justificativa": "string (motivo em português, obrigatório quando contemplada for false)"
+    }
+  ]
 }
 
 Objeto Social: __OBJETO_SOCIAL__
@@ -167,6 +183,7 @@ Atividades CNPJ: __ATIVIDADES__
 
 PROMPTS: Final[dict[str, str]] = {
     "articles_of_association": ARTICLES_OF_ASSOCIATION_PROMPT,
+    "articles_of_association_chunk": ARTICLES_OF_ASSOCIATION_CHUNK_PROMPT,
     "cnpj_card": CNPJ_CARD_PROMPT,
     "tax_clearance_certificate": TAX_CLEARANCE_CERTIFICATE_PROMPT,
     "business_purpose_validation": BUSINESS_PURPOSE_VALIDATION_PROMPT,
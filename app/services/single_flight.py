@@ -0,0 +1,77 @@
+import asyncio
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.tracing import get_trace_id, span
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Flight:
+    task: "asyncio.Task[Any]"
+    trace_id: Optional[str] = None
+    waiters: int = 0
+
+
+class SingleFlight:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._flights: Dict[str, _Flight] = {}
+
+        self.executions = 0
+        self.coalesced = 0
+        self.abandoned = 0
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    async def run(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        if not settings.single_flight_enabled:
+            return await func()
+
+        flight = self._flights.get(key)
+        waiting: Any = nullcontext()
+        if flight is None:
+            flight = _Flight(task=asyncio.ensure_future(func()), trace_id=get_trace_id())
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _task: self._forget(key, flight))
+            self.executions += 1
+        else:
+            self.coalesced += 1
+            logger.info(
+                "Coalesced with in-flight call",
+                extra={
+                    "data": {
+                        "single_flight": self.name,
+                        "waiters": flight.waiters + 1,
+                        "coalesced_with": flight.trace_id,
+                    },
+                },
+            )
+            waiting = span("single_flight.wait", single_flight=self.name, coalesced_with=flight.trace_id)
+
+        flight.waiters += 1
+        try:
+            with waiting:
+                return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                self._forget(key, flight)
+                flight.task.cancel()
+                self.abandoned += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "abandoned": self.abandoned,
+            "in_flight": len(self._flights),
+        }
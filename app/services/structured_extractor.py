@@ -1,23 +1,90 @@
-from typing import Any, Dict
+import asyncio
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type, TypeVar
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
+from app.core.config import settings
 from app.core.exceptions import DocumentValidationError
 from app.core.logging import get_logger
+from app.core.stats import register_stats_provider
 from app.domain.models import (
     ArticlesOfAssociationData,
     CNPJCardData,
     TaxClearanceCertificateData,
 )
+from app.services.cache import TieredCache, build_cache_key, sha256_hex
+from app.services.chunking import chunk_pages, merge_articles_of_association, split_pages
 from app.services.llm_client import call_llm_and_parse
-from app.services.prompts import build_prompt
+from app.services.parsers.articles_sections import select_relevant_text
+from app.services.parsers.cnpj_card import parse_cnpj_card
+from app.services.parsers.tax_clearance_certificate import parse_tax_clearance_certificate
+from app.services.prompts import PROMPTS, build_prompt
+from app.services.single_flight import SingleFlight
 
 logger = get_logger(__name__)
 
+DocumentModel = TypeVar("DocumentModel", bound=BaseModel)
+
+extraction_cache = TieredCache(
+    name="extraction",
+    directory=settings.extraction_cache_dir,
+    memory_max_entries=settings.extraction_cache_memory_max_entries,
+    disk_max_entries=settings.extraction_cache_disk_max_entries,
+    ttl_seconds=settings.extraction_cache_ttl_seconds,
+)
+register_stats_provider("extraction_cache", extraction_cache.stats)
+
+extraction_flight = SingleFlight("extraction")
+register_stats_provider("single_flight_extraction", extraction_flight.stats)
+
+
+def _extraction_cache_key(prompt_name: str, text: str) -> str:
+    return build_cache_key(
+        prompt_name,
+        sha256_hex(PROMPTS[prompt_name]),
+        settings.openrouter_model,
+        settings.openrouter_temperature,
+        sha256_hex(text),
+    )
+
 
 async def _extract_with_prompt(prompt_name: str, text: str) -> Dict[str, Any]:
     user_content = build_prompt(prompt_name, {"document_text": text})
-    return await call_llm_and_parse(user_content)
+    return await call_llm_and_parse(user_content, prompt_name=prompt_name)
+
+
+async def _extract_document(
+    document_type: str,
+    model: Type[DocumentModel],
+    text: str,
+    prompt_name: Optional[str] = None,
+    extract: Optional[Callable[[], Awaitable[Dict[str, Any]]]] = None,
+) -> DocumentModel:
+    prompt_name = prompt_name or document_type
+    extract = extract or partial(_extract_with_prompt, prompt_name, text)
+
+    cache_key = None
+    if settings.extraction_cache_enabled:
+        cache_key = _extraction_cache_key(prompt_name, text)
+        cached = await extraction_cache.get(cache_key)
+        if cached is not None:
+            logger.info(
+                "Structured extraction cache hit",
+                extra={"data": {"document_type": document_type}},
+            )
+            return model.model_validate(cached)
+
+    json_data = await extract()
+    try:
+        document = model.model_validate(json_data)
+    except ValidationError as exc:
+        _handle_validation_error(document_type, exc, json_data)
+
+    if cache_key is not None:
+        await extraction_cache.set(cache_key, json_data)
+
+    return document
 
 
 def _handle_validation_error(
@@ -28,21 +95,20 @@ def _handle_validation_error(
         extra={
             "data": {
                 "document_type": document_type,
-                "validation_errors": validation_error.errors(),
+                "validation_errors": validation_error.errors(include_url=False, include_input=False),
                 "json_keys": list(json_data.keys()) if json_data else None,
-                "json_data": json_data,
             },
         },
     )
-    
+
     document_names = {
         "articles_of_association": "Contrato Social",
         "cnpj_card": "Cartão CNPJ",
         "tax_clearance_certificate": "Certidão Negativa de Débitos Federais",
     }
-    
+
     document_name = document_names.get(document_type, document_type)
-    
+
     raise DocumentValidationError(
         f"Não foi possível processar o documento {document_name}. "
         f"O documento pode estar incompleto, ilegível ou em formato não suportado. "
@@ -50,26 +116,103 @@ def _handle_validation_error(
     ) from validation_error
 
 
+async def _extract_articles_in_chunks(chunks: List[str]) -> Dict[str, Any]:
+    partials = await asyncio.gather(
+        *(_extract_with_prompt("articles_of_association_chunk", chunk) for chunk in chunks)
+    )
+    return merge_articles_of_association(partials)
+
+
+async def _extract_articles_of_association_data(text: str) -> ArticlesOfAssociationData:
+    if settings.articles_section_index_enabled:
+        relevant_text = select_relevant_text(text)
+        if relevant_text is None:
+            logger.info("Articles of association section index found no clauses, using full text")
+        else:
+            logger.info(
+                "Articles of association reduced to relevant clauses",
+                extra={
+                    "data": {
+                        "original_chars": len(text),
+                        "reduced_chars": len(relevant_text),
+                        "reduction_ratio": round(1 - len(relevant_text) / len(text), 4) if text else 0.0,
+                    },
+                },
+            )
+            text = relevant_text
+
+    if len(text) > settings.articles_chunking_threshold_chars:
+        chunks = chunk_pages(
+            split_pages(text),
+            max_chars=settings.articles_chunk_max_chars,
+            overlap_pages=settings.articles_chunk_overlap_pages,
+        )
+        if len(chunks) > 1:
+            logger.info(
+                "Articles of association extracted in chunks",
+                extra={
+                    "data": {
+                        "chars": len(text),
+                        "chunks": len(chunks),
+                        "largest_chunk_chars": max(len(chunk) for chunk in chunks),
+                    },
+                },
+            )
+            return await _extract_document(
+                "articles_of_association",
+                ArticlesOfAssociationData,
+                text,
+                prompt_name="articles_of_association_chunk",
+                extract=partial(_extract_articles_in_chunks, chunks),
+            )
+
+    return await _extract_document("articles_of_association", ArticlesOfAssociationData, text)
+
+
+async def _extract_cnpj_card_data(text: str) -> CNPJCardData:
+    if settings.cnpj_card_fast_path_enabled:
+        parsed = parse_cnpj_card(text)
+        if parsed.is_confident:
+            logger.info("CNPJ card parsed by deterministic fast path")
+            return parsed.data
+        logger.info(
+            "CNPJ card fast path fallback to LLM",
+            extra={"data": {"uncertain_fields": parsed.uncertain_fields}},
+        )
+
+    return await _extract_document("cnpj_card", CNPJCardData, text)
+
+
+async def _extract_tax_clearance_certificate_data(text: str) -> TaxClearanceCertificateData:
+    if settings.tax_clearance_fast_path_enabled:
+        parsed = parse_tax_clearance_certificate(text)
+        if parsed.is_confident:
+            logger.info("Tax clearance certificate parsed by deterministic fast path")
+            return parsed.data
+        logger.info(
+            "Tax clearance certificate fast path fallback to LLM",
+            extra={"data": {"uncertain_fields": parsed.uncertain_fields}},
+        )
+
+    return await _extract_document("tax_clearance_certificate", TaxClearanceCertificateData, text)
+
+
 async def extract_articles_of_association_data(text: str) -> ArticlesOfAssociationData:
-    json_data = await _extract_with_prompt("articles_of_association", text)
-    try:
-        return ArticlesOfAssociationData.model_validate(json_data)
-    except ValidationError as exc:
-        _handle_validation_error("articles_of_association", exc, json_data)
+    return await extraction_flight.run(
+        build_cache_key("articles_of_association", sha256_hex(text)),
+        partial(_extract_articles_of_association_data, text),
+    )
 
 
 async def extract_cnpj_card_data(text: str) -> CNPJCardData:
-    json_data = await _extract_with_prompt("cnpj_card", text)
-    try:
-        return CNPJCardData.model_validate(json_data)
-    except ValidationError as exc:
-        _handle_validation_error("cnpj_card", exc, json_data)
+    return await extraction_flight.run(
+        build_cache_key("cnpj_card", sha256_hex(text)),
+        partial(_extract_cnpj_card_data, text),
+    )
 
 
 async def extract_tax_clearance_certificate_data(text: str) -> TaxClearanceCertificateData:
-    json_data = await _extract_with_prompt("tax_clearance_certificate", text)
-    try:
-        return TaxClearanceCertificateData.model_validate(json_data)
-    except ValidationError as exc:
-        _handle_validation_error("tax_clearance_certificate", exc, json_data)
-
+    return await extraction_flight.run(
+        build_cache_key("tax_clearance_certificate", sha256_hex(text)),
+        partial(_extract_tax_clearance_certificate_data, text),
+    )
@@ -1,11 +1,63 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
 from fastapi import UploadFile
-from pypdf import PdfReader
 
+from app.core.config import settings
 from app.core.exceptions import InvalidFileTypeError, PDFExtractionError
 from app.core.logging import get_logger
+from app.core.tracing import span
+from app.services.chunking import PAGE_SEPARATOR
+from app.services.pdf_worker import extract_pages_text
 
 logger = get_logger(__name__)
 
+_executor: Optional[Executor] = None
+
+
+def _build_executor() -> Executor:
+    if settings.pdf_executor_kind == 'thread':
+        return ThreadPoolExecutor(
+            max_workers=settings.pdf_executor_max_workers,
+            thread_name_prefix='pdf-parser',
+        )
+    return ProcessPoolExecutor(
+        max_workers=settings.pdf_executor_max_workers,
+        max_tasks_per_child=settings.pdf_executor_max_tasks_per_child,
+    )
+
+
+def start_pdf_executor() -> None:
+    global _executor
+    if _executor is None:
+        _executor = _build_executor()
+        logger.info(
+            "PDF executor started",
+            extra={
+                "data": {
+                    "kind": settings.pdf_executor_kind,
+                    "max_workers": settings.pdf_executor_max_workers,
+                    "max_tasks_per_child": settings.pdf_executor_max_tasks_per_child,
+                },
+            },
+        )
+
+
+def shutdown_pdf_executor(wait: bool = True) -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=wait, cancel_futures=True)
+        _executor = None
+        logger.info("PDF executor stopped")
+
+
+def get_pdf_executor() -> Executor:
+    if _executor is None:
+        start_pdf_executor()
+    return _executor
+
 
 def validate_pdf_file(file: UploadFile) -> None:
     if not file.filename.lower().endswith('.pdf'):
@@ -17,21 +69,50 @@ def validate_pdf_file(file: UploadFile) -> None:
 
 async def extract_text_from_pdf(file: UploadFile) -> str:
     validate_pdf_file(file)
-    
-    reader = PdfReader(file.file)
+    filename_info = f" '{file.filename}'" if file.filename else ""
 
-    texts: list[str] = []
-    for page in reader.pages:
-        page_text = page.extract_text() or ""
-        if page_text.strip():
-            texts.append(page_text)
+    await file.seek(0)
+    data = await file.read()
 
-    full_text = "\n\n".join(texts).strip()
+    with span('pdf.parse', filename=file.filename, size_bytes=len(data)) as parse_span:
+        loop = asyncio.get_running_loop()
+        try:
+            texts, page_count = await asyncio.wait_for(
+                loop.run_in_executor(get_pdf_executor(), extract_pages_text, data),
+                timeout=settings.pdf_parse_timeout_seconds,
+            )
+        except asyncio.TimeoutError as exc:
+            logger.error(
+                "PDF extraction timeout",
+                extra={
+                    "data": {
+                        "filename": file.filename,
+                        "size_bytes": len(data),
+                        "timeout_seconds": settings.pdf_parse_timeout_seconds,
+                    },
+                },
+            )
+            raise PDFExtractionError(
+                f"O processamento do PDF{filename_info} excedeu o tempo limite. "
+                f"Verifique se o arquivo está válido e tente novamente."
+            ) from exc
+        except BrokenProcessPool as exc:
+            logger.error(
+                "PDF executor worker crashed",
+                extra={"data": {"filename": file.filename, "size_bytes": len(data)}},
+            )
+            shutdown_pdf_executor(wait=False)
+            raise PDFExtractionError(
+                f"Não foi possível processar o PDF{filename_info}. "
+                f"Verifique se o arquivo está válido e não está corrompido."
+            ) from exc
+        parse_span.set_attribute('pages', page_count)
+
+    full_text = PAGE_SEPARATOR.join(texts).strip()
     if not full_text:
-        filename_info = f" '{file.filename}'" if file.filename else ""
         logger.error(
             "PDF extraction failed",
-            extra={"data": {"filename": file.filename, "pages": len(reader.pages)}},
+            extra={"data": {"filename": file.filename, "pages": page_count}},
         )
         raise PDFExtractionError(
             f"Não foi possível extrair texto do PDF{filename_info}. "
@@ -39,4 +120,3 @@ async def extract_text_from_pdf(file: UploadFile) -> str:
         )
 
     return full_text
-
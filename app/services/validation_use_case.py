@@ -1,15 +1,31 @@
 import asyncio
+import io
+import time
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from fastapi import UploadFile
 
-from app.api.v1.schemas import ValidationResultResponse
+from app.api.v1.schemas import EvaluationPolicy, Inconsistency, ValidationResultResponse
+from app.core.config import settings
+from app.core.exceptions import DocumentValidationError, LLMUnavailableError
 from app.core.logging import get_logger
-from app.domain.models import (
-    ArticlesOfAssociationData,
-    CNPJCardData,
-    TaxClearanceCertificateData,
+from app.core.metrics import counter, histogram
+from app.core.stats import register_stats_provider
+from app.core.tracing import span
+from app.domain.document_validator import (
+    BUSINESS_PURPOSE_DOCUMENTS,
+    DETERMINISTIC_VALIDATORS,
+    LLM_VALIDATORS,
+    build_validation_result,
+    is_outcome_decided,
 )
-from app.domain.document_validator import validate_documents_domain
+from app.domain.validators.business_purpose import validate_business_purpose_consistency
+from app.domain.validators.cnpj import triage_cnpj_consistency
+from app.services.cache import build_cache_key, sha256_hex
+from app.services.llm_client import LLMUsage, track_llm_usage
+from app.services.pipeline import NodeCallback, Pipeline, PipelineNode, SkipCallback
+from app.services.single_flight import SingleFlight
 from app.services.text_extractor import extract_text_from_pdf
 from app.services.structured_extractor import (
     extract_articles_of_association_data,
@@ -20,37 +36,218 @@ from app.services.structured_extractor import (
 
 logger = get_logger(__name__)
 
+DOCUMENT_EXTRACTORS = {
+    "articles": extract_articles_of_association_data,
+    "cnpj_card": extract_cnpj_card_data,
+    "certificate": extract_tax_clearance_certificate_data,
+}
+
+TRIAGE_NODE = "cnpj_triage"
+
+validation_flight = SingleFlight("validation")
+register_stats_provider("single_flight_validation", validation_flight.stats)
+
+validation_outcomes = counter(
+    "valida_validations_total",
+    "Completed validations by outcome (APROVADO, REPROVADO, PENDENTE or ERRO).",
+    ("status",),
+)
+validation_inconsistencies = counter(
+    "valida_inconsistencies_total",
+    "Inconsistencies reported by validations, by field and severity.",
+    ("field", "severity"),
+)
+validation_duration = histogram(
+    "valida_validation_duration_seconds",
+    "End-to-end duration of a validation, by outcome.",
+    ("status",),
+)
+
+
+def _triage_cnpj(cnpj_card_text: str, certificate_text: str) -> List[Inconsistency]:
+    inconsistencies = triage_cnpj_consistency(cnpj_card_text, certificate_text)
+    if inconsistencies:
+        logger.warning(
+            "CNPJ triage found documents from different companies",
+            extra={"data": {"values": inconsistencies[0].values, "action": settings.cnpj_triage_on_mismatch}},
+        )
+        if settings.cnpj_triage_on_mismatch == "reject":
+            values = inconsistencies[0].values
+            raise DocumentValidationError(
+                "Os documentos enviados pertencem a empresas diferentes: "
+                f"CNPJ {values['cartao_cnpj']} no cartão CNPJ e {values['certidao_negativa']} na certidão negativa."
+            )
+    return inconsistencies
+
+
+def _after_triage(extractor: Any) -> Any:
+    def extract(text: str, _triage: List[Inconsistency]) -> Any:
+        return extractor(text)
+
+    return extract
+
+
+CHECK_DOCUMENTS: Dict[str, Tuple[str, ...]] = {
+    **{name: document_names for name, _validator, document_names in DETERMINISTIC_VALIDATORS},
+    **{check: BUSINESS_PURPOSE_DOCUMENTS for check in LLM_VALIDATORS},
+}
+
+
+def _degradable(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    async def run(*args: Any) -> Any:
+        try:
+            return await func(*args)
+        except LLMUnavailableError:
+            if not settings.llm_degraded_mode_enabled:
+                raise
+            return None
+
+    return run
+
+
+def _collect_result(*inconsistency_groups: Optional[List[Inconsistency]]) -> ValidationResultResponse:
+    return build_validation_result(
+        inconsistency for group in inconsistency_groups if group for inconsistency in group
+    )
+
+
+def build_validation_pipeline(
+    files: Dict[str, UploadFile],
+    on_node_completed: Optional[NodeCallback] = None,
+    on_node_skipped: Optional[SkipCallback] = None,
+) -> Pipeline:
+    nodes: List[PipelineNode] = []
+    validator_nodes: List[str] = []
+
+    if settings.cnpj_triage_enabled:
+        nodes.append(PipelineNode(TRIAGE_NODE, _triage_cnpj, deps=("cnpj_card_text", "certificate_text")))
+        validator_nodes.append(TRIAGE_NODE)
+
+    for document_name, file in files.items():
+        nodes.append(PipelineNode(f"{document_name}_text", partial(extract_text_from_pdf, file)))
+        if settings.cnpj_triage_enabled:
+            nodes.append(
+                PipelineNode(
+                    document_name,
+                    _degradable(_after_triage(DOCUMENT_EXTRACTORS[document_name])),
+                    deps=(f"{document_name}_text", TRIAGE_NODE),
+                )
+            )
+        else:
+            nodes.append(
+                PipelineNode(
+                    document_name,
+                    _degradable(DOCUMENT_EXTRACTORS[document_name]),
+                    deps=(f"{document_name}_text",),
+                )
+            )
+
+    for validator_name, validator, document_names in DETERMINISTIC_VALIDATORS:
+        nodes.append(PipelineNode(f"validate_{validator_name}", validator, deps=document_names))
+        validator_nodes.append(f"validate_{validator_name}")
+
+    nodes.append(
+        PipelineNode(
+            "validate_business_purpose",
+            _degradable(validate_business_purpose_consistency),
+            deps=BUSINESS_PURPOSE_DOCUMENTS,
+        )
+    )
+    validator_nodes.append("validate_business_purpose")
+
+    nodes.append(PipelineNode("result", _collect_result, deps=tuple(validator_nodes)))
+
+    return Pipeline(
+        "document_validation",
+        nodes,
+        on_node_completed=on_node_completed,
+        on_node_skipped=on_node_skipped,
+    )
+
 
 async def validate_supplier_documents_use_case(
     articles_of_association_file: UploadFile,
     cnpj_card_file: UploadFile,
     tax_clearance_certificate_file: UploadFile,
+    policy: Optional[EvaluationPolicy] = None,
+    on_node_completed: Optional[NodeCallback] = None,
+    on_node_skipped: Optional[SkipCallback] = None,
+    llm_usage: Optional[LLMUsage] = None,
 ) -> ValidationResultResponse:
-    logger.info("Starting document validation")
-    
-    logger.info("Starting PDF text extraction")
-    articles_text, cnpj_card_text, certificate_text = await asyncio.gather(
-        extract_text_from_pdf(articles_of_association_file),
-        extract_text_from_pdf(cnpj_card_file),
-        extract_text_from_pdf(tax_clearance_certificate_file),
-    )
-    logger.info("PDF text extraction completed")
+    policy = policy or settings.validation_policy
+    logger.info("Starting document validation", extra={"data": {"policy": policy}})
 
-    logger.info("Starting structured data extraction with LLM")
-    articles_data, cnpj_card_data, certificate_data = await asyncio.gather(
-        extract_articles_of_association_data(articles_text),
-        extract_cnpj_card_data(cnpj_card_text),
-        extract_tax_clearance_certificate_data(certificate_text),
-    )
-    logger.info("Structured data extraction completed")
+    found: List[Inconsistency] = []
+    unavailable: List[str] = []
+    reported_by_triage: List[str] = []
+
+    def handle_node_completed(node_name: str, result: Any) -> None:
+        if on_node_completed is not None:
+            on_node_completed(node_name, result)
+        if result is None and (node_name in DOCUMENT_EXTRACTORS or node_name.startswith("validate_")):
+            unavailable.append(node_name)
+            for check, document_names in CHECK_DOCUMENTS.items():
+                if node_name in document_names:
+                    pipeline.skip(f"validate_{check}", [])
+            return
+        if node_name == TRIAGE_NODE and result:
+            reported_by_triage.append("validate_cnpj")
+            for document_name in DOCUMENT_EXTRACTORS:
+                pipeline.skip(document_name)
+            for check in (*(name for name, _, _ in DETERMINISTIC_VALIDATORS), *LLM_VALIDATORS):
+                pipeline.skip(f"validate_{check}", [])
+            return
+        if policy != "fail-fast" or not node_name.startswith("validate_"):
+            return
+        found.extend(result)
+        if is_outcome_decided(found):
+            for check in LLM_VALIDATORS:
+                if f"validate_{check}" != node_name:
+                    pipeline.skip(f"validate_{check}", [])
 
-    logger.info("Starting domain validation")
-    result = await validate_documents_domain(
-        articles=articles_data,
-        cnpj_card=cnpj_card_data,
-        certificate=certificate_data,
+    def handle_node_skipped(node_name: str) -> None:
+        if on_node_skipped is not None and node_name not in reported_by_triage:
+            on_node_skipped(node_name)
+
+    pipeline = build_validation_pipeline(
+        {
+            "articles": articles_of_association_file,
+            "cnpj_card": cnpj_card_file,
+            "certificate": tax_clearance_certificate_file,
+        },
+        on_node_completed=handle_node_completed,
+        on_node_skipped=handle_node_skipped,
     )
-    logger.info("Domain validation completed")
+    started_at = time.perf_counter()
+    try:
+        with track_llm_usage(llm_usage) as llm_usage, span("validation", policy=policy):
+            results = await pipeline.run()
+    except Exception:
+        validation_outcomes.inc(status="ERRO")
+        validation_duration.observe(time.perf_counter() - started_at, status="ERRO")
+        raise
+    result: ValidationResultResponse = results["result"]
+    result.skipped_checks = [
+        node_name[len("validate_"):]
+        for node_name in (*pipeline.skipped, *unavailable)
+        if node_name.startswith("validate_") and node_name not in reported_by_triage
+    ]
+    if unavailable:
+        logger.warning(
+            "Document validation degraded, LLM unavailable",
+            extra={
+                "data": {
+                    "unavailable": unavailable,
+                    "skipped_checks": result.skipped_checks,
+                },
+            },
+        )
+        result = build_validation_result(result.inconsistencies, result.skipped_checks, partial=True)
+
+    validation_outcomes.inc(status=result.status)
+    validation_duration.observe(time.perf_counter() - started_at, status=result.status)
+    for inconsistency in result.inconsistencies:
+        validation_inconsistencies.inc(field=inconsistency.field, severity=inconsistency.severity)
 
     total_inconsistencies = len(result.inconsistencies)
     critical_count = sum(1 for inc in result.inconsistencies if inc.severity == "CRITICA")
@@ -70,9 +267,120 @@ async def validate_supplier_documents_use_case(
                 "critical_count": critical_count,
                 "warning_count": warning_count,
                 "inconsistencies": inconsistency_summary,
+                "skipped_checks": result.skipped_checks,
+                "llm": llm_usage.as_log(),
             },
         },
     )
 
     return result
 
+
+async def buffer_upload(file: UploadFile) -> UploadFile:
+    await file.seek(0)
+    return UploadFile(file=io.BytesIO(await file.read()), filename=file.filename)
+
+
+async def _validate_sharing_usage(
+    files: List[UploadFile], policy: EvaluationPolicy, llm_usage: LLMUsage
+) -> Tuple[ValidationResultResponse, LLMUsage]:
+    result = await validate_supplier_documents_use_case(*files, policy=policy, llm_usage=llm_usage)
+    return result, llm_usage
+
+
+async def validate_supplier_documents_coalesced(
+    articles_of_association_file: UploadFile,
+    cnpj_card_file: UploadFile,
+    tax_clearance_certificate_file: UploadFile,
+    policy: Optional[EvaluationPolicy] = None,
+) -> ValidationResultResponse:
+    policy = policy or settings.validation_policy
+    files = [
+        await buffer_upload(file)
+        for file in (articles_of_association_file, cnpj_card_file, tax_clearance_certificate_file)
+    ]
+    key = build_cache_key(policy, [[file.filename, sha256_hex(file.file.getvalue())] for file in files])
+    own_usage = LLMUsage()
+    result, llm_usage = await validation_flight.run(key, partial(_validate_sharing_usage, files, policy, own_usage))
+    if llm_usage is not own_usage:
+        logger.info(
+            "Document validation served by a coalesced execution",
+            extra={"data": {"status": result.status, "shared_llm": llm_usage.as_log()}},
+        )
+    return result
+
+
+def _node_event(node_name: str, result: Any) -> Optional[Dict[str, Any]]:
+    if result is None and node_name in DOCUMENT_EXTRACTORS:
+        return {"event": "document_unavailable", "document": node_name}
+    if result is None and node_name.startswith("validate_"):
+        return {"event": "check_unavailable", "check": node_name[len("validate_"):]}
+    if node_name.endswith("_text"):
+        return {"event": "text_extracted", "document": node_name[: -len("_text")], "chars": len(result)}
+    if node_name in DOCUMENT_EXTRACTORS:
+        return {
+            "event": "document_extracted",
+            "document": node_name,
+            "data": result.model_dump(mode="json", by_alias=True),
+        }
+    if node_name == TRIAGE_NODE:
+        return {
+            "event": "triage_completed",
+            "inconsistencies": [inconsistency.model_dump(mode="json") for inconsistency in result],
+        }
+    if node_name.startswith("validate_"):
+        return {
+            "event": "check_completed",
+            "check": node_name[len("validate_"):],
+            "inconsistencies": [inconsistency.model_dump(mode="json") for inconsistency in result],
+        }
+    return None
+
+
+async def stream_supplier_documents_validation(
+    articles_of_association_file: UploadFile,
+    cnpj_card_file: UploadFile,
+    tax_clearance_certificate_file: UploadFile,
+    policy: Optional[EvaluationPolicy] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    started_at = time.perf_counter()
+    events: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue()
+
+    def publish(event: Dict[str, Any]) -> None:
+        event["elapsed_ms"] = round((time.perf_counter() - started_at) * 1000, 1)
+        events.put_nowait(event)
+
+    def on_node_completed(node_name: str, result: Any) -> None:
+        event = _node_event(node_name, result)
+        if event is not None:
+            publish(event)
+
+    def on_node_skipped(node_name: str) -> None:
+        if node_name.startswith("validate_"):
+            publish({"event": "check_skipped", "check": node_name[len("validate_"):]})
+
+    task = asyncio.create_task(
+        validate_supplier_documents_use_case(
+            articles_of_association_file=articles_of_association_file,
+            cnpj_card_file=cnpj_card_file,
+            tax_clearance_certificate_file=tax_clearance_certificate_file,
+            policy=policy,
+            on_node_completed=on_node_completed,
+            on_node_skipped=on_node_skipped,
+        )
+    )
+    task.add_done_callback(lambda _task: events.put_nowait(None))
+
+    try:
+        while (event := await events.get()) is not None:
+            yield event
+
+        result = task.result()
+        yield {
+            "event": "result",
+            **result.model_dump(mode="json"),
+            "elapsed_ms": round((time.perf_counter() - started_at) * 1000, 1),
+        }
+    finally:
+        if not task.done():
+            task.cancel()
@@ -0,0 +1,30 @@
+import asyncio
+
+from app.core.config import settings
+from app.core.logging import get_logger, setup_logging
+from app.services.job_worker import start_job_workers, stop_job_workers
+from app.services.llm_client import close_llm_client, start_llm_client
+from app.services.text_extractor import shutdown_pdf_executor, start_pdf_executor
+
+setup_logging()
+
+logger = get_logger(__name__)
+
+
+async def run_worker() -> None:
+    start_pdf_executor()
+    await start_llm_client()
+    try:
+        pool = start_job_workers(settings.job_worker_concurrency)
+        await pool.wait()
+    finally:
+        await stop_job_workers()
+        await close_llm_client()
+        shutdown_pdf_executor()
+
+
+if __name__ == '__main__':
+    try:
+        asyncio.run(run_worker())
+    except KeyboardInterrupt:
+        logger.info("Validation job worker interrupted")
@@ -0,0 +1,70 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+CaseKey = Tuple[str, str]
+
+
+def _load(path: Path) -> Tuple[Dict[str, Any], Dict[CaseKey, Dict[str, Any]]]:
+    report = json.loads(path.read_text(encoding="utf-8"))
+    return report["metadata"], {(result["stage"], result["case"]): result for result in report["results"]}
+
+
+def _change(baseline: float, current: float) -> Optional[float]:
+    if baseline <= 0:
+        return None
+    return (current - baseline) / baseline
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--metric", default="median_us", help="timing metric to compare")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative slowdown reported as regression")
+    parser.add_argument("--memory-threshold", type=float, default=0.10, help="relative peak memory growth reported")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit with status 1 on regressions")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    baseline_metadata, baseline = _load(args.baseline)
+    current_metadata, current = _load(args.current)
+    print(f"baseline {baseline_metadata.get('git_revision')} ({baseline_metadata.get('timestamp')})")
+    print(f"current  {current_metadata.get('git_revision')} ({current_metadata.get('timestamp')})")
+
+    regressions = 0
+    for key in sorted(baseline.keys() & current.keys()):
+        before, after = baseline[key], current[key]
+        time_change = _change(before[args.metric], after[args.metric])
+        memory_change = _change(before["peak_bytes"], after["peak_bytes"])
+
+        flags = []
+        if time_change is not None and time_change > args.threshold:
+            flags.append("SLOWER")
+        elif time_change is not None and time_change < -args.threshold:
+            flags.append("faster")
+        if memory_change is not None and memory_change > args.memory_threshold:
+            flags.append("MORE MEMORY")
+        if "SLOWER" in flags or "MORE MEMORY" in flags:
+            regressions += 1
+
+        print(
+            f"{key[0]:<36} {key[1]:<56} {before[args.metric]:>12.3f} -> {after[args.metric]:>12.3f}us "
+            f"{(time_change or 0.0):>+8.1%} mem {(memory_change or 0.0):>+8.1%} {' '.join(flags)}"
+        )
+
+    for key in sorted(current.keys() - baseline.keys()):
+        print(f"{key[0]:<36} {key[1]:<56} new")
+    for key in sorted(baseline.keys() - current.keys()):
+        print(f"{key[0]:<36} {key[1]:<56} removed")
+
+    print(f"{regressions} regression(s) above {args.threshold:.0%} ({args.metric})")
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
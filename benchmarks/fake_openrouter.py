@@ -0,0 +1,221 @@
+import os
+
+os.environ.setdefault("OPENROUTER_API_KEY", "benchmark")
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from app.services.prompts import PROMPTS
+from benchmarks.fixtures import (
+    PROMPT_DOCUMENTS,
+    business_purpose_verdicts,
+    canned_payloads,
+    llm_payload_for,
+    llm_response_body,
+)
+
+DOCUMENT_PLACEHOLDER = "__DOCUMENT_TEXT__"
+
+
+@dataclass
+class FakeConfig:
+    latency: str = "lognormal"
+    latency_ms: float = 800.0
+    latency_sigma: float = 0.5
+    latency_max_ms: float = 30000.0
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after_seconds: float = 1.0
+    slow_body_rate: float = 0.0
+    slow_body_ms: float = 2000.0
+    truncated_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+def _prompt_prefixes() -> List[Tuple[str, str]]:
+    prefixes = [
+        (template.split(DOCUMENT_PLACEHOLDER, 1)[0], name)
+        for name, template in PROMPTS.items()
+        if DOCUMENT_PLACEHOLDER in template
+    ]
+    return sorted(prefixes, key=lambda item: len(item[0]), reverse=True)
+
+
+class FakeOpenRouter:
+    def __init__(self, config: FakeConfig) -> None:
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.payloads = canned_payloads()
+        self.prefixes = _prompt_prefixes()
+        self.business_purpose_prefix = PROMPTS["business_purpose_validation"].split("__", 1)[0]
+        self.requests: Counter = Counter()
+        self.outcomes: Counter = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def recognize(self, content: str) -> Tuple[str, Dict[str, Any]]:
+        if content.startswith(self.business_purpose_prefix):
+            return "business_purpose_validation", business_purpose_verdicts(content)
+
+        for prefix, prompt_name in self.prefixes:
+            if content.startswith(prefix):
+                text = content[len(prefix):]
+                payload = self.payloads.get(text.strip())
+                if payload is None:
+                    payload = llm_payload_for(PROMPT_DOCUMENTS[prompt_name], text)
+                return prompt_name, payload
+        return "unknown", {}
+
+    def latency_seconds(self) -> float:
+        config = self.config
+        if config.latency == "fixed":
+            latency_ms = config.latency_ms
+        elif config.latency == "uniform":
+            latency_ms = self.random.uniform(0.0, 2 * config.latency_ms)
+        elif config.latency == "exponential":
+            latency_ms = self.random.expovariate(1 / config.latency_ms) if config.latency_ms > 0 else 0.0
+        else:
+            latency_ms = config.latency_ms * self.random.lognormvariate(0.0, config.latency_sigma)
+        return min(latency_ms, config.latency_max_ms) / 1000
+
+    def pick_outcome(self) -> str:
+        roll = self.random.random()
+        for outcome, rate in (
+            ("rate_limited", self.config.rate_limit_rate),
+            ("error", self.config.error_rate),
+            ("truncated", self.config.truncated_rate),
+            ("slow_body", self.config.slow_body_rate),
+        ):
+            if roll < rate:
+                return outcome
+            roll -= rate
+        return "ok"
+
+    async def chat_completions(self, request: Request) -> Response:
+        body = await request.json()
+        content = "\n".join(message.get("content", "") for message in body.get("messages", []))
+        prompt_name, payload = self.recognize(content)
+        outcome = self.pick_outcome()
+        self.requests[prompt_name] += 1
+        self.outcomes[outcome] += 1
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if outcome == "rate_limited":
+                return JSONResponse(
+                    {"error": {"code": 429, "message": "Rate limit exceeded"}},
+                    status_code=429,
+                    headers={"Retry-After": f"{self.config.retry_after_seconds:g}"},
+                )
+
+            await asyncio.sleep(self.latency_seconds())
+            if outcome == "error":
+                return JSONResponse({"error": {"code": 502, "message": "Provider returned error"}}, status_code=502)
+            if prompt_name == "unknown":
+                return JSONResponse({"error": {"code": 400, "message": "Unrecognized prompt"}}, status_code=400)
+
+            response_body = llm_response_body(payload, prompt_tokens=len(content) // 4)
+            if outcome == "truncated":
+                message = response_body["choices"][0]
+                message["finish_reason"] = "length"
+                message["message"]["content"] = message["message"]["content"][: len(message["message"]["content"]) // 2]
+            if outcome == "slow_body":
+                return StreamingResponse(self._slow_body(response_body), media_type="application/json")
+            return JSONResponse(response_body)
+        finally:
+            self.in_flight -= 1
+
+    async def _slow_body(self, response_body: Dict[str, Any]) -> AsyncIterator[bytes]:
+        encoded = json.dumps(response_body, ensure_ascii=False).encode("utf-8")
+        parts = 10
+        step = max(1, len(encoded) // parts)
+        for offset in range(0, len(encoded), step):
+            yield encoded[offset:offset + step]
+            await asyncio.sleep(self.config.slow_body_ms / 1000 / parts)
+
+    async def stats(self, _request: Request) -> Response:
+        return JSONResponse(
+            {
+                "requests": dict(self.requests),
+                "outcomes": dict(self.outcomes),
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+            }
+        )
+
+
+def create_app(config: FakeConfig) -> Starlette:
+    fake = FakeOpenRouter(config)
+    app = Starlette(
+        routes=[
+            Route("/api/v1/chat/completions", fake.chat_completions, methods=["POST"]),
+            Route("/stats", fake.stats, methods=["GET"]),
+        ]
+    )
+    app.state.fake = fake
+    return app
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    defaults = FakeConfig()
+    parser = argparse.ArgumentParser(description="Local stand-in for the OpenRouter chat completions endpoint.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument(
+        "--latency", choices=("fixed", "uniform", "exponential", "lognormal"), default=defaults.latency
+    )
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms, help="fixed value, mean or median")
+    parser.add_argument("--latency-sigma", type=float, default=defaults.latency_sigma, help="lognormal shape")
+    parser.add_argument("--latency-max-ms", type=float, default=defaults.latency_max_ms)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate, help="fraction answered with 502")
+    parser.add_argument("--rate-limit-rate", type=float, default=defaults.rate_limit_rate, help="fraction answered with 429")
+    parser.add_argument("--retry-after-seconds", type=float, default=defaults.retry_after_seconds)
+    parser.add_argument("--slow-body-rate", type=float, default=defaults.slow_body_rate, help="fraction streamed slowly")
+    parser.add_argument("--slow-body-ms", type=float, default=defaults.slow_body_ms, help="time to stream a slow body")
+    parser.add_argument(
+        "--truncated-rate", type=float, default=defaults.truncated_rate, help="fraction with content cut in half"
+    )
+    parser.add_argument("--seed", type=int, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = _parse_args(argv)
+    config = FakeConfig(
+        latency=args.latency,
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        latency_max_ms=args.latency_max_ms,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after_seconds=args.retry_after_seconds,
+        slow_body_rate=args.slow_body_rate,
+        slow_body_ms=args.slow_body_ms,
+        truncated_rate=args.truncated_rate,
+        seed=args.seed,
+    )
+    started_at = time.perf_counter()
+    app = create_app(config)
+    print(
+        f"Loaded {len(app.state.fake.payloads)} canned documents in {time.perf_counter() - started_at:.1f}s; "
+        f"set OPENROUTER_BASE_URL=http://{args.host}:{args.port}/api/v1/chat/completions",
+        flush=True,
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+import copy
+import json
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.core.utils.normalization import normalize_company_name
+from app.services.chunking import PAGE_SEPARATOR
+from app.services.parsers.cnpj_card import parse_cnpj_card
+from app.services.parsers.tax_clearance_certificate import parse_tax_clearance_certificate
+from app.services.pdf_worker import extract_pages_text
+
+DOCS_DIR = Path(__file__).resolve().parent.parent / "docs"
+
+BASE_FILES = {
+    "articles": "01_contrato_social.pdf",
+    "cnpj_card": "02_cartao_cnpj.pdf",
+    "certificate": "03_certidao_negativa_federal.pdf",
+}
+
+PROMPT_DOCUMENTS = {
+    "articles_of_association": "articles",
+    "articles_of_association_chunk": "articles",
+    "cnpj_card": "cnpj_card",
+    "tax_clearance_certificate": "certificate",
+}
+
+_LETTER_SPACED_RE = re.compile(r"(?<=\S) (?=\S)")
+_DATE = r"(\d{2})/(\d{2})/(\d{4})"
+_CNPJ_RE = re.compile(r"\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}")
+
+
+@dataclass
+class Bundle:
+    name: str
+    files: Dict[str, Path]
+    base_files: Dict[str, Path]
+    variant: Optional[str] = None
+    _pdf_bytes: Dict[str, bytes] = field(default_factory=dict, repr=False)
+
+    def pdf_bytes(self, document: str) -> bytes:
+        if document not in self._pdf_bytes:
+            self._pdf_bytes[document] = self.files[document].read_bytes()
+        return self._pdf_bytes[document]
+
+    def text(self, document: str) -> str:
+        return _pdf_text(self.files[document])
+
+    def llm_payload(self, document: str) -> Dict[str, Any]:
+        base_payload = None
+        if self.files[document] != self.base_files[document]:
+            base_payload = llm_payload_for(document, _pdf_text(self.base_files[document]))
+        return llm_payload_for(document, self.text(document), base_payload)
+
+
+def discover_bundles(docs_dir: Path = DOCS_DIR) -> List[Bundle]:
+    bundles: List[Bundle] = []
+    for company_dir in sorted(path for path in docs_dir.iterdir() if path.is_dir()):
+        base = {document: company_dir / filename for document, filename in BASE_FILES.items()}
+        if not all(path.exists() for path in base.values()):
+            continue
+        bundles.append(Bundle(company_dir.name, base, base))
+
+        for document, filename in BASE_FILES.items():
+            stem = filename[: -len(".pdf")]
+            for variant_path in sorted(company_dir.glob(f"{stem}_*.pdf")):
+                variant = variant_path.stem[len(stem) + 1:]
+                bundles.append(
+                    Bundle(f"{company_dir.name}/{variant}", {**base, document: variant_path}, base, variant)
+                )
+    return bundles
+
+
+@lru_cache(maxsize=None)
+def _pdf_text(path: Path) -> str:
+    texts, _page_count = extract_pages_text(path.read_bytes())
+    return PAGE_SEPARATOR.join(texts).strip()
+
+
+def canned_payloads(bundles: Optional[List[Bundle]] = None) -> Dict[str, Dict[str, Any]]:
+    payloads: Dict[str, Dict[str, Any]] = {}
+    for bundle in bundles if bundles is not None else discover_bundles():
+        for document in BASE_FILES:
+            payloads.setdefault(bundle.text(document), bundle.llm_payload(document))
+    return payloads
+
+
+def llm_payload_for(document: str, text: str, base_payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    if document == "cnpj_card":
+        parsed = parse_cnpj_card(text)
+        if parsed.data is not None:
+            return parsed.data.model_dump(by_alias=True, mode="json")
+        return _fallback_cnpj_card(text, base_payload)
+    if document == "certificate":
+        parsed = parse_tax_clearance_certificate(text)
+        if parsed.data is not None:
+            return parsed.data.model_dump(by_alias=True, mode="json")
+        return _fallback_certificate(text, base_payload)
+    return stub_articles_payload(text)
+
+
+def llm_response_body(payload: Dict[str, Any], prompt_tokens: int = 0, completion_tokens: int = 0) -> Dict[str, Any]:
+    content = json.dumps(payload, ensure_ascii=False)
+    return {
+        "id": "gen-benchmark",
+        "object": "chat.completion",
+        "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens or len(content) // 4,
+            "total_tokens": prompt_tokens + (completion_tokens or len(content) // 4),
+        },
+    }
+
+
+def business_purpose_verdicts(prompt: str) -> Dict[str, Any]:
+    codes = re.findall(r"Código CNAE: (\S+)", prompt)
+    return {
+        "atividades": [
+            {"codigo": code, "contemplada": True, "justificativa": "Atividade prevista no objeto social."}
+            for code in codes
+        ],
+    }
+
+
+def _collapse_letter_spacing(text: str) -> str:
+    lines = []
+    for line in text.splitlines():
+        tokens = line.split()
+        if tokens and sum(len(token) == 1 for token in tokens) / len(tokens) > 0.8:
+            line = _LETTER_SPACED_RE.sub("", line)
+        lines.append(line)
+    return " ".join(" ".join(lines).split())
+
+
+def _iso_date(match: Optional["re.Match[str]"]) -> Optional[str]:
+    if match is None:
+        return None
+    day, month, year = match.groups()[-3:]
+    return f"{year}-{month}-{day}"
+
+
+def _br_amount(value: Optional[str]) -> str:
+    if not value:
+        return "0.00"
+    return value.replace(".", "").replace(",", ".")
+
+
+def _legal_nature(company_name: str) -> str:
+    normalized = normalize_company_name(company_name)
+    if "sociedade anonima" in normalized:
+        return "sociedade anonima"
+    if "empresa individual de responsabilidade limitada" in normalized:
+        return "empresa individual de responsabilidade limitada"
+    return "limitada"
+
+
+def stub_articles_payload(text: str) -> Dict[str, Any]:
+    flat = _collapse_letter_spacing(text)
+
+    name_match = re.search(r"denomina[çc][ãa]o social de\s+(.+?)\.?\s+CL[ÁA]USULA", flat, re.IGNORECASE)
+    company_name = name_match.group(1).strip() if name_match else "EMPRESA NAO IDENTIFICADA LTDA"
+    nire_match = re.search(r"NIRE:\s*([\d.\-]+)", flat)
+    registration_date = _iso_date(re.search(rf"Data de Registro:\s*{_DATE}", flat)) or "2000-01-01"
+    start_date = _iso_date(re.search(rf"iniciou suas atividades em\s*{_DATE}", flat)) or registration_date
+
+    office = re.search(
+        r"sede n[ao]\s+(?P<street>[^,]+),\s*n[ºo°]\s*(?P<number>[^,]+),\s*(?:(?P<complement>[^,]+?),\s*)?"
+        r"Bairro\s+(?P<district>[^,]+),\s*CEP\s*(?P<cep>[\d.\-]+),\s*(?P<city>[^/]+)/(?P<state>[A-Z]{2})",
+        flat,
+    )
+
+    purpose_match = re.search(r"objeto social:\s*(.+?)\s*(?:CL[ÁA]USULA|S[óo]cio Quotas|$)", flat, re.IGNORECASE)
+    business_purpose = [
+        item.strip(" ;.")
+        for item in re.split(r"\b[a-z]\)\s*", purpose_match.group(1) if purpose_match else "")
+        if item.strip(" ;.")
+    ]
+
+    capital = re.search(r"capital social [ée] de R\$\s*([\d.,]+)", flat, re.IGNORECASE)
+    shares = re.search(r"dividido em\s*([\d.]+)", flat, re.IGNORECASE)
+    nominal = re.search(r"valor nominal de R\$\s*([\d.,]+)", flat, re.IGNORECASE)
+
+    administration = re.search(r"administra[çc][ãa]o da sociedade ser[áa] exercida (.+?)\.", flat, re.IGNORECASE)
+    administrators = normalize_company_name(administration.group(1)) if administration else ""
+    shareholders = []
+    for partner_name, tax_id in re.findall(
+        r"\d+\.\s+([A-ZÀ-Ý][A-ZÀ-Ý ]+?),[^.]*?(?:\.[^.]*?)*?(?:CPF|CNPJ) sob o n[ºo°]\s*([\d./\-]+\d)", flat
+    ):
+        tax_id = re.sub(r"\D", "", tax_id)
+        shareholders.append(
+            {
+                "nome_ou_razao_social": (
+                    normalize_company_name(partner_name) if len(tax_id) == 14 else partner_name.strip()
+                ),
+                "cpf_ou_cnpj": tax_id,
+                "qualificacao": (
+                    "socio administrador" if normalize_company_name(partner_name) in administrators else "socio"
+                ),
+            }
+        )
+
+    return {
+        "tipo_documento": "Contrato Social",
+        "informacoes_entidade": {
+            "razao_social": normalize_company_name(company_name),
+            "natureza_juridica": _legal_nature(company_name),
+            "nire": re.sub(r"\D", "", nire_match.group(1)) if nire_match else "",
+            "data_registro": registration_date,
+            "data_inicio": start_date,
+            "prazo_duracao": "Indeterminado" if re.search(r"prazo de dura[çc][ãa]o [ée] indeterminado", flat) else "Determinado",
+        },
+        "sede": {
+            "logradouro": office.group("street").strip() if office else "",
+            "numero": office.group("number").strip() if office else "",
+            "complemento": (office.group("complement") or "").strip() or None if office else None,
+            "bairro": office.group("district").strip() if office else "",
+            "cep": re.sub(r"\D", "", office.group("cep")) if office else "",
+            "cidade": office.group("city").strip() if office else "",
+            "estado": office.group("state") if office else "",
+        },
+        "objeto_social": business_purpose,
+        "capital_social": {
+            "valor_total": _br_amount(capital.group(1) if capital else None),
+            "moeda": "BRL",
+            "total_acoes": (shares.group(1) if shares else "0").replace(".", ""),
+            "valor_nominal_acao": _br_amount(nominal.group(1) if nominal else None),
+        },
+        "participacoes_societarias": shareholders,
+    }
+
+
+def _fallback_cnpj_card(text: str, base_payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    payload = copy.deepcopy(base_payload) if base_payload else {
+        "tipo_documento": "Cartão CNPJ",
+        "informacoes_registro": {
+            "cnpj": "",
+            "is_matriz": True,
+            "data_abertura": "2000-01-01",
+            "razao_social": "",
+            "nome_fantasia": None,
+            "porte": "DEMAIS",
+            "natureza_juridica": "limitada",
+        },
+        "atividades": {"atividade_principal": {"codigo": "", "descricao": ""}, "atividades_secundarias": []},
+        "endereco": {"logradouro": "", "numero": "", "complemento": None, "bairro": "", "cep": "", "cidade": "", "estado": ""},
+        "situacao_cadastral": {"situacao": "ATIVA", "data_situacao": "2000-01-01"},
+        "socios_qsa": [],
+        "informacoes_emissao": {"emitido_em": "2000-01-01T00:00:00", "codigo_controle": ""},
+    }
+    flat = _collapse_letter_spacing(text)
+
+    cnpj = _CNPJ_RE.search(flat)
+    if cnpj:
+        payload["informacoes_registro"]["cnpj"] = re.sub(r"\D", "", cnpj.group(0))
+    status = re.search(r"SITUA[ÇC][ÃA]O CADASTRAL\s+(ATIVA|INAPTA|SUSPENSA|BAIXADA|NULA)", flat)
+    if status:
+        payload["situacao_cadastral"]["situacao"] = status.group(1)
+    activities = [
+        {"codigo": code, "descricao": description.strip()}
+        for code, description in re.findall(r"^(\d{2}\.\d{2}-\d-\d{2}) - (.+)$", text, re.MULTILINE)
+    ]
+    if activities:
+        payload["atividades"] = {"atividade_principal": activities[0], "atividades_secundarias": activities[1:]}
+    return payload
+
+
+def _fallback_certificate(text: str, base_payload: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    payload = copy.deepcopy(base_payload) if base_payload else {
+        "tipo_documento": "Certidão Negativa de Débitos Federais",
+        "razao_social": "",
+        "natureza_juridica": "limitada",
+        "cnpj": "",
+        "data_emissao": "2000-01-01",
+        "data_validade": "2000-07-01",
+        "status": "NEGATIVA",
+        "codigo_controle": "",
+    }
+    cnpj = _CNPJ_RE.search(_collapse_letter_spacing(text))
+    if cnpj:
+        payload["cnpj"] = re.sub(r"\D", "", cnpj.group(0))
+    return payload
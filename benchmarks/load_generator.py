@@ -0,0 +1,181 @@
+import os
+
+os.environ.setdefault("OPENROUTER_API_KEY", "benchmark")
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from benchmarks.fixtures import BASE_FILES, DOCS_DIR, Bundle, discover_bundles
+
+UPLOAD_FIELDS = {
+    "articles": "articles_of_association",
+    "cnpj_card": "cnpj_card",
+    "certificate": "tax_clearance_certificate",
+}
+
+
+@dataclass
+class Sample:
+    bundle: str
+    scheduled_at: float
+    started_at: float
+    finished_at: float
+    status_code: Optional[int]
+    validation_status: Optional[str]
+    error: Optional[str] = None
+
+    @property
+    def latency(self) -> float:
+        return self.finished_at - self.scheduled_at
+
+    @property
+    def queue_delay(self) -> float:
+        return self.started_at - self.scheduled_at
+
+
+def _files(bundle: Bundle) -> Dict[str, Any]:
+    return {
+        field_name: (bundle.files[document].name, bundle.pdf_bytes(document), "application/pdf")
+        for document, field_name in UPLOAD_FIELDS.items()
+    }
+
+
+async def _send(
+    client: httpx.AsyncClient,
+    url: str,
+    params: Dict[str, str],
+    bundle: Bundle,
+    scheduled_at: float,
+    in_flight: asyncio.Semaphore,
+) -> Sample:
+    async with in_flight:
+        started_at = time.perf_counter()
+        try:
+            response = await client.post(url, params=params, files=_files(bundle))
+        except httpx.HTTPError as exc:
+            return Sample(bundle.name, scheduled_at, started_at, time.perf_counter(), None, None, type(exc).__name__)
+
+        validation_status = None
+        if response.status_code == 200:
+            validation_status = response.json().get("status")
+        return Sample(bundle.name, scheduled_at, started_at, time.perf_counter(), response.status_code, validation_status)
+
+
+async def run_load(
+    base_url: str,
+    bundles: List[Bundle],
+    rps: float,
+    duration_seconds: float,
+    max_in_flight: int,
+    timeout_seconds: float,
+    policy: Optional[str],
+) -> Dict[str, Any]:
+    url = f"{base_url.rstrip('/')}/api/v1/validate-docs"
+    params = {"policy": policy} if policy else {}
+    total_requests = max(1, int(rps * duration_seconds))
+    in_flight = asyncio.Semaphore(max_in_flight)
+    limits = httpx.Limits(max_connections=max_in_flight, max_keepalive_connections=max_in_flight)
+
+    async with httpx.AsyncClient(timeout=timeout_seconds, limits=limits) as client:
+        started_at = time.perf_counter()
+        tasks = []
+        for index in range(total_requests):
+            scheduled_at = started_at + index / rps
+            delay = scheduled_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            bundle = bundles[index % len(bundles)]
+            tasks.append(asyncio.create_task(_send(client, url, params, bundle, scheduled_at, in_flight)))
+        samples = await asyncio.gather(*tasks)
+        elapsed_seconds = time.perf_counter() - started_at
+
+    return summarize(samples, elapsed_seconds, rps)
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def at(quantile: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(quantile * len(ordered)))] * 1000, 1)
+
+    return {
+        "min_ms": round(ordered[0] * 1000, 1),
+        "p50_ms": at(0.50),
+        "p95_ms": at(0.95),
+        "p99_ms": at(0.99),
+        "max_ms": round(ordered[-1] * 1000, 1),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 1),
+    }
+
+
+def summarize(samples: List[Sample], elapsed_seconds: float, target_rps: float) -> Dict[str, Any]:
+    succeeded = [sample for sample in samples if sample.status_code == 200]
+    return {
+        "requests": len(samples),
+        "target_rps": target_rps,
+        "elapsed_seconds": round(elapsed_seconds, 2),
+        "throughput_rps": round(len(succeeded) / elapsed_seconds, 2) if elapsed_seconds > 0 else 0.0,
+        "status_codes": dict(Counter(str(sample.status_code or sample.error) for sample in samples)),
+        "validation_status": dict(Counter(sample.validation_status for sample in succeeded)),
+        "latency": _percentiles([sample.latency for sample in samples]),
+        "success_latency": _percentiles([sample.latency for sample in succeeded]),
+        "client_queue_delay": _percentiles([sample.queue_delay for sample in samples]),
+        "per_bundle_p50_ms": {
+            name: _percentiles([sample.latency for sample in succeeded if sample.bundle == name]).get("p50_ms")
+            for name in sorted({sample.bundle for sample in samples})
+        },
+    }
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Drive /api/v1/validate-docs with the docs/ bundles at a fixed rate.")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="base URL of the API")
+    parser.add_argument("--rps", type=float, default=1.0, help="target arrival rate (requests per second)")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of load to generate")
+    parser.add_argument("--max-in-flight", type=int, default=64, help="client-side cap on concurrent requests")
+    parser.add_argument("--timeout", type=float, default=120.0, help="per-request timeout in seconds")
+    parser.add_argument("--policy", default=None, help="validation policy query parameter")
+    parser.add_argument("--bundle", action="append", default=[], help="only use bundles containing this text")
+    parser.add_argument("--base-only", action="store_true", help="skip the inconsistency variants")
+    parser.add_argument("--output", type=Path, default=None, help="also write the summary as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    bundles = [
+        bundle
+        for bundle in discover_bundles(DOCS_DIR)
+        if (not args.bundle or any(text in bundle.name for text in args.bundle))
+        and (not args.base_only or bundle.variant is None)
+    ]
+    if not bundles:
+        print(f"No bundles with {sorted(BASE_FILES.values())} found in {DOCS_DIR}", file=sys.stderr)
+        return 1
+
+    summary = asyncio.run(
+        run_load(args.url, bundles, args.rps, args.duration, args.max_in_flight, args.timeout, args.policy)
+    )
+    summary["bundles"] = [bundle.name for bundle in bundles]
+    report = json.dumps(summary, ensure_ascii=False, indent=2)
+    print(report)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(report, encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
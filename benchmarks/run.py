@@ -0,0 +1,330 @@
+import os
+
+os.environ.setdefault("OPENROUTER_API_KEY", "benchmark")
+os.environ.setdefault("PDF_EXECUTOR_KIND", "thread")
+os.environ.setdefault("EXTRACTION_CACHE_DIR", "")
+os.environ.setdefault("BUSINESS_PURPOSE_CACHE_ENABLED", "false")
+os.environ.setdefault("BUSINESS_PURPOSE_CACHE_DIR", "")
+
+import argparse
+import asyncio
+import inspect
+import io
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import UploadFile
+
+import app.domain.validators.business_purpose as business_purpose
+from app.core.utils.normalization import normalize_company_name, normalize_text, only_digits
+from app.domain.document_validator import DETERMINISTIC_VALIDATORS, validate_documents_domain
+from app.domain.models import ArticlesOfAssociationData, CNPJCardData, TaxClearanceCertificateData
+from app.services.llm_client import parse_llm_json_response
+from app.services.parsers.articles_sections import select_relevant_text
+from app.services.parsers.cnpj_card import parse_cnpj_card
+from app.services.parsers.tax_clearance_certificate import parse_tax_clearance_certificate
+from app.services.pdf_worker import extract_pages_text
+from app.services.prompts import build_prompt
+from app.services.text_extractor import extract_text_from_pdf, shutdown_pdf_executor
+from benchmarks.fixtures import Bundle, business_purpose_verdicts, discover_bundles, llm_response_body
+
+DEFAULT_OUTPUT = Path(__file__).resolve().parent / "results" / "latest.json"
+
+MODELS = {
+    "articles": ArticlesOfAssociationData,
+    "cnpj_card": CNPJCardData,
+    "certificate": TaxClearanceCertificateData,
+}
+
+EXTRACTION_PROMPTS = {
+    "articles": "articles_of_association",
+    "cnpj_card": "cnpj_card",
+    "certificate": "tax_clearance_certificate",
+}
+
+
+@dataclass
+class Case:
+    stage: str
+    name: str
+    func: Callable[[], Any]
+
+
+async def _stub_call_llm_and_parse(user_content: str, **_kwargs: Any) -> Dict[str, Any]:
+    return business_purpose_verdicts(user_content)
+
+
+def _documents(bundle: Bundle) -> Dict[str, Any]:
+    return {document: model.model_validate(bundle.llm_payload(document)) for document, model in MODELS.items()}
+
+
+def _normalization_inputs(bundles: List[Bundle]) -> Dict[str, List[str]]:
+    names: List[str] = []
+    tax_ids: List[str] = []
+    free_text: List[str] = []
+    for bundle in bundles:
+        articles = bundle.llm_payload("articles")
+        cnpj_card = bundle.llm_payload("cnpj_card")
+        certificate = bundle.llm_payload("certificate")
+        names += [
+            articles["informacoes_entidade"]["razao_social"],
+            cnpj_card["informacoes_registro"]["razao_social"],
+            certificate["razao_social"],
+        ]
+        names += [partner["nome_ou_razao_social"] for partner in articles["participacoes_societarias"]]
+        tax_ids += [cnpj_card["informacoes_registro"]["cnpj"], certificate["cnpj"]]
+        tax_ids += [partner["cpf_ou_cnpj"] for partner in articles["participacoes_societarias"]]
+        free_text += list(articles["sede"].values()) + list(cnpj_card["endereco"].values())
+        free_text += articles["objeto_social"]
+    return {
+        "names": names,
+        "tax_ids": tax_ids,
+        "free_text": [value for value in free_text if isinstance(value, str)],
+    }
+
+
+def build_cases(bundles: List[Bundle]) -> List[Case]:
+    cases: List[Case] = []
+    base_bundles = [bundle for bundle in bundles if bundle.variant is None]
+
+    seen_files = set()
+    for bundle in bundles:
+        for document, path in bundle.files.items():
+            if path in seen_files:
+                continue
+            seen_files.add(path)
+            label = f"{path.parent.name}/{path.name}"
+            data = bundle.pdf_bytes(document)
+            upload = UploadFile(file=io.BytesIO(data), filename=path.name)
+            cases.append(Case("pdf.extract_pages_text", label, lambda data=data: extract_pages_text(data)))
+            cases.append(Case("pdf.extract_text_from_pdf", label, lambda upload=upload: extract_text_from_pdf(upload)))
+
+    for bundle in base_bundles:
+        for document, prompt_name in EXTRACTION_PROMPTS.items():
+            text = bundle.text(document)
+            cases.append(
+                Case(
+                    "prompts.build_prompt",
+                    f"{bundle.name}/{prompt_name}",
+                    lambda prompt_name=prompt_name, text=text: build_prompt(prompt_name, {"document_text": text}),
+                )
+            )
+
+    for bundle in bundles:
+        for document, model in MODELS.items():
+            body = llm_response_body(bundle.llm_payload(document))
+            cases.append(
+                Case(
+                    "llm.parse_and_validate",
+                    f"{bundle.name}/{document}",
+                    lambda body=body, model=model: model.model_validate(parse_llm_json_response(body)),
+                )
+            )
+
+    for bundle in base_bundles:
+        cnpj_card_text = bundle.text("cnpj_card")
+        certificate_text = bundle.text("certificate")
+        articles_text = bundle.text("articles")
+        cases.append(Case("parsers.cnpj_card", bundle.name, lambda text=cnpj_card_text: parse_cnpj_card(text)))
+        cases.append(
+            Case(
+                "parsers.tax_clearance_certificate",
+                bundle.name,
+                lambda text=certificate_text: parse_tax_clearance_certificate(text),
+            )
+        )
+        cases.append(
+            Case("parsers.articles_sections", bundle.name, lambda text=articles_text: select_relevant_text(text))
+        )
+
+    inputs = _normalization_inputs(bundles)
+    for function in (normalize_text, normalize_company_name, only_digits):
+        for input_name, values in inputs.items():
+            cases.append(
+                Case(
+                    f"normalization.{function.__name__}",
+                    f"{input_name}[{len(values)}]",
+                    lambda function=function, values=values: [function(value) for value in values],
+                )
+            )
+
+    for bundle in bundles:
+        documents = _documents(bundle)
+        for validator_name, validator, document_names in DETERMINISTIC_VALIDATORS:
+            arguments = tuple(documents[document_name] for document_name in document_names)
+            cases.append(
+                Case(
+                    f"validators.{validator_name}",
+                    bundle.name,
+                    lambda validator=validator, arguments=arguments: validator(*arguments),
+                )
+            )
+        cases.append(
+            Case(
+                "validators.business_purpose",
+                bundle.name,
+                lambda documents=documents: business_purpose.validate_business_purpose_consistency(
+                    documents["articles"], documents["cnpj_card"]
+                ),
+            )
+        )
+        cases.append(
+            Case(
+                "domain.validate_documents_domain",
+                bundle.name,
+                lambda documents=documents: validate_documents_domain(
+                    documents["articles"], documents["cnpj_card"], documents["certificate"]
+                ),
+            )
+        )
+
+    return cases
+
+
+def _call(case: Case, loop: asyncio.AbstractEventLoop) -> Any:
+    result = case.func()
+    if inspect.isawaitable(result):
+        result = loop.run_until_complete(result)
+    return result
+
+
+def _run_batch(case: Case, loop: asyncio.AbstractEventLoop, inner: int) -> float:
+    started_at = time.perf_counter_ns()
+    for _ in range(inner):
+        _call(case, loop)
+    return (time.perf_counter_ns() - started_at) / inner
+
+
+def _calibrate(case: Case, loop: asyncio.AbstractEventLoop, min_batch_seconds: float) -> int:
+    inner = 1
+    while True:
+        per_call_ns = _run_batch(case, loop, inner)
+        if per_call_ns * inner >= min_batch_seconds * 1e9 or inner >= 1 << 20:
+            return inner
+        inner *= 2
+
+
+def _percentile(ordered: List[float], quantile: float) -> float:
+    index = min(len(ordered) - 1, max(round(quantile * (len(ordered) - 1)), 0))
+    return ordered[index]
+
+
+def _measure_memory(case: Case, loop: asyncio.AbstractEventLoop) -> Dict[str, int]:
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = _call(case, loop)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {"peak_bytes": peak - baseline, "retained_bytes": current - baseline}
+
+
+def measure(case: Case, loop: asyncio.AbstractEventLoop, samples: int, min_batch_seconds: float) -> Dict[str, Any]:
+    _call(case, loop)
+    inner = _calibrate(case, loop, min_batch_seconds)
+    timings_ns = sorted(_run_batch(case, loop, inner) for _ in range(samples))
+    return {
+        "stage": case.stage,
+        "case": case.name,
+        "samples": samples,
+        "calls_per_sample": inner,
+        "min_us": round(timings_ns[0] / 1000, 3),
+        "median_us": round(statistics.median(timings_ns) / 1000, 3),
+        "mean_us": round(statistics.fmean(timings_ns) / 1000, 3),
+        "p95_us": round(_percentile(timings_ns, 0.95) / 1000, 3),
+        "stdev_us": round(statistics.stdev(timings_ns) / 1000, 3) if samples > 1 else 0.0,
+        **_measure_memory(case, loop),
+    }
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _metadata(args: argparse.Namespace) -> Dict[str, Any]:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "samples": args.samples,
+        "min_batch_seconds": args.min_batch_seconds,
+        "pdf_executor_kind": os.environ["PDF_EXECUTOR_KIND"],
+    }
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Per-stage microbenchmarks using the sample PDFs in docs/.")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="JSON file for the results")
+    parser.add_argument("--stage", action="append", default=[], help="only run stages containing this text")
+    parser.add_argument("--bundle", action="append", default=[], help="only run cases containing this text")
+    parser.add_argument("--samples", type=int, default=20, help="timed samples per case")
+    parser.add_argument("--min-batch-seconds", type=float, default=0.005, help="minimum duration of each sample")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    business_purpose.call_llm_and_parse = _stub_call_llm_and_parse
+
+    cases = [
+        case
+        for case in build_cases(discover_bundles())
+        if (not args.stage or any(text in case.stage for text in args.stage))
+        and (not args.bundle or any(text in case.name for text in args.bundle))
+    ]
+    if args.list:
+        for case in cases:
+            print(f"{case.stage}  {case.name}")
+        return 0
+
+    loop = asyncio.new_event_loop()
+    results: List[Dict[str, Any]] = []
+    try:
+        for case in cases:
+            result = measure(case, loop, args.samples, args.min_batch_seconds)
+            results.append(result)
+            print(
+                f"{case.stage:<36} {case.name:<56} median {result['median_us']:>12.3f}us "
+                f"p95 {result['p95_us']:>12.3f}us peak {result['peak_bytes']:>10}B",
+                flush=True,
+            )
+    finally:
+        shutdown_pdf_executor()
+        loop.close()
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(
+        json.dumps({"metadata": _metadata(args), "results": results}, ensure_ascii=False, indent=2),
+        encoding="utf-8",
+    )
+    print(f"Results written to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3 @@
+import os
+
+os.environ.setdefault("OPENROUTER_API_KEY", "test")
@@ -0,0 +1,102 @@
+import asyncio
+from typing import List
+
+import httpx
+import pytest
+
+from app.core.exceptions import ServiceOverloadedError
+from app.main import app
+from app.services import admission
+from app.services.admission import AdmissionController
+
+
+async def _hold(controller: AdmissionController, release: asyncio.Event) -> None:
+    async with controller.slot():
+        await release.wait()
+
+
+async def _saturate(controller: AdmissionController, release: asyncio.Event, count: int) -> List["asyncio.Task[None]"]:
+    tasks = [asyncio.create_task(_hold(controller, release)) for _ in range(count)]
+    await asyncio.sleep(0)
+    return tasks
+
+
+@pytest.mark.asyncio
+async def test_requests_queue_until_the_queue_is_full() -> None:
+    controller = AdmissionController("test", limit=2, max_queue=1, default_service_seconds=1.0)
+    release = asyncio.Event()
+    holders = await _saturate(controller, release, 3)
+
+    assert (controller.active, controller.waiting) == (2, 1)
+    with pytest.raises(ServiceOverloadedError) as error:
+        await controller.admit()
+    assert controller.rejected == 1
+    assert error.value.retry_after_seconds == 1
+
+    release.set()
+    await asyncio.gather(*holders)
+    assert (controller.active, controller.waiting, controller.acquired) == (0, 0, 3)
+
+
+@pytest.mark.asyncio
+async def test_no_rejection_while_a_slot_is_free() -> None:
+    controller = AdmissionController("test", limit=2, max_queue=0, default_service_seconds=1.0)
+    release = asyncio.Event()
+    holders = await _saturate(controller, release, 1)
+
+    admitted_at = await controller.admit()
+    controller.leave(admitted_at)
+
+    assert controller.rejected == 0
+    release.set()
+    await asyncio.gather(*holders)
+
+
+@pytest.mark.asyncio
+async def test_retry_after_grows_with_the_queue_and_service_time() -> None:
+    controller = AdmissionController("test", limit=2, max_queue=4, default_service_seconds=3.0)
+    release = asyncio.Event()
+    holders = await _saturate(controller, release, 6)
+
+    assert controller.waiting == 4
+    assert controller.retry_after_seconds() == 8
+    with pytest.raises(ServiceOverloadedError) as error:
+        await controller.admit()
+    assert error.value.retry_after_seconds == 8
+
+    release.set()
+    await asyncio.gather(*holders)
+
+
+@pytest.mark.asyncio
+async def test_service_time_average_follows_completed_requests() -> None:
+    controller = AdmissionController("test", limit=1, max_queue=0, default_service_seconds=10.0)
+
+    async with controller.slot():
+        await asyncio.sleep(0.01)
+
+    assert controller.avg_service_seconds < 10.0 * 0.81
+
+
+@pytest.mark.asyncio
+async def test_full_queue_returns_503_with_retry_after(monkeypatch: pytest.MonkeyPatch) -> None:
+    controller = AdmissionController("validation", limit=1, max_queue=0, default_service_seconds=4.0)
+    monkeypatch.setattr(admission, "validation_admission", controller)
+    monkeypatch.setattr("app.api.v1.routers.validation.validation_admission", controller)
+    release = asyncio.Event()
+    holders = await _saturate(controller, release, 1)
+
+    files = {
+        "articles_of_association": ("contrato.pdf", b"%PDF", "application/pdf"),
+        "cnpj_card": ("cartao.pdf", b"%PDF", "application/pdf"),
+        "tax_clearance_certificate": ("certidao.pdf", b"%PDF", "application/pdf"),
+    }
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/api/v1/validate-docs", files=files)
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "4"
+    assert response.json()["error"] == "Serviço sobrecarregado"
+
+    release.set()
+    await asyncio.gather(*holders)
@@ -0,0 +1,70 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from app.services.cache import TieredCache
+
+
+def _cache(directory: Path, disk_max_entries: int = 10) -> TieredCache:
+    return TieredCache(
+        "test",
+        directory=str(directory),
+        memory_max_entries=2,
+        disk_max_entries=disk_max_entries,
+        ttl_seconds=None,
+    )
+
+
+def _disk_files(directory: Path) -> int:
+    return sum(1 for _path in directory.rglob("*.json"))
+
+
+def test_directory_is_created_on_first_write(tmp_path: Path) -> None:
+    directory = tmp_path / "cache"
+
+    cache = _cache(directory)
+
+    assert not directory.exists()
+    assert cache.stats()["disk_entries"] is None
+
+
+@pytest.mark.asyncio
+async def test_lookup_before_any_write_does_not_create_the_directory(tmp_path: Path) -> None:
+    directory = tmp_path / "cache"
+    cache = _cache(directory)
+
+    assert await cache.get("missing") is None
+
+    assert not directory.exists()
+    await cache.set("key", {"value": 1})
+    assert _disk_files(directory) == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_is_pruned_to_the_low_water_mark(tmp_path: Path) -> None:
+    cache = _cache(tmp_path, disk_max_entries=10)
+    for index in range(10):
+        await cache.set(f"key-{index:02d}", index)
+        os.utime(cache._path_for(f"key-{index:02d}"), (index, index))
+    assert _disk_files(tmp_path) == 10
+
+    await cache.set("key-10", 10)
+
+    assert _disk_files(tmp_path) == 9
+    assert cache.stats()["disk_entries"] == 9
+    assert not os.path.exists(cache._path_for("key-00"))
+    assert not os.path.exists(cache._path_for("key-01"))
+
+    await cache.set("key-11", 11)
+    assert _disk_files(tmp_path) == 10
+
+
+@pytest.mark.asyncio
+async def test_disk_entries_survive_memory_eviction(tmp_path: Path) -> None:
+    cache = _cache(tmp_path)
+    for index in range(3):
+        await cache.set(f"key-{index}", {"index": index})
+
+    assert await cache.get("key-0") == {"index": 0}
+    assert (cache.memory_hits, cache.disk_hits) == (0, 1)
@@ -0,0 +1,164 @@
+from typing import Any
+
+import pytest
+
+from app.core.config import settings
+from app.core.exceptions import LLMClientError, LLMResponseError, LLMTimeoutError
+from app.services import circuit_breaker, llm_client
+from app.services.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", fake)
+    return fake
+
+
+def _open(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+def test_opens_after_consecutive_failures(clock: FakeClock) -> None:
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout_seconds=30.0)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+    assert breaker.retry_after_seconds() is None
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert breaker.opened == 1
+
+    clock.now += 10.0
+    assert not breaker.allow()
+    assert breaker.rejected == 1
+    assert breaker.retry_after_seconds() == 20.0
+
+
+def test_success_resets_the_failure_count(clock: FakeClock) -> None:
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout_seconds=30.0)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CLOSED
+
+
+def test_half_open_lets_a_single_probe_through(clock: FakeClock) -> None:
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout_seconds=30.0)
+    _open(breaker)
+    clock.now += 30.0
+
+    assert breaker.state == HALF_OPEN
+    assert breaker.retry_after_seconds() == 0.0
+    assert breaker.allow()
+
+    clock.now += 5.0
+    assert not breaker.allow()
+    assert breaker.retry_after_seconds() == 25.0
+
+
+def test_successful_probe_closes_the_circuit(clock: FakeClock) -> None:
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout_seconds=30.0)
+    _open(breaker)
+    clock.now += 30.0
+    assert breaker.allow()
+
+    breaker.record_success()
+    breaker.release_probe()
+
+    assert breaker.state == CLOSED
+    assert breaker.allow() and breaker.allow()
+
+
+def test_failed_probe_reopens_the_circuit(clock: FakeClock) -> None:
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout_seconds=30.0)
+    _open(breaker)
+    clock.now += 30.0
+    assert breaker.allow()
+
+    breaker.record_failure()
+    breaker.release_probe()
+
+    assert breaker.state == OPEN
+    assert breaker.opened == 2
+    assert breaker.retry_after_seconds() == 30.0
+
+
+def test_released_probe_without_outcome_lets_the_next_probe_through(clock: FakeClock) -> None:
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout_seconds=30.0)
+    _open(breaker)
+    clock.now += 30.0
+    assert breaker.allow()
+
+    breaker.release_probe()
+
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+
+
+@pytest.fixture
+def llm_circuit(monkeypatch: pytest.MonkeyPatch) -> CircuitBreaker:
+    breaker = CircuitBreaker("llm", failure_threshold=1, reset_timeout_seconds=30.0)
+    monkeypatch.setattr(llm_client, "llm_circuit", breaker)
+    monkeypatch.setattr(settings, "llm_circuit_breaker_enabled", True)
+    monkeypatch.setattr(settings, "llm_hedging_enabled", False)
+    return breaker
+
+
+def _failing_post(exc: LLMClientError) -> Any:
+    async def post(*_args: Any, **_kwargs: Any) -> Any:
+        raise exc
+
+    return post
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "exc",
+    [
+        LLMClientError("bad request", status_code=400),
+        LLMClientError("unauthorized", status_code=401),
+        LLMClientError("forbidden", status_code=403),
+        LLMResponseError("unexpected structure"),
+    ],
+)
+async def test_non_retryable_errors_leave_the_circuit_alone(
+    llm_circuit: CircuitBreaker, monkeypatch: pytest.MonkeyPatch, clock: FakeClock, exc: LLMClientError
+) -> None:
+    monkeypatch.setattr(llm_client, "_limited_post", _failing_post(exc))
+    llm_circuit.record_failure()
+    clock.now += 30.0
+
+    with pytest.raises(type(exc)):
+        await llm_client.call_llm([{"role": "user", "content": "x"}], timeout=1.0, prompt_name="cnpj_card")
+
+    assert llm_circuit.state == HALF_OPEN
+    assert llm_circuit.allow()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "exc", [LLMTimeoutError("timeout"), LLMClientError("busy", status_code=503), LLMClientError("connect")]
+)
+async def test_provider_failures_open_the_circuit(
+    llm_circuit: CircuitBreaker, monkeypatch: pytest.MonkeyPatch, clock: FakeClock, exc: LLMClientError
+) -> None:
+    monkeypatch.setattr(llm_client, "_limited_post", _failing_post(exc))
+
+    with pytest.raises(type(exc)):
+        await llm_client.call_llm([{"role": "user", "content": "x"}], timeout=1.0, prompt_name="cnpj_card")
+
+    assert llm_circuit.state == OPEN
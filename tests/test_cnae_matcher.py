@@ -0,0 +1,36 @@
+import pytest
+
+from app.domain.validators.cnae_matcher import CNAEMatcher
+
+
+@pytest.fixture
+def matcher() -> CNAEMatcher:
+    return CNAEMatcher(accept_threshold=0.85)
+
+
+def test_accepts_activity_covered_by_business_purpose(matcher: CNAEMatcher) -> None:
+    index = matcher.index(["Desenvolvimento de programas de computador sob encomenda"])
+
+    covered, result = matcher.is_covered(index, "Desenvolvimento de programas de computador sob encomenda")
+
+    assert covered
+    assert result.score == 1.0
+
+
+@pytest.mark.parametrize(
+    "business_purpose",
+    [
+        "Desenvolvimento de software, exceto comércio varejista de produtos farmacêuticos",
+        "Desenvolvimento de software, sendo vedado o comércio varejista de produtos farmacêuticos",
+        "Desenvolvimento de software, salvo comércio varejista de produtos farmacêuticos",
+        "Desenvolvimento de software, excluindo comércio varejista de produtos farmacêuticos",
+        "Desenvolvimento de software sem comércio varejista de produtos farmacêuticos",
+    ],
+)
+def test_excluded_activity_is_escalated(matcher: CNAEMatcher, business_purpose: str) -> None:
+    index = matcher.index([business_purpose])
+
+    covered, result = matcher.is_covered(index, "Comércio varejista de produtos farmacêuticos")
+
+    assert not covered
+    assert result.score < matcher.accept_threshold
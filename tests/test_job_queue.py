@@ -0,0 +1,112 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from app.services.job_queue import JOB_DONE, JOB_FAILED, JOB_PENDING, JOB_PROCESSING, JobQueue
+
+FILES = {
+    "articles": ("contrato.pdf", b"articles"),
+    "cnpj_card": ("cartao.pdf", b"cnpj card"),
+    "certificate": ("certidao.pdf", b"certificate"),
+}
+
+
+def _queue(tmp_path: Path, lease_seconds: float = 60.0, max_attempts: int = 3) -> JobQueue:
+    queue = JobQueue(str(tmp_path / "jobs.sqlite3"), lease_seconds=lease_seconds, max_attempts=max_attempts)
+    queue.initialize()
+    return queue
+
+
+def _stored_files(queue: JobQueue, job_id: str) -> int:
+    with queue._connect() as connection:
+        return connection.execute(
+            "SELECT COUNT(*) FROM validation_job_files WHERE job_id = ?", (job_id,)
+        ).fetchone()[0]
+
+
+@pytest.mark.asyncio
+async def test_claim_leases_the_job_to_a_single_worker(tmp_path: Path) -> None:
+    queue = _queue(tmp_path)
+    job_id = await queue.enqueue(FILES)
+
+    claimed = await queue.claim("worker-a")
+
+    assert claimed is not None
+    assert (claimed.id, claimed.attempts, claimed.files) == (job_id, 1, FILES)
+    assert await queue.claim("worker-b") is None
+    assert (await queue.get(job_id)).status == JOB_PROCESSING
+
+
+@pytest.mark.asyncio
+async def test_complete_stores_the_result_and_drops_the_files(tmp_path: Path) -> None:
+    queue = _queue(tmp_path)
+    job_id = await queue.enqueue(FILES)
+    await queue.claim("worker-a")
+
+    assert await queue.complete(job_id, "worker-a", {"status": "APROVADO"})
+
+    job = await queue.get(job_id)
+    assert (job.status, job.result) == (JOB_DONE, {"status": "APROVADO"})
+    assert _stored_files(queue, job_id) == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_reclaimed_and_the_stale_worker_loses(tmp_path: Path) -> None:
+    queue = _queue(tmp_path, lease_seconds=0.05)
+    job_id = await queue.enqueue(FILES)
+    await queue.claim("worker-a")
+    await asyncio.sleep(0.1)
+
+    reclaimed = await queue.claim("worker-b")
+
+    assert reclaimed is not None
+    assert (reclaimed.id, reclaimed.attempts, reclaimed.files) == (job_id, 2, FILES)
+    assert not await queue.renew_lease(job_id, "worker-a")
+    assert not await queue.fail(job_id, "worker-a", {"error": "stale"})
+    assert (await queue.get(job_id)).status == JOB_PROCESSING
+    assert _stored_files(queue, job_id) == len(FILES)
+
+    assert await queue.complete(job_id, "worker-b", {"status": "APROVADO"})
+    assert (await queue.get(job_id)).status == JOB_DONE
+
+
+@pytest.mark.asyncio
+async def test_renew_lease_keeps_the_job_from_being_reclaimed(tmp_path: Path) -> None:
+    queue = _queue(tmp_path, lease_seconds=0.1)
+    job_id = await queue.enqueue(FILES)
+    await queue.claim("worker-a")
+
+    for _ in range(3):
+        await asyncio.sleep(0.05)
+        assert await queue.renew_lease(job_id, "worker-a")
+        assert await queue.claim("worker-b") is None
+
+
+@pytest.mark.asyncio
+async def test_release_puts_the_job_back_without_spending_an_attempt(tmp_path: Path) -> None:
+    queue = _queue(tmp_path)
+    job_id = await queue.enqueue(FILES)
+    await queue.claim("worker-a")
+
+    await queue.release(job_id, "worker-a")
+
+    job = await queue.get(job_id)
+    assert (job.status, job.attempts) == (JOB_PENDING, 0)
+    assert (await queue.claim("worker-b")).attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_job_fails_after_max_attempts(tmp_path: Path) -> None:
+    queue = _queue(tmp_path, lease_seconds=0.01, max_attempts=2)
+    job_id = await queue.enqueue(FILES)
+    for worker_id in ("worker-a", "worker-b"):
+        assert await queue.claim(worker_id) is not None
+        await asyncio.sleep(0.02)
+
+    assert await queue.claim("worker-c") is None
+
+    job = await queue.get(job_id)
+    assert job.status == JOB_FAILED
+    assert job.error["error"] == "Processamento interrompido"
+    assert _stored_files(queue, job_id) == 0
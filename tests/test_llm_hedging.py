@@ -0,0 +1,78 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from app.core.config import settings
+from app.services import llm_client
+
+
+@pytest.fixture(autouse=True)
+def hedge_stats(monkeypatch: pytest.MonkeyPatch) -> llm_client._HedgeStats:
+    stats = llm_client._HedgeStats()
+    monkeypatch.setattr(llm_client, "_hedge_stats", stats)
+    monkeypatch.setattr(settings, "llm_hedge_max_ratio", 1.0)
+    return stats
+
+
+class FakeRequests:
+    def __init__(self, *behaviours: Dict[str, float]) -> None:
+        self.behaviours = list(behaviours)
+        self.tasks: List["asyncio.Task[Any]"] = []
+
+    async def __call__(self, gate: Optional[llm_client._HedgeGate] = None) -> Dict[str, Any]:
+        number = len(self.tasks)
+        behaviour = self.behaviours[number]
+        self.tasks.append(asyncio.current_task())
+        await asyncio.sleep(behaviour.get("queued", 0.0))
+        if gate is not None:
+            gate.sending.set()
+            gate.retrying = bool(behaviour.get("retrying"))
+        await asyncio.sleep(behaviour["response"])
+        return {"request": number}
+
+
+@pytest.mark.asyncio
+async def test_hedge_wins_and_primary_is_cancelled(hedge_stats: llm_client._HedgeStats) -> None:
+    requests = FakeRequests({"response": 10.0}, {"response": 0.01})
+
+    result = await llm_client._hedged(requests, hedge_delay=0.02, prompt_name="cnpj_card")
+
+    await asyncio.sleep(0)
+    assert result == {"request": 1}
+    assert requests.tasks[0].cancelled()
+    assert (hedge_stats.sent, hedge_stats.won) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_primary_wins_and_hedge_is_cancelled(hedge_stats: llm_client._HedgeStats) -> None:
+    requests = FakeRequests({"response": 0.05}, {"response": 10.0})
+
+    result = await llm_client._hedged(requests, hedge_delay=0.01, prompt_name="cnpj_card")
+
+    await asyncio.sleep(0)
+    assert result == {"request": 0}
+    assert requests.tasks[1].cancelled()
+    assert (hedge_stats.sent, hedge_stats.won) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_hedge_delay_starts_when_the_primary_is_sent(hedge_stats: llm_client._HedgeStats) -> None:
+    requests = FakeRequests({"queued": 0.1, "response": 0.01})
+
+    result = await llm_client._hedged(requests, hedge_delay=0.05, prompt_name="cnpj_card")
+
+    assert result == {"request": 0}
+    assert len(requests.tasks) == 1
+    assert hedge_stats.sent == 0
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_after_a_retryable_failure(hedge_stats: llm_client._HedgeStats) -> None:
+    requests = FakeRequests({"retrying": True, "response": 0.05})
+
+    result = await llm_client._hedged(requests, hedge_delay=0.01, prompt_name="cnpj_card")
+
+    assert result == {"request": 0}
+    assert len(requests.tasks) == 1
+    assert hedge_stats.sent == 0
@@ -0,0 +1,40 @@
+import pytest
+
+from app.services import llm_client
+
+
+@pytest.fixture
+def pool_stats(monkeypatch: pytest.MonkeyPatch) -> llm_client._PoolWaitStats:
+    stats = llm_client._PoolWaitStats()
+    monkeypatch.setattr(llm_client, "_pool_wait_stats", stats)
+    return stats
+
+
+@pytest.mark.asyncio
+async def test_request_is_queued_until_it_is_sent(pool_stats: llm_client._PoolWaitStats) -> None:
+    with llm_client._pool_wait_tracer() as trace:
+        await trace("connection.connect_tcp.started", {})
+        assert (pool_stats.in_flight, pool_stats.queued) == (1, 0)
+        await trace("http11.send_request_headers.started", {})
+        assert llm_client.get_pool_stats()["queued_requests"] == 0
+        assert llm_client.get_pool_stats()["in_flight_requests"] == 1
+
+    stats = llm_client.get_pool_stats()
+    assert (stats["in_flight_requests"], stats["queued_requests"]) == (0, 0)
+    assert (stats["requests"], stats["new_connections"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_request_waiting_for_a_connection_counts_as_queued(pool_stats: llm_client._PoolWaitStats) -> None:
+    with llm_client._pool_wait_tracer() as first, llm_client._pool_wait_tracer():
+        await first("http2.send_request_headers.started", {})
+
+        assert (pool_stats.in_flight, pool_stats.queued) == (2, 1)
+
+
+def test_request_that_fails_before_sending_leaves_the_queue(pool_stats: llm_client._PoolWaitStats) -> None:
+    with pytest.raises(TimeoutError):
+        with llm_client._pool_wait_tracer():
+            raise TimeoutError("pool timeout")
+
+    assert (pool_stats.in_flight, pool_stats.queued, pool_stats.requests) == (0, 0, 0)
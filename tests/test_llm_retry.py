@@ -0,0 +1,89 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from app.core.config import settings
+from app.core.exceptions import LLMClientError
+from app.services import llm_client
+from app.services.admission import TokenBucket
+
+
+@pytest.fixture(autouse=True)
+def retry_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "llm_retry_base_delay_seconds", 0.5)
+    monkeypatch.setattr(settings, "llm_retry_max_delay_seconds", 4.0)
+
+
+@pytest.mark.parametrize(("attempt", "backoff"), [(0, 0.5), (1, 1.0), (2, 2.0), (3, 4.0), (6, 4.0)])
+def test_retry_delay_is_full_jitter_up_to_the_capped_backoff(attempt: int, backoff: float) -> None:
+    exc = LLMClientError("busy", status_code=503)
+
+    delays = [llm_client._retry_delay(exc, attempt) for _ in range(200)]
+
+    assert all(0.0 <= delay <= backoff for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_retry_delay_waits_at_least_retry_after() -> None:
+    exc = LLMClientError("rate limited", status_code=429, retry_after_seconds=3.0)
+
+    assert all(3.0 <= llm_client._retry_delay(exc, 0) <= 4.0 for _ in range(50))
+
+
+def test_retry_delay_gives_up_when_retry_after_exceeds_the_max_delay() -> None:
+    exc = LLMClientError("rate limited", status_code=429, retry_after_seconds=30.0)
+
+    assert llm_client._retry_delay(exc, 0) is None
+
+
+@pytest.mark.parametrize(("value", "expected"), [("5", 5.0), ("0.25", 0.25), ("-3", 0.0), (None, None), ("", None)])
+def test_parse_retry_after_seconds(value: str, expected: float) -> None:
+    assert llm_client._parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date() -> None:
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    delay = llm_client._parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+    assert 28.0 <= delay <= 30.0
+
+
+def test_parse_retry_after_rejects_garbage_and_past_dates() -> None:
+    past = format_datetime(datetime.now(timezone.utc) - timedelta(minutes=5), usegmt=True)
+
+    assert llm_client._parse_retry_after("soon") is None
+    assert llm_client._parse_retry_after(past) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_throttles_after_the_burst() -> None:
+    bucket = TokenBucket("test", rate=50.0, capacity=2)
+
+    waits = [await bucket.acquire() for _ in range(4)]
+
+    assert waits[0] < 0.01 and waits[1] < 0.01
+    assert all(wait >= 0.015 for wait in waits[2:])
+    assert (bucket.acquired, bucket.throttled) == (4, 2)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_serializes_concurrent_waiters() -> None:
+    bucket = TokenBucket("test", rate=100.0, capacity=1)
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+
+    await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+
+    assert loop.time() - started_at >= 0.035
+    assert bucket.throttled == 4
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_with_zero_rate_never_waits() -> None:
+    bucket = TokenBucket("test", rate=0.0, capacity=0)
+
+    assert await bucket.acquire() == 0.0
+    assert bucket.throttled == 0
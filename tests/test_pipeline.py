@@ -0,0 +1,198 @@
+import asyncio
+from typing import Any, List, Tuple
+
+import pytest
+
+from app.services import pipeline as pipeline_module
+from app.services.pipeline import Pipeline, PipelineNode
+
+
+async def _after(delay: float, value: Any) -> Any:
+    await asyncio.sleep(delay)
+    return value
+
+
+@pytest.mark.asyncio
+async def test_nodes_receive_their_dependency_results() -> None:
+    pipeline = Pipeline(
+        "test",
+        [
+            PipelineNode("total", lambda left, right: left + right, deps=("left", "right")),
+            PipelineNode("left", lambda: _after(0.01, 2)),
+            PipelineNode("right", lambda: 3),
+        ],
+    )
+
+    results = await pipeline.run()
+
+    assert results == {"left": 2, "right": 3, "total": 5}
+
+
+@pytest.mark.asyncio
+async def test_independent_nodes_run_concurrently() -> None:
+    loop = asyncio.get_running_loop()
+    pipeline = Pipeline("test", [PipelineNode(f"node_{index}", lambda: _after(0.05, None)) for index in range(4)])
+
+    started_at = loop.time()
+    await pipeline.run()
+
+    assert loop.time() - started_at < 0.15
+
+
+def test_cycles_and_unknown_dependencies_are_rejected() -> None:
+    with pytest.raises(ValueError, match="Cycle"):
+        Pipeline("test", [PipelineNode("a", lambda b: b, deps=("b",)), PipelineNode("b", lambda a: a, deps=("a",))])
+    with pytest.raises(ValueError, match="Unknown"):
+        Pipeline("test", [PipelineNode("a", lambda b: b, deps=("b",))])
+
+
+@pytest.mark.asyncio
+async def test_skipped_node_returns_its_value_without_running() -> None:
+    ran: List[str] = []
+    skipped: List[str] = []
+
+    async def slow() -> str:
+        ran.append("slow")
+        await asyncio.sleep(10)
+        return "slow"
+
+    async def decide() -> str:
+        pipeline.skip("slow", "skipped")
+        return "decided"
+
+    pipeline = Pipeline(
+        "test",
+        [
+            PipelineNode("gate", lambda: _after(0.01, None)),
+            PipelineNode("decide", decide),
+            PipelineNode("slow", slow, deps=("gate",)),
+            PipelineNode("consumer", lambda value: f"got {value}", deps=("slow",)),
+        ],
+        on_node_skipped=skipped.append,
+    )
+
+    results = await pipeline.run()
+
+    assert ran == []
+    assert results["slow"] == "skipped"
+    assert results["consumer"] == "got skipped"
+    assert pipeline.skipped == ["slow"]
+    assert skipped == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_skipping_a_running_node_cancels_it() -> None:
+    cancelled: List[str] = []
+    completed: List[Tuple[str, Any]] = []
+
+    async def slow() -> str:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+        return "slow"
+
+    async def decide() -> str:
+        await asyncio.sleep(0.01)
+        assert pipeline.skip("slow", "skipped")
+        assert not pipeline.skip("slow", "again")
+        return "decided"
+
+    pipeline = Pipeline(
+        "test",
+        [PipelineNode("slow", slow), PipelineNode("decide", decide)],
+        on_node_completed=lambda name, result: completed.append((name, result)),
+    )
+
+    results = await asyncio.wait_for(pipeline.run(), timeout=1)
+
+    assert results == {"slow": "skipped", "decide": "decided"}
+    assert cancelled == ["slow"]
+    assert completed == [("decide", "decided")]
+
+
+@pytest.mark.asyncio
+async def test_finished_node_cannot_be_skipped() -> None:
+    async def decide(_fast: str) -> None:
+        assert not pipeline.skip("fast", "late")
+
+    pipeline = Pipeline("test", [PipelineNode("fast", lambda: "fast"), PipelineNode("decide", decide, deps=("fast",))])
+
+    results = await pipeline.run()
+
+    assert results["fast"] == "fast"
+    assert pipeline.skipped == []
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_running_siblings_and_raises_the_original_error() -> None:
+    cancelled: List[str] = []
+
+    async def slow(name: str) -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(name)
+            raise
+
+    async def fail() -> None:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    pipeline = Pipeline(
+        "test",
+        [
+            PipelineNode("first", lambda: slow("first")),
+            PipelineNode("second", lambda: slow("second")),
+            PipelineNode("fail", fail),
+            PipelineNode("dependent", lambda _value: None, deps=("first",)),
+        ],
+    )
+
+    with pytest.raises(ValueError, match="boom"):
+        await asyncio.wait_for(pipeline.run(), timeout=1)
+
+    assert sorted(cancelled) == ["first", "second"]
+    assert set(pipeline._cancelled) == {"first", "second", "dependent"}
+    assert pipeline._cancelled["first"] > 0
+
+
+@pytest.mark.asyncio
+async def test_failure_updates_the_pipeline_stats(monkeypatch: pytest.MonkeyPatch) -> None:
+    stats = pipeline_module._PipelineStats()
+    monkeypatch.setattr(pipeline_module, "pipeline_stats", stats)
+
+    async def fail() -> None:
+        raise RuntimeError("boom")
+
+    pipeline = Pipeline("test", [PipelineNode("slow", lambda: _after(10, None)), PipelineNode("fail", fail)])
+
+    with pytest.raises(RuntimeError):
+        await pipeline.run()
+
+    assert (stats.runs, stats.failed_runs, stats.cancelled_nodes) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_run_cancels_every_node() -> None:
+    started = asyncio.Event()
+    cancelled: List[str] = []
+
+    async def slow() -> None:
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+
+    pipeline = Pipeline("test", [PipelineNode("slow", slow)])
+    run = asyncio.create_task(pipeline.run())
+    await started.wait()
+
+    run.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await run
+    assert cancelled == ["slow"]
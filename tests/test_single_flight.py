@@ -0,0 +1,124 @@
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from app.core import tracing
+from app.core.config import settings
+from app.core.tracing import Span, start_trace
+from app.services.single_flight import SingleFlight
+
+
+@pytest.fixture(autouse=True)
+def single_flight_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "single_flight_enabled", True)
+
+
+class SlowCall:
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.calls = 0
+        self.cancelled = 0
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return self.calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution() -> None:
+    flight = SingleFlight("test")
+    call = SlowCall()
+
+    results = await asyncio.gather(*(flight.run("key", call) for _ in range(3)))
+
+    assert results == [1, 1, 1]
+    assert call.calls == 1
+    assert (flight.executions, flight.coalesced, flight.abandoned) == (1, 2, 0)
+    assert flight.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_execution_survives_while_a_waiter_remains() -> None:
+    flight = SingleFlight("test")
+    call = SlowCall()
+    first = asyncio.create_task(flight.run("key", call))
+    second = asyncio.create_task(flight.run("key", call))
+    await asyncio.sleep(0.01)
+
+    first.cancel()
+
+    assert await second == 1
+    assert first.cancelled()
+    assert (call.calls, call.cancelled, flight.abandoned) == (1, 0, 0)
+
+
+@pytest.mark.asyncio
+async def test_execution_is_cancelled_when_every_waiter_gives_up() -> None:
+    flight = SingleFlight("test")
+    call = SlowCall()
+    waiters = [asyncio.create_task(flight.run("key", call)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert call.cancelled == 1
+    assert flight.abandoned == 1
+    assert flight.stats()["in_flight"] == 0
+    assert await flight.run("key", call) == 2
+    assert flight.executions == 2
+
+
+@pytest.mark.asyncio
+async def test_failures_reach_every_waiter() -> None:
+    flight = SingleFlight("test")
+
+    async def fail() -> Any:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(*(flight.run("key", fail) for _ in range(2)), return_exceptions=True)
+
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    assert flight.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesced_waiter_records_the_shared_trace(monkeypatch: pytest.MonkeyPatch) -> None:
+    finished: List[Span] = []
+    monkeypatch.setattr(settings, "tracing_enabled", True)
+    monkeypatch.setattr(tracing, "_finish", finished.append)
+    flight = SingleFlight("test")
+    call = SlowCall()
+
+    async def request(request_id: str) -> str:
+        with start_trace(request_id), tracing.span("http.request") as root:
+            await flight.run("key", call)
+            return root.trace_id
+
+    leader_trace, waiter_trace = await asyncio.gather(request("leader"), request("waiter"))
+
+    waits = [span for span in finished if span.name == "single_flight.wait"]
+    assert len(waits) == 1
+    assert waits[0].trace_id == waiter_trace
+    assert waits[0].attributes["coalesced_with"] == leader_trace != waiter_trace
+
+
+@pytest.mark.asyncio
+async def test_disabled_single_flight_runs_every_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "single_flight_enabled", False)
+    flight = SingleFlight("test")
+    call = SlowCall(delay=0.01)
+
+    await asyncio.gather(*(flight.run("key", call) for _ in range(3)))
+
+    assert call.calls == 3
+    assert flight.executions == 0
@@ -0,0 +1,169 @@
+import asyncio
+from typing import Any, List
+
+import pytest
+
+import app.services.validation_use_case as use_case
+from app.api.v1.schemas import Inconsistency
+from app.core.config import settings
+from app.core.exceptions import DocumentValidationError, LLMUnavailableError
+
+BUSINESS_PURPOSE_INCONSISTENCY = Inconsistency(
+    field="objeto_social",
+    message="Atividade do CNPJ não contemplada no objeto social.",
+    severity="CRITICA",
+)
+
+
+async def _extract_text(file: Any) -> str:
+    return file
+
+
+async def _extract_document(text: str) -> str:
+    return text
+
+
+def _validator(*_documents: Any) -> List[Inconsistency]:
+    return []
+
+
+async def _business_purpose(*_documents: Any) -> List[Inconsistency]:
+    await asyncio.sleep(0)
+    return [BUSINESS_PURPOSE_INCONSISTENCY]
+
+
+@pytest.fixture
+def only_business_purpose_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "cnpj_triage_enabled", False)
+    monkeypatch.setattr(use_case, "extract_text_from_pdf", _extract_text)
+    for document_name in use_case.DOCUMENT_EXTRACTORS:
+        monkeypatch.setitem(use_case.DOCUMENT_EXTRACTORS, document_name, _extract_document)
+    monkeypatch.setattr(
+        use_case,
+        "DETERMINISTIC_VALIDATORS",
+        tuple((name, _validator, documents) for name, _, documents in use_case.DETERMINISTIC_VALIDATORS),
+    )
+    monkeypatch.setattr(use_case, "validate_business_purpose_consistency", _business_purpose)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("policy", ["exhaustive", "fail-fast"])
+async def test_business_purpose_is_the_only_critical_check(only_business_purpose_fails: None, policy: str) -> None:
+    result = await use_case.validate_supplier_documents_use_case(
+        "articles", "cnpj_card", "certificate", policy=policy
+    )
+
+    assert result.status == "REPROVADO"
+    assert result.inconsistencies == [BUSINESS_PURPOSE_INCONSISTENCY]
+    assert result.skipped_checks == []
+
+
+@pytest.mark.asyncio
+async def test_cnpj_triage_mismatch_skips_extractions(
+    only_business_purpose_fails: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    extracted: List[str] = []
+    cnpj_inconsistency = Inconsistency(field="cnpj", message="CNPJ divergente.", severity="CRITICA")
+
+    async def extract_document(text: str) -> str:
+        extracted.append(text)
+        return text
+
+    monkeypatch.setattr(settings, "cnpj_triage_enabled", True)
+    monkeypatch.setattr(settings, "cnpj_triage_on_mismatch", "fail")
+    monkeypatch.setattr(use_case, "triage_cnpj_consistency", lambda *_texts: [cnpj_inconsistency])
+    for document_name in use_case.DOCUMENT_EXTRACTORS:
+        monkeypatch.setitem(use_case.DOCUMENT_EXTRACTORS, document_name, extract_document)
+
+    skipped: List[str] = []
+    result = await use_case.validate_supplier_documents_use_case(
+        "articles", "cnpj_card", "certificate", on_node_skipped=skipped.append
+    )
+
+    assert extracted == []
+    assert result.status == "REPROVADO"
+    assert result.inconsistencies == [cnpj_inconsistency]
+    assert "cnpj" not in result.skipped_checks
+    assert "business_purpose" in result.skipped_checks
+    assert "validate_cnpj" not in skipped
+
+
+async def _llm_unavailable(*_documents: Any) -> List[Inconsistency]:
+    raise LLMUnavailableError("indisponível", retry_after_seconds=30.0)
+
+
+@pytest.mark.asyncio
+async def test_llm_unavailable_degrades_to_a_partial_result(
+    only_business_purpose_fails: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "llm_degraded_mode_enabled", True)
+    monkeypatch.setattr(use_case, "validate_business_purpose_consistency", _llm_unavailable)
+
+    result = await use_case.validate_supplier_documents_use_case("articles", "cnpj_card", "certificate")
+
+    assert result.status == "PENDENTE"
+    assert result.partial
+    assert result.inconsistencies == []
+    assert result.skipped_checks == ["business_purpose"]
+
+
+@pytest.mark.asyncio
+async def test_partial_result_is_still_rejected_on_a_critical_inconsistency(
+    only_business_purpose_fails: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    address_inconsistency = Inconsistency(field="endereco", message="Endereço divergente.", severity="CRITICA")
+    monkeypatch.setattr(settings, "llm_degraded_mode_enabled", True)
+    monkeypatch.setattr(use_case, "validate_business_purpose_consistency", _llm_unavailable)
+    monkeypatch.setattr(
+        use_case,
+        "DETERMINISTIC_VALIDATORS",
+        (("address", lambda *_documents: [address_inconsistency], ("articles", "cnpj_card")),),
+    )
+
+    result = await use_case.validate_supplier_documents_use_case("articles", "cnpj_card", "certificate")
+
+    assert result.status == "REPROVADO"
+    assert result.partial
+    assert result.inconsistencies == [address_inconsistency]
+    assert "business_purpose" in result.skipped_checks
+
+
+@pytest.mark.asyncio
+async def test_llm_unavailable_raises_without_degraded_mode(
+    only_business_purpose_fails: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "llm_degraded_mode_enabled", False)
+    monkeypatch.setattr(use_case, "validate_business_purpose_consistency", _llm_unavailable)
+
+    with pytest.raises(LLMUnavailableError):
+        await use_case.validate_supplier_documents_use_case("articles", "cnpj_card", "certificate")
+
+
+@pytest.mark.asyncio
+async def test_failed_extraction_cancels_the_other_extractions(
+    only_business_purpose_fails: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cancelled: List[str] = []
+
+    async def slow_extraction(text: str) -> str:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(text)
+            raise
+        return text
+
+    async def failing_extraction(_text: str) -> str:
+        await asyncio.sleep(0.01)
+        raise DocumentValidationError("extração falhou")
+
+    monkeypatch.setitem(use_case.DOCUMENT_EXTRACTORS, "articles", slow_extraction)
+    monkeypatch.setitem(use_case.DOCUMENT_EXTRACTORS, "cnpj_card", slow_extraction)
+    monkeypatch.setitem(use_case.DOCUMENT_EXTRACTORS, "certificate", failing_extraction)
+
+    with pytest.raises(DocumentValidationError):
+        await asyncio.wait_for(
+            use_case.validate_supplier_documents_use_case("articles", "cnpj_card", "certificate"), timeout=1
+        )
+
+    assert sorted(cancelled) == ["articles", "cnpj_card"]